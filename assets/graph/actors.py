@@ -1,6 +1,8 @@
 from rpgrun.board.bsprite import GraphSprite
-from rpgrun.game.actor import Actor
+from rpgrun.game.actor import Actor, Archetype
 from rpgrun.game.pactor import PActor
+from rpgrun.game.gtemplate import AttrTemplate
+from rpgrun.game.gsave import register_archetype, register_type
 from assets.graph.gsprite import GameSprite
 import pygame
 
@@ -19,6 +21,15 @@ MAGE_ATTRS = '''[{"hp": {"base": 10, "delta": 2, "buffs": "None"}},
 
 BOSS_ATTRS = [("hp", 100, 10), ("mp", 10, 1), ("str", 10, 1), ("con", 10, 2)]
 
+PLAYER_TEMPLATE = AttrTemplate.from_json('PLAYER', PLAYER_ATTRS)
+ACTOR_TEMPLATE = AttrTemplate.from_json('ENEMY', ACTOR_ATTRS)
+MAGE_TEMPLATE = AttrTemplate.from_json('MAGE', MAGE_ATTRS)
+BOSS_TEMPLATE = AttrTemplate.from_list('BOSS', BOSS_ATTRS)
+
+ENEMY_ARCHETYPE = Archetype('ENEMY', ACTOR_TEMPLATE)
+MAGE_ARCHETYPE = Archetype('MAGE', MAGE_TEMPLATE)
+BOSS_ARCHETYPE = Archetype('BOSS', BOSS_TEMPLATE)
+
 
 class PlayerSprite(GameSprite):
 
@@ -35,7 +46,7 @@ class PlayerActor(PActor):
     def __init__(self, x, y, width, height, **kwargs):
         super(PlayerActor, self).__init__(x, y, 'PLAYER', **kwargs)
         self.sprite = GraphSprite(sprite=PlayerSprite(width, height))
-        self.attrs.setup_attrs_from_json(PLAYER_ATTRS)
+        PLAYER_TEMPLATE.stamp(self.attrs)
 
 
 class EnemySprite(GameSprite):
@@ -53,6 +64,18 @@ class EnemySprite(GameSprite):
 class EnemyActor(Actor):
 
     def __init__(self, x, y, width, height, name='ENEMY', **kwargs):
+        kwargs.setdefault('archetype', ENEMY_ARCHETYPE)
         super(EnemyActor, self).__init__(x, y, name, **kwargs)
         self.sprite = GraphSprite(sprite=EnemySprite(width, height))
-        self.attrs.setup_attrs_from_json(ACTOR_ATTRS)
+
+
+for _archetype in (ENEMY_ARCHETYPE, MAGE_ARCHETYPE, BOSS_ARCHETYPE):
+    register_archetype(_archetype)
+
+
+def register_types(width, height):
+    """Registers all actors for saved games, with sprites of the given
+    size, because graph sprites are not saved.
+    """
+    register_type(PlayerActor, lambda x, y, name: PlayerActor(x, y, width, height))
+    register_type(EnemyActor, lambda x, y, name: EnemyActor(x, y, width, height, name))
@@ -1,5 +1,6 @@
 from rpgrun.board.bsprite import GraphSprite
 from rpgrun.board.bobject import BObject
+from rpgrun.game.gsave import register_type
 import pygame
 
 
@@ -17,3 +18,10 @@ class Pillar(BObject):
     def __init__(self, x, y, width, height, **kwargs):
         super(Pillar, self).__init__(x, y, 'PILLAR', **kwargs)
         self.sprite = GraphSprite(sprite=PillarSprite(width, height))
+
+
+def register_types(width, height):
+    """Registers all objects for saved games, with sprites of the given
+    size, because graph sprites are not saved.
+    """
+    register_type(Pillar, lambda x, y, name: Pillar(x, y, width, height))
@@ -1,5 +1,6 @@
 from rpgrun.board.bsprite import GraphSprite
 from rpgrun.board.bsurface import BSurface
+from rpgrun.game.gsave import register_type
 from assets.graph.gsprite import GameSprite
 import pygame
 
@@ -18,6 +19,15 @@ class GreenSprite(GameSprite):
 
 class GreenSurface(BSurface):
 
+    __slots__ = ()
+
     def __init__(self, x, y, width, height, **kwargs):
         super(GreenSurface, self).__init__(x, y, 'GREEN', **kwargs)
         self.sprite = GraphSprite(sprite=GreenSprite(width, height))
+
+
+def register_types(width, height):
+    """Registers all surfaces for saved games, with sprites of the given
+    size, because graph sprites are not saved.
+    """
+    register_type(GreenSurface, lambda x, y, name: GreenSurface(x, y, width, height))
@@ -1,5 +1,6 @@
 from rpgrun.board.bpoint import Location
 from rpgrun.game.action import AType, TargetAction, MoveAction, AoETargetAction
+from rpgrun.game.gsave import register_type
 
 
 class WeaponAction(TargetAction):
@@ -21,6 +22,9 @@ class MeleAction(AoETargetAction):
 
 class RangeAction(AoETargetAction):
 
+    def requires_line_of_sight(self):
+        return True
+
     def execute(self, game, **kwargs):
         damage = self.originator.STR
         self.target[0].attrs['HP'].dec(damage)
@@ -35,3 +39,7 @@ class MoveAction(MoveAction):
         location = kwargs.get('location', Location.FRONT)
         position = kwargs.get('position', 1)
         game.move_player(location, position)
+
+
+for _klass in (WeaponAction, MeleAction, RangeAction, MoveAction):
+    register_type(_klass)
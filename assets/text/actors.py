@@ -1,6 +1,8 @@
 from rpgrun.board.bsprite import TextSprite
-from rpgrun.game.actor import Actor
+from rpgrun.game.actor import Actor, Archetype
 from rpgrun.game.pactor import PActor
+from rpgrun.game.gtemplate import AttrTemplate
+from rpgrun.game.gsave import register_archetype, register_type
 
 PLAYER_ATTRS = '''[{"hp": {"base": 10, "delta": 2, "buffs": "None"}},
                    {"str": {"base": 9, "delta": 1, "buffs": "None"}},
@@ -17,13 +19,22 @@ MAGE_ATTRS = '''[{"hp": {"base": 10, "delta": 2, "buffs": "None"}},
 
 BOSS_ATTRS = [("hp", 100, 10), ("mp", 10, 1), ("str", 10, 1), ("con", 10, 2)]
 
+PLAYER_TEMPLATE = AttrTemplate.from_json('PLAYER', PLAYER_ATTRS)
+ACTOR_TEMPLATE = AttrTemplate.from_json('ENEMY', ACTOR_ATTRS)
+MAGE_TEMPLATE = AttrTemplate.from_json('MAGE', MAGE_ATTRS)
+BOSS_TEMPLATE = AttrTemplate.from_list('BOSS', BOSS_ATTRS)
+
+ENEMY_ARCHETYPE = Archetype('ENEMY', ACTOR_TEMPLATE)
+MAGE_ARCHETYPE = Archetype('MAGE', MAGE_TEMPLATE)
+BOSS_ARCHETYPE = Archetype('BOSS', BOSS_TEMPLATE)
+
 
 class BossActor(Actor):
 
     def __init__(self, x, y, width, name='BOSS', **kwargs):
+        kwargs.setdefault('archetype', BOSS_ARCHETYPE)
         super(BossActor, self).__init__(x, y, name, **kwargs)
         self.sprite = TextSprite(sprite='*&*', width=width, color="\x1b[32m" + "\x1b[45m")
-        self.attrs.setup_attrs_from_list(BOSS_ATTRS)
 
 
 class PlayerActor(PActor):
@@ -31,20 +42,30 @@ class PlayerActor(PActor):
     def __init__(self, x, y, width, **kwargs):
         super(PlayerActor, self).__init__(x, y, 'PLAYER', **kwargs)
         self.sprite = TextSprite(sprite='-^-', width=width, color="\x1b[32m" + "\x1b[41m")
-        self.attrs.setup_attrs_from_json(PLAYER_ATTRS)
+        PLAYER_TEMPLATE.stamp(self.attrs)
 
 
 class EnemyActor(Actor):
 
     def __init__(self, x, y, width, name='ENEMY', **kwargs):
+        kwargs.setdefault('archetype', ENEMY_ARCHETYPE)
         super(EnemyActor, self).__init__(x, y, name, **kwargs)
         self.sprite = TextSprite(sprite='oOo', width=width, color="\x1b[32m" + "\x1b[40m")
-        self.attrs.setup_attrs_from_json(ACTOR_ATTRS)
 
 
 class MageActor(Actor):
 
     def __init__(self, x, y, width, name='MAGE', **kwargs):
+        kwargs.setdefault('archetype', MAGE_ARCHETYPE)
         super(MageActor, self).__init__(x, y, name, **kwargs)
         self.sprite = TextSprite(sprite='o$o', width=width, color="\x1b[32m" + "\x1b[40m")
-        self.attrs.setup_attrs_from_json(MAGE_ATTRS)
+
+
+# Saved games restore the text sprite, so restored actors are created
+# without any sprite width.
+for _archetype in (ENEMY_ARCHETYPE, MAGE_ARCHETYPE, BOSS_ARCHETYPE):
+    register_archetype(_archetype)
+register_type(BossActor, lambda x, y, name: BossActor(x, y, None, name))
+register_type(PlayerActor, lambda x, y, name: PlayerActor(x, y, None))
+register_type(EnemyActor, lambda x, y, name: EnemyActor(x, y, None, name))
+register_type(MageActor, lambda x, y, name: MageActor(x, y, None, name))
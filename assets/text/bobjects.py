@@ -1,5 +1,6 @@
 from rpgrun.board.bsprite import TextSprite
 from rpgrun.board.bobject import BObject
+from rpgrun.game.gsave import register_type
 
 
 class Pillar(BObject):
@@ -7,3 +8,6 @@ class Pillar(BObject):
     def __init__(self, x, y, width, **kwargs):
         super(Pillar, self).__init__(x, y, 'PILLAR', **kwargs)
         self.sprite = TextSprite(sprite='|||||||', width=width, color="\x1b[44m")
+
+
+register_type(Pillar, lambda x, y, name: Pillar(x, y, None))
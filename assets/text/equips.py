@@ -1,4 +1,5 @@
 from rpgrun.game.gequip import GEquip
+from rpgrun.game.gsave import register_type
 
 
 class Weapon(GEquip):
@@ -20,3 +21,7 @@ class Shield(GEquip):
     def __init__(self, **kwargs):
         kwargs.setdefault('name', 'shield')
         super(Shield, self).__init__(**kwargs)
+
+
+for _klass in (Weapon, Armor, Shield):
+    register_type(_klass)
@@ -1,9 +1,15 @@
 from rpgrun.board.bsprite import TextSprite
 from rpgrun.board.bsurface import BSurface
+from rpgrun.game.gsave import register_type
 
 
 class GreenSurface(BSurface):
 
+    __slots__ = ()
+
     def __init__(self, x, y, width, **kwargs):
         super(GreenSurface, self).__init__(x, y, '*', **kwargs)
         self.sprite = TextSprite(sprite=' ', color='\x1b[42m', width=width)
+
+
+register_type(GreenSurface, lambda x, y, name: GreenSurface(x, y, None))
@@ -0,0 +1,17 @@
+#!/bin/bash
+
+source ./setup.sh
+
+export PYTHONPATH=${CURRENT_DIRECTORY}:${JC2LI_PATH}
+
+if [ $# -eq 0 ]
+then
+    for file in ./bench/*_bench.py
+    do
+        echo "python ${file}"
+        python $file
+    done
+else
+    echo "python $1"
+    python $1
+fi
@@ -0,0 +1,38 @@
+"""Benchmark for attribute reads through BObject instances, comparing the
+previous __getattr__ lookup with attribute accessors.
+
+Usage:
+    python bench/accessor_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.common.itero import StrItero
+from rpgrun.game.actor import Actor
+from rpgrun.game.attr import Attr
+
+def legacy_get(obj, attr):
+    if 'attrs' in obj.__dict__ and StrItero.__contains__(obj.__dict__['attrs'], attr):
+        return StrItero.__getitem__(obj.attrs, attr).now
+    return AttributeError
+
+actor = Actor(0, 0, 'actor')
+for name in ('hp', 'str', 'con'):
+    actor.add_attr(Attr(name)).base = 10
+actor.STR
+'''
+
+
+def main(number=200000):
+    print('operations per second')
+    for label, stmt in (('legacy', "legacy_get(actor, 'STR')"),
+                        ('accessor', 'actor.STR'),
+                        ('plain', 'actor.name'),
+                        ('setattr', 'actor.walkable = False')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<9} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
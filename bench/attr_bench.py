@@ -0,0 +1,28 @@
+"""Benchmark for attribute now value with many buffs.
+
+Usage:
+    python bench/attr_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.game.attr import Attr, Stacking
+attr = Attr('str', Stacking.{0})
+attr.base = 10
+for index in range(40):
+    attr.add_buff('buff{{0}}'.format(index), 1)
+'''
+
+
+def main(number=100000):
+    print('operations per second')
+    for name in ('SUM', 'MAX', 'MUL'):
+        for label, stmt in (('now', 'attr.now'),
+                            ('buff', "attr.add_buff('ring', 2); attr.del_buff('ring')")):
+            elapsed = min(timeit.repeat(stmt, SETUP.format(name), repeat=3, number=number))
+            print('    {0:<4} {1:<5} {2:12.0f} ops/sec'.format(name, label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
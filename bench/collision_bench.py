@@ -0,0 +1,38 @@
+"""Benchmark for movement validation with collisions.
+
+It compares collisions given as a list, as a prebuilt set and as a
+CollisionMap on a board full of pillars.
+
+Usage:
+    python bench/collision_bench.py [number]
+"""
+import random
+import sys
+import timeit
+from rpgrun.board.point import Point
+from rpgrun.board.collision import CollisionMap
+
+WIDTH = 64
+HEIGHT = 64
+PILLARS = 400
+
+
+def main(number=200):
+    rand = random.Random(0)
+    pillars = [Point(rand.randrange(WIDTH), rand.randrange(HEIGHT)) for _ in range(PILLARS)]
+    collisions = {'list': pillars,
+                  'set': {(p.x, p.y) for p in pillars},
+                  'map': CollisionMap.from_points(pillars, WIDTH, HEIGHT)}
+    origins = [Point(rand.randrange(WIDTH), rand.randrange(HEIGHT)) for _ in range(100)]
+    print('{0} pillars, {1} moves per run'.format(PILLARS, 2 * len(origins)))
+    for name, collision in collisions.items():
+        def run():
+            for p in origins:
+                p.x_is_valid_move(collision, 16)
+                p.y_is_valid_move(collision, 16)
+        elapsed = min(timeit.repeat(run, repeat=3, number=number))
+        print('    {0:<6} {1:12.0f} moves/sec'.format(name, number * 2 * len(origins) / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
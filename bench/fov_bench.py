@@ -0,0 +1,79 @@
+"""Benchmark for line of sight checks between actors.
+
+Usage:
+    python bench/fov_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+import random
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import BPoint
+from rpgrun.board.bfov import FieldOfView
+SIZE, UNITS, RADIUS = 64, 200, 8
+random.seed(0)
+board = Board(SIZE, SIZE)
+for index, row in enumerate(board):
+    row.cellrow = SIZE - 1 - index
+arena = [(x, y) for x in range(20, 44) for y in range(20, 44)]
+positions = random.sample(arena, UNITS)
+for x, y in random.sample([x for x in arena if x not in positions], len(arena) // 16):
+    board.add_cell_to_layer(BCell(x, y, 'pillar'), LType.OBJECT)
+units = [BPoint(x, y) for x, y in positions]
+pairs = [(a, b) for a in units for b in units if a is not b and abs(a.x - b.x) + abs(a.y - b.y) <= RADIUS]
+area = lambda a: [BPoint(a.x + dx, a.y + dy) for dx in range(-RADIUS, RADIUS + 1)
+                  for dy in range(-RADIUS, RADIUS + 1) if 0 < abs(dx) + abs(dy) <= RADIUS]
+targets = dict((id(a), [b for b in units if a is not b and abs(a.x - b.x) + abs(a.y - b.y) <= RADIUS]) for a in units)
+near = dict((id(a), [b for b in targets[id(a)] if abs(a.x - b.x) + abs(a.y - b.y) <= 3]) for a in units)
+fov = FieldOfView(board)
+grid = fov.grid
+grid.refresh()
+
+def bresenham(a, b):
+    x0, y0, x1, y1 = a.x, a.y, b.x, b.y
+    dx, dy = abs(x1 - x0), -abs(y1 - y0)
+    sx, sy = (1 if x0 < x1 else -1), (1 if y0 < y1 else -1)
+    error = dx + dy
+    while True:
+        e2 = 2 * error
+        if e2 >= dy:
+            error += dy
+            x0 += sx
+        if e2 <= dx:
+            error += dx
+            y0 += sy
+        if (x0, y0) == (x1, y1):
+            return True
+        if not grid.is_walkable(x0, y0):
+            return False
+'''
+
+STATEMENTS = (('pairs_bresenham', '[bresenham(a, b) for a, b in pairs]'),
+              ('pairs_fov', 'fov._fields.clear()\n'
+                            'sight = dict(zip(map(id, units), fov.visible_many(units, RADIUS)))\n'
+                            '[b in sight[id(a)] for a, b in pairs]'),
+              ('pairs_fov_cached', 'sight = dict(zip(map(id, units), fov.visible_many(units, RADIUS)))\n'
+                                   '[b in sight[id(a)] for a, b in pairs]'),
+              ('targets_bresenham', '[[b for b in targets[id(a)] if bresenham(a, b)] for a in units]'),
+              ('targets_fov', 'fov._fields.clear()\n[fov.visible_cells(a, targets[id(a)], RADIUS) for a in units]'),
+              ('near_bresenham', '[[b for b in near[id(a)] if bresenham(a, b)] for a in units]'),
+              ('near_fov', 'fov._fields.clear()\n[fov.visible_cells(a, near[id(a)], RADIUS) for a in units]'),
+              ('fog_bresenham', '[[bresenham(a, b) for b in area(a)] for a in units[:20]]'),
+              ('fog_fov', 'fov._fields.clear()\n[[b in fov.visible(a, RADIUS) for b in area(a)] for a in units[:20]]'))
+
+
+def main(number=5):
+    print('turns per second')
+    print('  pairs: line of sight between 200 actors in a 24x24 arena')
+    print('  targets: targets in range for every actor, near: targets three steps away or closer')
+    print('  fog: all positions visible for 20 actors')
+    for label, stmt in STATEMENTS:
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<17} {1:12.1f} turns/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
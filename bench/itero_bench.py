@@ -0,0 +1,34 @@
+"""Benchmark for container iteration.
+
+Usage:
+    python bench/itero_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.game.attr import Attributes
+board = Board(16, 16)
+for index, row in enumerate(board):
+    for x in range(16):
+        row.add_cell_to_layer(BCell(x, 15 - index, 'floor'), LType.SURFACE)
+attrs = Attributes()
+attrs.setup_attrs_by_name(['a{0}'.format(x) for x in range(20)])
+'''
+
+
+def main(number=2000):
+    print('operations per second')
+    for label, stmt in (('board_cells', 'board.get_cells_from_layer()'),
+                        ('board_rows', '[x for x in board]'),
+                        ('attrs_level_up', 'attrs.level_up()'),
+                        ('attrs_iter', '[x for x in attrs]')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
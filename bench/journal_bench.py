@@ -0,0 +1,45 @@
+"""Benchmark for the board journal.
+
+Usage:
+    python bench/journal_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import Location
+from rpgrun.game.actor import Actor
+from rpgrun.game.gjournal import Journal
+board = Board(16, 16)
+for index, row in enumerate(board):
+    for x in range(16):
+        row.add_cell_to_layer(BCell(x, 15 - index, 'floor'), LType.SURFACE)
+journal = Journal()
+board.journal = journal
+actor = Actor(0, 0, 'orc')
+actor.attrs.setup_attrs_from_list([('hp', 10, 2)])
+journal.watch(actor)
+board.add_cell_to_layer(actor, LType.OBJECT)
+step = [Location.RIGHT, Location.LEFT]
+for turn in range(500):
+    journal.mark_turn()
+    board.move_cell(actor, step[turn % 2], 1)
+    actor.attrs['hp'].dec(1)
+'''
+
+
+def main(number=200):
+    print('operations per second')
+    for label, stmt in (('record_move', 'board.move_cell(actor, step[0], 1); step.reverse()'),
+                        ('record_attr', "actor.attrs['hp'].inc(1)"),
+                        ('replay_turn', 'journal.replay(495)'),
+                        ('replay_full', 'journal.replay()')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,46 @@
+"""Benchmark for board pathfinding.
+
+Usage:
+    python bench/path_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+import random
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import BPoint
+from rpgrun.board.bpath import PathFinder
+WIDTH, HEIGHT, UNITS = 64, 64, 200
+random.seed(0)
+board = Board(HEIGHT, WIDTH)
+for index, row in enumerate(board):
+    row.cellrow = HEIGHT - 1 - index
+for _ in range(WIDTH * HEIGHT // 8):
+    wall = BCell(random.randrange(WIDTH), random.randrange(HEIGHT), 'wall')
+    wall.walkable = False
+    board.add_cell_to_layer(wall, LType.SURFACE)
+finder = PathFinder(board)
+goal = BPoint(WIDTH // 2, HEIGHT - 1)
+board.remove_cell(board.get_cells_at(goal)[0]) if board.get_cells_at(goal) else None
+units = [BPoint(random.randrange(WIDTH), random.randrange(HEIGHT // 4)) for _ in range(UNITS)]
+finder.grid.refresh()
+'''
+
+STATEMENTS = (('astar', '[finder.path(x, goal) for x in units]'),
+              ('jps', '[finder.path(x, goal, jump=True) for x in units]'),
+              ('flow_field', 'field = finder.flow_field([goal])\n[field.next_step(x) for x in units]'),
+              ('flow_field_new', 'finder._fields.clear()\nfield = finder.flow_field([goal])\n[field.next_step(x) for x in units]'))
+
+
+def main(number=3):
+    print('turns per second, {0} units moving to the same goal'.format(200))
+    for label, stmt in STATEMENTS:
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.2f} turns/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
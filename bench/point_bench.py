@@ -0,0 +1,79 @@
+"""Benchmark for the board point hierarchy.
+
+It reports memory used per instance and operations per second for the most
+common point operations.
+
+Usage:
+    python bench/point_bench.py [count]
+"""
+import sys
+import timeit
+import tracemalloc
+from rpgrun.board.point import Point, FrozenPoint
+from rpgrun.board.bpoint import BPoint
+from rpgrun.board.bcell import BCell
+
+
+class DictPoint(object):
+    """Reference point class without slots.
+    """
+
+    def __init__(self, x, y):
+        self._x = x
+        self._y = y
+
+
+def memory_per_instance(klass, count, *args):
+    """Returns the average number of bytes allocated per instance.
+
+    Args:
+        klass (class) : class to instantiate.
+        count (int) : number of instances to create.
+
+    Returns:
+        float : average bytes per instance.
+    """
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    instances = [klass(x, x, *args) for x in range(count)]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (end - start) / len(instances)
+
+
+def ops_per_sec(stmt, setup, number):
+    """Returns the number of operations per second for the given statement.
+
+    Args:
+        stmt (str) : statement to time.
+        setup (str) : setup statement.
+        number (int) : number of executions.
+
+    Returns:
+        float : operations per second.
+    """
+    return number / min(timeit.repeat(stmt, setup, repeat=3, number=number))
+
+
+def main(count=100000):
+    print('memory per instance ({0} instances)'.format(count))
+    for klass, args in ((DictPoint, ()),
+                        (Point, ()),
+                        (FrozenPoint, ()),
+                        (BPoint, ()),
+                        (BCell, ('cell', ))):
+        print('    {0:<12} {1:8.1f} bytes'.format(klass.__name__,
+                                                 memory_per_instance(klass, count, *args)))
+    setup = 'from rpgrun.board.point import Point; p = Point(1, 2); q = Point(4, 6)'
+    print('operations per second')
+    for name, stmt in (('translate', 'p.xy_translate(1, 1)'),
+                       ('xy_move', 'p.xy_move(1, -1)'),
+                       ('distance', 'p.distance(q)'),
+                       ('__eq__', 'p == q'),
+                       ('__add__', 'p + q'),
+                       ('__iadd__', 'p += q; p -= q')):
+        print('    {0:<12} {1:12.0f} ops/sec'.format(name, ops_per_sec(stmt, setup, count)))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,48 @@
+"""Benchmark for board row pools.
+
+Usage:
+    python bench/pool_bench.py [number]
+"""
+import gc
+import sys
+import timeit
+
+SETUP = '''
+import gc
+gc.enable()
+from rpgrun.board.board import Board
+from rpgrun.board.brow import BRow
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bprovider import RowPool
+WIDTH = 64
+board = Board(16, WIDTH)
+for index, row in enumerate(board):
+    for x in range(WIDTH):
+        row.add_cell_to_layer(BCell(x, 15 - index, 'floor'), LType.SURFACE)
+board.pool = RowPool(keep=[LType.SURFACE]) if POOL else None
+cellrow = [16]
+
+def new_row():
+    row = board.pool.get(cellrow[0]) if board.pool is not None else None
+    if row is None:
+        row = BRow(WIDTH)
+        for x in range(WIDTH):
+            row.add_cell_to_layer(BCell(x, cellrow[0], 'floor'), LType.SURFACE)
+    cellrow[0] += 1
+    return row
+'''
+
+
+def main(number=20000):
+    print('operations per second')
+    for label, pool in (('scroll_new', False), ('scroll_pool', True)):
+        collections = gc.get_stats()[2]['collections']
+        elapsed = min(timeit.repeat('board.scroll(new_row())', 'POOL = {0}\n{1}'.format(pool, SETUP),
+                                    repeat=3, number=number))
+        collections = gc.get_stats()[2]['collections'] - collections
+        print('    {0:<15} {1:12.0f} ops/sec {2:4} gen-2 collections'.format(label, number / elapsed, collections))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
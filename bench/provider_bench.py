@@ -0,0 +1,61 @@
+"""Benchmark for board row providers.
+
+Game loop idles between scrolls, like when it waits for the player, so rows
+can be built ahead while it idles.
+
+Usage:
+    python bench/provider_bench.py [number]
+"""
+import sys
+import time
+from rpgrun.board.board import Board
+from rpgrun.board.brow import BRow
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bprovider import RowProvider
+
+WIDTH = 64
+
+
+def new_rows(provider, cellrow):
+    while True:
+        row = BRow(WIDTH)
+        for x in range(WIDTH):
+            row.add_cell_to_layer(BCell(x, cellrow, 'floor'), LType.SURFACE)
+        cellrow += 1
+        yield row
+
+
+def new_board():
+    board = Board(16, WIDTH)
+    for index, row in enumerate(board):
+        row.cellrow = 15 - index
+    return board
+
+
+def run(board, scroll, number):
+    latency = []
+    for _ in range(number):
+        time.sleep(0.001)
+        start = time.perf_counter()
+        scroll(board)
+        latency.append(time.perf_counter() - start)
+    return sum(latency) / number, max(latency)
+
+
+def main(number=500):
+    print('scroll latency')
+    board = new_board()
+    eager = new_rows(None, 16)
+    results = [('eager', run(board, lambda b: b.scroll(next(eager)), number))]
+    for label, background in (('provider', False), ('prefetch', True)):
+        board = new_board()
+        board.provider = RowProvider.from_generator(new_rows, 16, prefetch=4, background=background)
+        results.append((label, run(board, lambda b: b.scroll(), number)))
+        board.provider.close()
+    for label, (mean, worst) in results:
+        print('    {0:<15} mean {1:8.1f} us   max {2:8.1f} us'.format(label, mean * 1e6, worst * 1e6))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,55 @@
+"""Benchmark for move choices of all actors.
+
+Usage:
+    python bench/reach_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+import random
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bshapes import Rhomboid
+from rpgrun.game.action import AoEMoveAction, AType
+from rpgrun.game.actor import Actor
+from rpgrun.game.game import Game
+SIZE, UNITS = 64, 200
+random.seed(0)
+game = Game(SIZE, SIZE, headless=True)
+for index, row in enumerate(game.board):
+    row.cellrow = SIZE - 1 - index
+actions = []
+for position in random.sample([(x, y) for x in range(SIZE) for y in range(SIZE)], UNITS):
+    actor = Actor(position[0], position[1], 'orc')
+    game.board.add_cell_to_layer(actor, LType.OBJECT)
+    action = AoEMoveAction('move', AType.MOVEMENT, width=6, height=6, shape=Rhomboid)
+    action.originator = actor
+    actions.append(action)
+board = game.board
+
+def per_actor():
+    result = {}
+    for action in actions:
+        origin = action.originator
+        result[action] = [x for x in action.move_choices()
+                          if 0 <= x.x < board.width and board.get_row_from_cell_row(x.y) is not None
+                          and (x.x, x.y) != (origin.x, origin.y)
+                          and not [c for c in board.get_cells_at(x) if c.collision]]
+    return result
+'''
+
+STATEMENTS = (('per_actor', 'per_actor()'),
+              ('batched', 'game.reach._sets.clear()\ngame.move_choices(actions)'),
+              ('batched_cached', 'game.move_choices(actions)'))
+
+
+def main(number=5):
+    print('turns per second, move choices for 200 actors')
+    for label, stmt in STATEMENTS:
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.1f} turns/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,57 @@
+"""Benchmark for text rendering of a wide board.
+
+It compares rendering the whole board after every change with the cached
+rows render and with the ANSI diff render.
+
+Usage:
+    python bench/render_bench.py [number]
+"""
+import sys
+import timeit
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bsprite import TextSprite
+
+WIDTH = 120
+HEIGHT = 40
+
+
+def build_board():
+    board = Board(HEIGHT, WIDTH)
+    for index, row in enumerate(board):
+        for x in range(WIDTH):
+            row.add_cell_to_layer(BCell(x, HEIGHT - index - 1, 'surface', sprite=TextSprite(sprite='.')),
+                                  LType.SURFACE)
+    return board
+
+
+def main(number=200):
+    board = build_board()
+    cell = board[HEIGHT // 2][LType.SURFACE.value][WIDTH // 2]
+
+    def change():
+        cell.sprite.selected = not cell.sprite.selected
+
+    def full():
+        change()
+        for row in board:
+            row.set_dirty()
+        board.render(width=1)
+
+    def cached():
+        change()
+        board.render(width=1)
+
+    def diff():
+        change()
+        board.render_diff(width=1)
+
+    print('board {0}x{1}, redraws per second'.format(WIDTH, HEIGHT))
+    for name, func in (('full', full), ('cached', cached), ('diff', diff)):
+        elapsed = min(timeit.repeat(func, repeat=3, number=number))
+        print('    {0:<8} {1:10.0f} redraws/sec'.format(name, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,39 @@
+"""Benchmark for saved games.
+
+Usage:
+    python bench/save_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.board.blayer import LType
+from rpgrun.board.bsurface import BSurface
+from rpgrun.game.actor import Actor
+from rpgrun.game.game import Game
+from rpgrun.game.gsave import Compression, SavedGame, dumps, loads
+game = Game(16, 16, headless=True)
+for index, row in enumerate(game.board):
+    for x in range(16):
+        row.add_cell_to_layer(BSurface(x, 15 - index, 'floor'), LType.SURFACE)
+for x in range(16):
+    actor = Actor(x, x, 'orc')
+    actor.attrs.setup_attrs_from_list([('hp', 10, 2), ('str', 3, 1, {'sword': 2})])
+    game.board.add_cell_to_layer(actor, LType.OBJECT)
+    game.add_actor(actor)
+data = dumps(game)
+'''
+
+
+def main(number=200):
+    print('operations per second')
+    for label, stmt in (('dumps', 'dumps(game)'),
+                        ('dumps_zlib', 'dumps(game, Compression.ZLIB)'),
+                        ('grid', 'SavedGame(data).grid.tolist()'),
+                        ('loads', 'loads(data, headless=True)')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,27 @@
+"""Benchmark for shape membership and footprint queries.
+
+Usage:
+    python bench/shapes_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.board.bpoint import BPoint
+from rpgrun.board.bshapes import {0}
+shape = {0}(BPoint(20, 20), 8, 8)
+points = [BPoint(x, y) for x in range(10, 30) for y in range(10, 30)]
+'''
+
+
+def main(number=200):
+    print('operations per second')
+    for name in ('Quad', 'Rhomboid', 'Star'):
+        for label, stmt in (('is_inside', '[shape.is_inside(p) for p in points]'),
+                            ('points', 'shape.get_all_points_inside()')):
+            elapsed = min(timeit.repeat(stmt, SETUP.format(name), repeat=3, number=number))
+            print('    {0:<9} {1:<10} {2:12.0f} ops/sec'.format(name, label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,34 @@
+"""Benchmark for board snapshots.
+
+Usage:
+    python bench/snapshot_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.board.board import Board
+from rpgrun.board.bcell import BCell
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import Location
+board = Board(16, 16)
+for index, row in enumerate(board):
+    for x in range(16):
+        row.add_cell_to_layer(BCell(x, 15 - index, 'floor'), LType.SURFACE)
+player = BCell(0, 0, 'player')
+board.add_cell_to_layer(player, LType.OBJECT)
+step = [Location.RIGHT, Location.LEFT]
+'''
+
+
+def main(number=2000):
+    print('operations per second')
+    for label, stmt in (('snapshot_cached', 'board.snapshot()'),
+                        ('snapshot_move', 'board.move_cell(player, step[0], 1); step.reverse(); board.snapshot()'),
+                        ('snapshot_cells', 'board.snapshot().cells()')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,40 @@
+"""Benchmark for target lookups in the OBJECT layer.
+
+Usage:
+    python bench/spatial_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+import random
+from rpgrun.board.blayer import LType
+from rpgrun.board.bshapes import Quad
+from rpgrun.game.action import AoETargetAction, AType
+from rpgrun.game.actor import Actor
+from rpgrun.game.game import Game
+SIZE = 128
+random.seed(0)
+game = Game(SIZE, SIZE, headless=True)
+for index, row in enumerate(game.board):
+    row.cellrow = SIZE - 1 - index
+for index in range(2000):
+    actor = Actor(random.randrange(SIZE), random.randrange(SIZE), 'orc')
+    game.board.add_cell_to_layer(actor, LType.OBJECT)
+action = AoETargetAction('area', AType.MAGIC, width=4, height=4, shape=Quad)
+action.originator = Actor(SIZE // 2, SIZE // 2, 'me')
+'''
+
+STATEMENTS = (('flatten_board', 'action.filter_target(game.board.get_cells_from_layer([LType.OBJECT, ]))'),
+              ('spatial_hash', 'game.target_choices(action)'))
+
+
+def main(number=200):
+    print('operations per second')
+    for label, stmt in STATEMENTS:
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<15} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
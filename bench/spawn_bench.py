@@ -0,0 +1,26 @@
+"""Benchmark for actor spawning, comparing actors with their own attributes
+and actors sharing an archetype.
+
+Usage:
+    python bench/spawn_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.game.actor import Actor, Archetype
+from assets.text.actors import ACTOR_TEMPLATE
+archetype = Archetype('ENEMY', ACTOR_TEMPLATE)
+'''
+
+
+def main(number=20000):
+    print('operations per second')
+    for label, stmt in (('template', "ACTOR_TEMPLATE.stamp(Actor(0, 0, 'ENEMY').attrs)"),
+                        ('archetype', 'archetype.spawn(0, 0)')):
+        elapsed = min(timeit.repeat(stmt, SETUP, repeat=3, number=number))
+        print('    {0:<10} {1:12.0f} ops/sec'.format(label, number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -0,0 +1,36 @@
+"""Benchmark for bulk attribute updates on many actors, comparing per actor
+updates with a StatsTable.
+
+Usage:
+    python bench/stats_bench.py [number]
+"""
+import sys
+import timeit
+
+SETUP = '''
+from rpgrun.game.actor import Actor
+from rpgrun.game.gstats import StatsTable
+actors = []
+for index in range(2000):
+    actor = Actor(index, 0, 'orc')
+    actor.attrs.setup_attrs_from_list([('hp', 10, 2), ('str', 5, 1), ('con', 3, 1)])
+    actors.append(actor)
+table = StatsTable()
+if {0}:
+    for actor in actors:
+        table.add(actor)
+'''
+
+
+def main(number=20):
+    print('operations per second (2000 actors)')
+    for label, stmt, table in (('level_up', 'for x in actors: x.attrs.level_up()', False),
+                               ('level_up', 'table.level_up()', True),
+                               ('poison', "for x in actors: x.attrs['hp'].dec(1)", False),
+                               ('poison', "table.dec('hp', 1)", True)):
+        elapsed = min(timeit.repeat(stmt, SETUP.format(table), repeat=3, number=number))
+        print('    {0:<9} {1:<6} {2:12.0f} ops/sec'.format(label, 'table' if table else 'actor', number / elapsed))
+
+
+if __name__ == '__main__':
+    main(*[int(x) for x in sys.argv[1:]])
@@ -4,7 +4,11 @@ from rpgrun.board.bpoint import Location
 from rpgrun.board.bshapes import Quad, Rhomboid
 from rpgrun.board.blayer import LType
 from rpgrun.board.brow import BRow
+from rpgrun.board.bprovider import RowProvider, RowPool
 from rpgrun.board.brender import BRender
+import assets.graph.actors
+import assets.graph.bobjects
+import assets.graph.surfaces
 from assets.graph.surfaces import GreenSurface
 from assets.graph.bobjects import Pillar
 from assets.graph.actors import PlayerActor, EnemyActor
@@ -13,6 +17,7 @@ from assets.graph.equips import Weapon, Armor, Shield
 from rpgrun.game.action import AType
 from rpgrun.game.actor import Actor
 from scenes.base_scene import BaseScene
+from scenes.row_cache import RowSurfaceCache
 from panes.menu_pane import MenuPane
 from panes.console_pane import ConsolePane
 # from panes.stat_pane import StatPane
@@ -98,6 +103,8 @@ class GameScene(BaseScene):
         self.board_width, self.board_height = 8, 8
         # sprite size (in pixels) for every cell in the board.
         self.width, self.height = 64, 64
+        for module in (assets.graph.surfaces, assets.graph.bobjects, assets.graph.actors):
+            module.register_types(self.width, self.height)
         self.game = Game(self.board_width,
                          self.board_height,
                          capture=self._out_buffer)
@@ -109,18 +116,36 @@ class GameScene(BaseScene):
         self._create_player()
         self._create_enemies()
 
+        self.game.board.pool = RowPool(keep=[LType.SURFACE])
+        self.game.board.provider = RowProvider.from_generator(self._new_rows,
+                                                              self.game.board.top_cell_row + 1,
+                                                              prefetch=4)
         self.game.run_init()
         self.left_disable = False
+        self.row_cache = RowSurfaceCache(self.width, self.height, background=(0, 0, 255))
 
-    def _new_row(self):
-        """Scroll Board.
+    def _new_rows(self, provider, newHeight):
+        """Yields new rows for the board.
+        """
+        board = self.game.board
+        width = board.width
+        while True:
+            # Rows are built in the provider worker thread, and the board
+            # adds rows to the pool while it scrolls.
+            with board.lock:
+                row = board.pool.get(newHeight)
+            if row is None:
+                row = BRow(width)
+                for iwidth in range(width):
+                    row.add_cell_to_layer(GreenSurface(iwidth, newHeight, self.width, self.height), LType.SURFACE)
+            newHeight += 1
+            yield row
+
+    def terminate(self):
+        """Stops the board row provider when the scene ends.
         """
-        width = self.game.board.width
-        row = BRow(width)
-        newHeight = self.game.board.top_cell_row + 1
-        for iwidth in range(width):
-            row.add_cell_to_layer(GreenSurface(iwidth, newHeight, self.width, self.height), LType.SURFACE)
-        return row
+        self.game.board.provider.close()
+        super(GameScene, self).terminate()
 
     def _new_resource(self, instance=None, post_update_cb=None, on_click=False):
         """
@@ -200,16 +225,20 @@ class GameScene(BaseScene):
             for point in self.game.move_choice:
                 for cell in self.game.board.get_cells_at(point):
                     cell_rect = cell.sprite.sprite.rect
-                    if event.button == 1 and cell_rect.collidepoint(mouse_pos):
+                    if not clicked and event.button == 1 and cell_rect.collidepoint(mouse_pos):
                         self._get_resource('command').add_text('Click for move  at {}'.format(cell))
                         clicked = True
-                        # FIXME: This is just a fixed location movement
-                        self.game.run_select_movement(Location.FRONT, 1)
+                        # Player moves along the first leg of the shortest
+                        # path to the clicked position.
+                        moves = self.game.paths.moves(self.game.player, point)
+                        location, position = moves[0] if moves else (Location.FRONT, 0)
+                        self.game.run_select_movement(location, position)
             if clicked:
                 for point in self.game.move_choice:
                     for cell in self.game.board.get_cells_at(point):
                         cell.selected = False
-                self.game.run_scroll(self._new_row())
+                self.game.run_scroll()
+                self.row_cache.retain(self.game.board)
                 return True
         return False
 
@@ -285,14 +314,13 @@ class GameScene(BaseScene):
         """
         screen.fill((0, 0, 255))
         x, y = 32, 32
-        render_board = self.game.board.render(render=BRender.GRAPH)
-        for row in render_board:
-            for key, sprite in row.items():
-                sprite.rect.x = x
-                sprite.rect.y = y
-                screen.blit(sprite.image, (x, y))
-                x += self.width + 2
-            x = 32
+        for row in self.game.board:
+            screen.blit(self.row_cache.get(row, x, y), (x, y))
+            for cell in row.get_cells_from_layer(BRow.DYNAMIC_LAYERS):
+                sprite = cell.render(BRender.GRAPH)
+                if sprite is not None:
+                    sprite.rect.x, sprite.rect.y = self.row_cache.cell_pos(cell, x, y)
+                    screen.blit(sprite.image, sprite.rect)
             y += self.height + 2
         for resource_instance, _, _ in self._traverse_resource():
             resource_instance.render(screen)
@@ -0,0 +1,114 @@
+import pygame
+from rpgrun.board.brow import BRow
+from rpgrun.board.brender import BRender
+
+
+class RowSurfaceCache(object):
+    """RowSurfaceCache class keeps a composited surface with all static
+    layers for every row in the board, so static cells are blitted once per
+    row instead of once per frame.
+
+    Cached surface for a row is rendered again when the row static version
+    changes, and it is discarded when the row scrolls out of the board.
+    """
+
+    def __init__(self, cell_width, cell_height, spacing=2, background=None):
+        """RowSurfaceCache class initialization method.
+
+        Args:
+            cell_width (int) : cell width in pixels.
+            cell_height (int) : cell height in pixels.
+            spacing (int) : pixels between cells.
+            background (tuple) : color for the row surface background.\
+                    Default is a transparent background.
+        """
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.spacing = spacing
+        self.background = background
+        self._entries = {}
+
+    def cell_pos(self, cell, x, y):
+        """Returns the position for the given cell in a row located at the
+        given position.
+
+        Args:
+            cell (BCell) : cell to locate.
+            x (int) : X-coordinate in pixels for the row.
+            y (int) : Y-coordinate in pixels for the row.
+
+        Returns:
+            tuple : X-coordinate and Y-coordinate in pixels for the cell.
+        """
+        return (x + cell.col * (self.cell_width + self.spacing), y)
+
+    def _new_surface(self, row):
+        """Creates an empty surface for the given row.
+        """
+        size = (row.Width * (self.cell_width + self.spacing), self.cell_height)
+        if self.background is None:
+            return pygame.Surface(size, pygame.SRCALPHA)
+        surface = pygame.Surface(size)
+        surface.fill(self.background)
+        return surface
+
+    def _build(self, row):
+        """Renders all static layers for the given row in a new surface.
+
+        Returns:
+            tuple : row surface and list of (cell, sprite) rendered.
+        """
+        surface = self._new_surface(row)
+        sprites = []
+        for layer in [x for x in row if len(x) and x.type in BRow.STATIC_LAYERS]:
+            for cell in layer:
+                sprite = cell.render(BRender.GRAPH)
+                if sprite is not None:
+                    surface.blit(sprite.image, self.cell_pos(cell, 0, 0))
+                    sprites.append((cell, sprite))
+        return surface, sprites
+
+    def get(self, row, x, y):
+        """Returns the surface with all static layers for the given row.
+
+        Static sprites are located at the given position, so they can still
+        be used for collisions with the mouse.
+
+        Args:
+            row (BRow) : row to render.
+            x (int) : X-coordinate in pixels for the row.
+            y (int) : Y-coordinate in pixels for the row.
+
+        Returns:
+            pygame.Surface : surface with all static cells for the row.
+        """
+        entry = self._entries.get(id(row))
+        if entry is None or entry[0] is not row or entry[1] != row.static_version:
+            surface, sprites = self._build(row)
+            entry = [row, row.static_version, surface, sprites, None]
+            self._entries[id(row)] = entry
+        if entry[4] != (x, y):
+            for cell, sprite in entry[3]:
+                sprite.rect.x, sprite.rect.y = self.cell_pos(cell, x, y)
+            entry[4] = (x, y)
+        return entry[2]
+
+    def retain(self, rows):
+        """Discards cached surfaces for any row not in the given rows.
+
+        Args:
+            rows (list) : rows still in the board.
+        """
+        keep = set([id(x) for x in rows])
+        for key in [x for x in self._entries if x not in keep]:
+            del self._entries[key]
+
+    def clear(self):
+        """Discards all cached surfaces.
+        """
+        self._entries.clear()
+
+    def __len__(self):
+        """Returns the number of cached surfaces.
+        """
+        return len(self._entries)
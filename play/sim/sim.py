@@ -0,0 +1,106 @@
+import argparse
+import time
+from rpgrun.board.blayer import LType
+from rpgrun.board.brow import BRow
+from rpgrun.board.bshapes import Quad, Rhomboid
+from rpgrun.board.bpoint import Location
+from rpgrun.game.action import AType
+from rpgrun.game.actor import Actor
+from rpgrun.game.gsim import Scenario, Simulation, RandomPolicy, ScriptedPolicy, aggregate
+from rpgrun.game.gfarm import MatchFarm
+from assets.text.surfaces import GreenSurface
+from assets.text.actors import PlayerActor, EnemyActor, MageActor, BossActor
+from assets.text.bobjects import Pillar
+from assets.text.actions import WeaponAction, MeleAction, RangeAction, MoveAction
+from assets.text.equips import Weapon, Armor, Shield
+
+SPRITE_WIDTH = 7
+
+
+class TextScenario(Scenario):
+    """Scenario with the same board, actors and equipment used by the text
+    play.
+    """
+
+    def __init__(self, width=7, height=7, stats=False):
+        super(TextScenario, self).__init__(width, height, stats)
+
+    def setup(self, game, rand, **kwargs):
+        iheight = self.height
+        for row in game.board:
+            iheight -= 1
+            for iwidth in range(self.width):
+                row.add_cell_to_layer(GreenSurface(iwidth, iheight, SPRITE_WIDTH), LType.SURFACE)
+
+        Actor.LIFE = 'hp'
+        player = PlayerActor(2, 4, SPRITE_WIDTH)
+        player.actions.append(WeaponAction('weapon', AType.WEAPONIZE))
+        player.actions.append(MoveAction('move', AType.MOVEMENT))
+        enemies = [EnemyActor(4, 6, SPRITE_WIDTH, 'GOBLIN'),
+                   EnemyActor(3, 5, SPRITE_WIDTH, 'ORC'),
+                   EnemyActor(1, 0, SPRITE_WIDTH, 'TROLL'),
+                   MageActor(0, 5, SPRITE_WIDTH, 'MAGE'),
+                   BossActor(1, 5, SPRITE_WIDTH)]
+        for enemy in enemies:
+            enemy.actions.append(WeaponAction('weapon', AType.WEAPONIZE))
+        pillar = Pillar(0, 6, SPRITE_WIDTH)
+
+        sword = Weapon(name='sword', attr_buff={'str': kwargs.get('sword_str', 5)})
+        sword.actions.append(MeleAction('mele', AType.WEAPONIZE, width=2, height=2, shape=Quad))
+        bow = Weapon(name='bow', attr_buff={'str': 2})
+        bow.actions.append(RangeAction('range', AType.WEAPONIZE, width=3, height=3, shape=Rhomboid))
+        armor = Armor(attr_buff={'hp': kwargs.get('armor_hp', 10)})
+        shield = Shield(attr_buff={'hp': 7, 'str': 1})
+        for equip in (sword, bow, armor, shield):
+            player.inventory.append(equip)
+        for equip in (sword, armor, shield):
+            player.equipment.append(equip)
+
+        game.add_actor(player, True)
+        for enemy in enemies:
+            game.add_actor(enemy)
+        for cell in [player, pillar] + enemies:
+            game.board.get_row_from_cell(cell).add_cell_to_layer(cell, LType.OBJECT)
+
+    def new_row(self, game, rand):
+        row = BRow(self.width)
+        new_height = game.board.top_cell_row + 1
+        for iwidth in range(self.width):
+            row.add_cell_to_layer(GreenSurface(iwidth, new_height, SPRITE_WIDTH), LType.SURFACE)
+        return row
+
+
+POLICIES = {'random': lambda: RandomPolicy(),
+            'scripted': lambda: ScriptedPolicy([('mele', None),
+                                                ('weapon', 'BOSS'),
+                                                ('move', (Location.FRONT, 1))])}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='rpgRun headless simulation')
+    parser.add_argument('-n', '--matches', type=int, default=1000, help='number of matches')
+    parser.add_argument('-s', '--seed', type=int, default=0, help='seed for the first match')
+    parser.add_argument('-p', '--policy', choices=sorted(POLICIES), default='random',
+                        help='player policy')
+    parser.add_argument('-t', '--turns', type=int, default=100, help='maximum turns per match')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='number of worker processes, 0 runs in the current process')
+    parser.add_argument('--stats', action='store_true',
+                        help='keep actor attributes in a columnar stats table')
+    args = parser.parse_args()
+
+    sim = Simulation(TextScenario(stats=args.stats), POLICIES[args.policy](), max_turns=args.turns)
+    seeds = range(args.seed, args.seed + args.matches)
+    start = time.time()
+    if args.jobs:
+        stats = aggregate(result for _, result in MatchFarm(sim, args.jobs).run(seeds))
+    else:
+        stats = aggregate(sim.run(seeds))
+    elapsed = time.time() - start
+    for key, value in stats.items():
+        print('{0:<12}: {1}'.format(key, value))
+    print('{0:<12}: {1:.1f}'.format('matches/sec', stats['matches'] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
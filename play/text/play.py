@@ -7,6 +7,7 @@ from rpgrun.board.blayer import LType
 from rpgrun.board.bpoint import Point, Location
 from rpgrun.board.bshapes import Quad, Rhomboid
 from rpgrun.board.brow import BRow
+from rpgrun.board.bprovider import RowProvider, RowPool
 from rpgrun.game.action import AType
 from rpgrun.game.actor import Actor
 from assets.text.surfaces import GreenSurface
@@ -48,22 +49,34 @@ class Play(object):
                 cmd, self._stage))
             return False
 
-    def _new_row(self):
-        """Scroll Board.
+    def _new_rows(self, provider, newHeight):
+        """Yields new rows for the board.
         """
-        width = self._game.board.width
-        row = BRow(width)
-        newHeight = self._game.board.top_cell_row + 1
-        for iwidth in range(width):
-            row.add_cell_to_layer(GreenSurface(
-                iwidth, newHeight, self._spr_width), LType.SURFACE)
-        return row
+        board = self._game.board
+        width = board.width
+        while True:
+            # Rows are built in the provider worker thread, and the board
+            # adds rows to the pool while it scrolls.
+            with board.lock:
+                row = board.pool.get(newHeight)
+            if row is None:
+                row = BRow(width)
+                for iwidth in range(width):
+                    row.add_cell_to_layer(GreenSurface(
+                        iwidth, newHeight, self._spr_width), LType.SURFACE)
+            newHeight += 1
+            yield row
+
+    def _close(self):
+        """Stops the board row provider for the current game.
+        """
+        if self._game is not None and self._game.board.provider is not None:
+            self._game.board.provider.close()
 
     def _scroll(self):
         """Scroll Board.
         """
-        row = self._new_row()
-        self._game.scroll_board(row)
+        self._game.scroll_board()
 
     def set_toolbar(self):
         return " | ".join(self.STAGES[self._stage])
@@ -72,10 +85,13 @@ class Play(object):
         return "<{0}>".format(self._stage)
 
     def run(self, **kwargs):
-        super(Play, self).run(prompt='rpgRun> ',
-                              toolbar=self.set_toolbar,
-                              rprompt=self.set_rprompt,
-                              precmd=True)
+        try:
+            super(Play, self).run(prompt='rpgRun> ',
+                                  toolbar=self.set_toolbar,
+                                  rprompt=self.set_rprompt,
+                                  precmd=True)
+        finally:
+            self._close()
 
 
 play = Play()
@@ -88,6 +104,7 @@ def do_init():
     play._width = 7
     play._height = 7
     play._spr_width = 7
+    play._close()
     play._game = game.Game(play._width, play._height)
     data_cache['game'] = play._game
     iheight = play._height
@@ -138,6 +155,10 @@ def do_init():
         play._game.board.get_row_from_cell(
             x).add_cell_to_layer(x, LType.OBJECT)
 
+    play._game.board.pool = RowPool(keep=[LType.SURFACE])
+    play._game.board.provider = RowProvider.from_generator(
+        play._new_rows, play._height, prefetch=4)
+
     play._logger.display('Init rpgRun')
 
     # Run the game engine.
@@ -285,7 +306,7 @@ def do_select_movement(loc, pos):
     """
     print('player moves {0} to {1}'.format(pos, loc))
     play._game.run_select_movement(loc, pos)
-    play._game.run_scroll(play._new_row())
+    play._game.run_scroll()
     # play._scroll()
     play._stage = 'init'
     return True
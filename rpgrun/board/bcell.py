@@ -1,13 +1,28 @@
 import rpgrun.common.ids as ids
 from rpgrun.board.bpoint import BPoint
 from rpgrun.board.brender import BRender
+from rpgrun.board.bsprite import BSprite
 
 
 class BCell(BPoint):
     """BCell class derives from BPoint class and it provides some additional
     functionality for any object placed on the board.
+
+    BCell attributes are stored in slots. Derived classes that do not define
+    their own slots get an instance dictionary for any additional attribute.
+
+    Changing walkable or solid flags for a cell placed in the board is a
+    change in the row and in the board, so collision maps, snapshots and
+    grids built from them are built again.
+
+    Moving a cell placed in a layer notifies the layer, so its indexes and
+    the board indexes follow the cell. Cells moved to another row have to be
+    moved with Board.move_cell.
     """
 
+    __slots__ = ('__id', 'name', 'desc', 'static', '_walkable', '_solid',
+                 'layer', 'Layer', '_sprite', '__weakref__')
+
     def __init__(self, x, y, name, **kwargs):
         """BCell class initialization method.
 
@@ -15,13 +30,14 @@ class BCell(BPoint):
         >>> cell.sprite
         """
         super(BCell, self).__init__(x, y)
-        self.__id = ids.new_id()
+        self.__id = ids.register(self)
         self.name = name
         self.desc = kwargs.get('desc', '')
         self.static = True
-        self.walkable = True
-        self.solid = True
         self.layer = None
+        self._walkable = True
+        self._solid = True
+        self._sprite = None
         self.sprite = kwargs.get('sprite', None)
 
     @property
@@ -30,6 +46,166 @@ class BCell(BPoint):
         """
         return self.__id
 
+    @property
+    def walkable(self):
+        """Gets _walkable attribute value.
+        """
+        return self._walkable
+
+    @walkable.setter
+    def walkable(self, value):
+        """Sets _walkable attribute value.
+
+        Example:
+            >>> from rpgrun.board.brow import BRow
+            >>> from rpgrun.board.blayer import LType
+            >>> row = BRow(2)
+            >>> cell = BCell(0, 0, 'cell')
+            >>> row.add_cell_to_layer(cell, LType.SURFACE)
+            True
+            >>> snap = row.snapshot()
+            >>> cell.walkable = False
+            >>> row.snapshot() is snap, row.snapshot().cells()[0].collision
+            (False, True)
+        """
+        if value != self._walkable:
+            self._walkable = value
+            self.notify_flags_changed()
+
+    @property
+    def solid(self):
+        """Gets _solid attribute value.
+        """
+        return self._solid
+
+    @solid.setter
+    def solid(self, value):
+        """Sets _solid attribute value.
+        """
+        if value != self._solid:
+            self._solid = value
+            self.notify_flags_changed()
+
+    @property
+    def sprite(self):
+        """Gets _sprite attribute value.
+        """
+        return self._sprite
+
+    @sprite.setter
+    def sprite(self, value):
+        """Sets _sprite attribute value.
+
+        Sprite keeps a reference to the cell, so the cell is notified when
+        the sprite changes.
+
+        Args:
+            value (BSprite) : sprite for the cell.
+        """
+        self._sprite = value
+        if isinstance(value, BSprite):
+            value.cell = self
+        self.notify_changed()
+
+    def notify_changed(self):
+        """Notifies the row where the cell is placed that the cell has
+        changed, so it has to be rendered again.
+
+        Example:
+            >>> from rpgrun.board.brow import BRow
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bsprite import TextSprite
+            >>> row = BRow(2)
+            >>> cell = BCell(0, 0, 'cell', sprite=TextSprite(sprite='*'))
+            >>> row.add_cell_to_layer(cell, LType.SURFACE)
+            True
+            >>> row.render()
+            '  *  '
+            >>> row.dirty
+            False
+            >>> cell.sprite.hidden = True
+            >>> row.dirty
+            True
+        """
+        if self.layer is not None and self.layer.row is not None:
+            self.layer.row.set_dirty(self.layer)
+
+    def notify_moved(self, old_x):
+        """Notifies the layer where the cell is placed that the cell has
+        moved.
+
+        Args:
+            old_x (int) : X-coordinate before the movement.
+        """
+        if self.layer is not None:
+            self.layer._cell_moved(self, old_x)
+
+    def _set_x(self, value):
+        """Sets _x attribute value, notifying the layer where the cell is
+        placed.
+        """
+        old_x = self._x
+        self._x = int(value)
+        if self._x != old_x:
+            self.notify_moved(old_x)
+
+    def _set_y(self, value):
+        """Sets _y attribute value, notifying the layer where the cell is
+        placed.
+        """
+        old_y = self._y
+        self._y = int(value)
+        if self._y != old_y:
+            self.notify_moved(self._x)
+
+    x = property(BPoint.x.fget, _set_x, doc="""Gets and sets X-coordinate.
+
+        Example:
+            >>> from rpgrun.board.brow import BRow
+            >>> from rpgrun.board.blayer import LType
+            >>> row = BRow(3)
+            >>> cell = BCell(0, 0, 'cell')
+            >>> row.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> cell.x = 2
+            >>> row.get_cells_at(BPoint(0, 0)), row.get_cells_at(BPoint(2, 0))
+            ([], [(2, 0) : cell])
+        """)
+
+    y = property(BPoint.y.fget, _set_y, doc='Gets and sets Y-coordinate.')
+
+    def x_move(self, x=1):
+        """Updates X-coordinate a given value, notifying the layer where the
+        cell is placed.
+        """
+        self.x = self._x + int(x)
+        return self
+
+    def y_move(self, y=1):
+        """Updates Y-coordinate a given value, notifying the layer where the
+        cell is placed.
+        """
+        self.y = self._y + int(y)
+        return self
+
+    def xy_move(self, x=1, y=1):
+        """Updates X-coordinate and Y-coordinate with given values, notifying
+        the layer where the cell is placed.
+        """
+        old_x, old_y = self._x, self._y
+        self._x += int(x)
+        self._y += int(y)
+        if (self._x, self._y) != (old_x, old_y):
+            self.notify_moved(old_x)
+        return self
+
+    def notify_flags_changed(self):
+        """Notifies the row where the cell is placed that the cell walkable
+        or solid flags have changed.
+        """
+        if self.layer is not None and self.layer.row is not None:
+            self.layer.row._cell_changed(self.layer, self)
+
     @property
     def row(self):
         """Gets _y attribute value.
@@ -0,0 +1,368 @@
+import math
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpath import GridSet, PathGrid, _point
+
+_OCTANTS = ((1, 0, 0, 1), (0, 1, 1, 0), (0, -1, 1, 0), (-1, 0, 0, 1),
+            (-1, 0, 0, -1), (0, -1, -1, 0), (0, 1, -1, 0), (1, 0, 0, -1))
+_SEEN = bytes.maketrans(b'\x00\x01', b'01')
+
+
+class SightGrid(PathGrid):
+    """SightGrid class keeps an opacity grid for all rows in the board,
+    where every position with any solid cell blocks the line of sight.
+
+    It is refreshed like the walkability grid, when the board changes.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.bsurface import BSurface
+        >>> board = Board(1, 3)
+        >>> board[0].cellrow = 0
+        >>> _ = board.add_cell_to_layer(BSurface(0, 0, 'floor'), LType.SURFACE)
+        >>> _ = board.add_cell_to_layer(BCell(1, 0, 'pillar'), LType.OBJECT)
+        >>> grid = SightGrid(board)
+        >>> grid.is_walkable(0, 0), grid.is_walkable(1, 0)
+        (True, False)
+    """
+
+    def blocks(self, cell):
+        """Checks if the given cell blocks the line of sight.
+
+        Args:
+            cell (BCell) : cell to check.
+
+        Returns:
+            bool : True if cell is solid.
+        """
+        return cell.solid
+
+
+def shadowcast(grid, origin, radius):
+    """Returns all positions visible from the given origin, using recursive
+    shadowcasting.
+
+    Every octant around the origin is swept row by row, and any opaque
+    position casts a shadow that is skipped in the next rows, so every
+    position is checked at most once. Opaque positions are visible, but
+    positions behind them are not. Origin is always visible, and it never
+    blocks the line of sight.
+
+    Args:
+        grid (SightGrid) : opacity grid.
+        origin (Point) : position to look from.
+        radius (int) : maximum distance.
+
+    Returns:
+        GridSet : all visible positions.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.bpoint import BPoint
+        >>> board = Board(5, 5)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 4 - index
+        >>> _ = board.add_cell_to_layer(BCell(2, 2, 'pillar'), LType.OBJECT)
+        >>> visible = shadowcast(SightGrid(board), BPoint(2, 0), 4)
+        >>> BPoint(2, 2) in visible, BPoint(2, 3) in visible, BPoint(2, 4) in visible
+        (True, False, False)
+        >>> BPoint(0, 4) in visible, BPoint(4, 2) in visible, len(visible)
+        (True, True, 23)
+    """
+    grid.refresh()
+    ox, oy = _point(origin)
+    width, height, bottom = grid.width, grid.height, grid.bottom
+    oy -= bottom
+    if not (0 <= ox < width and 0 <= oy < height):
+        return GridSet(0, width, bottom)
+    wedges = [(1.0, 0.0, octant) for octant in _OCTANTS]
+    seen = _cast(grid, ox, oy, radius, radius * radius + radius, wedges)
+    bits = int(bytes(seen).translate(_SEEN)[::-1], 2) if seen else 0
+    return GridSet(bits, width, bottom)
+
+
+def _cast(grid, ox, oy, rows, radius2, wedges):
+    """Sweeps the given wedges around the origin, and returns a flag for
+    every grid position, set for every visible position.
+
+    Args:
+        grid (SightGrid) : opacity grid, already refreshed.
+        ox (int) : origin column.
+        oy (int) : origin row in the grid.
+        rows (int) : number of rows to sweep.
+        radius2 (int) : maximum squared distance for visible positions.
+        wedges (list) : (start, end, octant) for every wedge to sweep,\
+                where start and end are slopes in the octant.
+
+    Returns:
+        bytearray : visible flag for every position.
+    """
+    width, height = grid.width, grid.height
+    blocked = grid._blocked
+    seen = bytearray(len(blocked))
+    seen[oy * width + ox] = 1
+
+    def cast(row, start, end, xx, xy, yx, yy):
+        if start < end:
+            return
+        new_start = start
+        for distance in range(row, rows + 1):
+            dy = -distance
+            # Positions before the start slope are skipped at once, one
+            # more is checked against rounding errors.
+            dx = max(-distance, math.ceil(start * (dy - 0.5) - 0.5) - 1) - 1
+            x, y = ox + dx * xx + dy * xy, oy + dx * yx + dy * yy
+            shadow = False
+            while dx < 0:
+                dx += 1
+                x += xx
+                y += yx
+                right = (dx + 0.5) / (dy - 0.5)
+                if start < right:
+                    continue
+                left = (dx - 0.5) / (dy + 0.5)
+                if end > left:
+                    break
+                if 0 <= x < width and 0 <= y < height:
+                    index = y * width + x
+                    opaque = blocked[index]
+                    if dx * dx + dy * dy <= radius2:
+                        seen[index] = 1
+                else:
+                    opaque = True
+                if shadow:
+                    if opaque:
+                        new_start = right
+                        continue
+                    shadow = False
+                    start = new_start
+                elif opaque and distance < rows:
+                    shadow = True
+                    cast(distance + 1, start, left, xx, xy, yx, yy)
+                    new_start = right
+            if shadow:
+                break
+
+    for start, end, (xx, xy, yx, yy) in wedges:
+        cast(1, start, end, xx, xy, yx, yy)
+    # cast() refers to itself, drop it now instead of leaving the cycle,
+    # and the whole seen array, to the garbage collector.
+    del cast
+    return seen
+
+
+def line_of_sight(grid, origin, target, radius):
+    """Checks if the given target is visible from the given origin.
+
+    Only the slopes covered by the target are swept, in every octant the
+    target belongs to, so the result is the same as checking the target in
+    the whole field returned by shadowcast(), but it only looks at
+    positions between the origin and the target.
+
+    Args:
+        grid (SightGrid) : opacity grid.
+        origin (Point) : position to look from.
+        target (Point) : position to check.
+        radius (int) : maximum distance.
+
+    Returns:
+        bool : True if target is visible from the origin.
+
+    Example:
+        >>> import random
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.bpoint import BPoint
+        >>> random.seed(1)
+        >>> board = Board(9, 9)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 8 - index
+        >>> for x, y in random.sample([(x, y) for x in range(9) for y in range(9)], 20):
+        ...     _ = board.add_cell_to_layer(BCell(x, y, 'pillar'), LType.OBJECT)
+        >>> grid = SightGrid(board)
+        >>> origin = BPoint(4, 4)
+        >>> field = shadowcast(grid, origin, 5)
+        >>> points = [BPoint(x, y) for x in range(9) for y in range(9)]
+        >>> [x in field for x in points] == [line_of_sight(grid, origin, x, 5) for x in points]
+        True
+    """
+    grid.refresh()
+    ox, oy = _point(origin)
+    tx, ty = _point(target)
+    width, height, bottom = grid.width, grid.height, grid.bottom
+    oy -= bottom
+    ty -= bottom
+    if not (0 <= ox < width and 0 <= oy < height and 0 <= tx < width and 0 <= ty < height):
+        return False
+    wx, wy = tx - ox, ty - oy
+    radius2 = radius * radius + radius
+    if wx * wx + wy * wy > radius2:
+        return False
+    if -1 <= wx <= 1 and -1 <= wy <= 1:
+        # The first row around the origin is never shadowed.
+        return True
+    wedges = []
+    for xx, xy, yx, yy in _OCTANTS:
+        # Octant transforms are signed permutations, so the inverse is the
+        # transpose.
+        dx, dy = xx * wx + yx * wy, xy * wx + yy * wy
+        if dy <= dx <= 0:
+            wedges.append(((dx - 0.5) / (dy + 0.5), (dx + 0.5) / (dy - 0.5), (xx, xy, yx, yy)))
+    seen = _cast(grid, ox, oy, max(abs(wx), abs(wy)), radius2, wedges)
+    return bool(seen[ty * width + tx])
+
+
+class FieldOfView(object):
+    """FieldOfView class looks for positions visible from any position in
+    the board, keeping every field of view computed, by origin and radius,
+    until the opacity grid changes.
+
+    Once a field of view is computed, checking if any position is visible
+    is a single bit test, so ranged actions and renderers can check many
+    targets after one sweep.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.bpoint import BPoint
+        >>> board = Board(3, 5)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 2 - index
+        >>> pillar = BCell(2, 1, 'pillar')
+        >>> _ = board.add_cell_to_layer(pillar, LType.OBJECT)
+        >>> fov = FieldOfView(board)
+        >>> fov.is_visible(BPoint(2, 0), BPoint(2, 2)), fov.is_visible(BPoint(2, 0), BPoint(0, 2))
+        (False, True)
+        >>> fov.visible(BPoint(2, 0), 2) is fov.visible(BPoint(2, 0), 2)
+        True
+        >>> _ = board.remove_cell(pillar)
+        >>> fov.is_visible(BPoint(2, 0), BPoint(2, 2))
+        True
+    """
+
+    # Cells checked for every unit of radius before visible_cells() casts
+    # the whole field instead of checking them one by one.
+    MANY_CELLS = 2
+
+    def __init__(self, board, layers=None):
+        """FieldOfView class initialization method.
+
+        Args:
+            board (Board) : board to look at.
+            layers (list) : layers where solid cells block the line of\
+                    sight. Default is SURFACE and OBJECT layers.
+        """
+        self.grid = SightGrid(board, layers)
+        self._fields = {}
+        self._revision = None
+
+    def visible(self, origin, radius):
+        """Returns all positions visible from the given origin.
+
+        Args:
+            origin (Point) : position to look from.
+            radius (int) : maximum distance.
+
+        Returns:
+            GridSet : all visible positions.
+        """
+        self._refresh()
+        key = _point(origin) + (radius, )
+        field = self._fields.get(key)
+        if field is None:
+            field = self._fields[key] = shadowcast(self.grid, origin, radius)
+        return field
+
+    def _refresh(self):
+        """Clears all fields when the opacity grid changed.
+        """
+        grid = self.grid
+        grid.refresh()
+        if grid.revision != self._revision:
+            self._revision = grid.revision
+            self._fields.clear()
+
+    def visible_cells(self, origin, cells, radius):
+        """Returns the given cells visible from the given origin.
+
+        A field already cast for the origin is reused. Otherwise every cell
+        is checked with line_of_sight(), which only sweeps the slopes
+        between the origin and the cell, while many cells cast and keep the
+        whole field, as checking them one by one costs more than that.
+
+        Args:
+            origin (Point) : position to look from.
+            cells (list) : cells to check, like all targets for an action.
+            radius (int) : maximum distance.
+
+        Returns:
+            list : visible cells, in the same order.
+
+        Example:
+            >>> from rpgrun.board.board import Board
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.bpoint import BPoint
+            >>> board = Board(5, 5)
+            >>> for index, row in enumerate(board):
+            ...     row.cellrow = 4 - index
+            >>> _ = board.add_cell_to_layer(BCell(2, 2, 'pillar'), LType.OBJECT)
+            >>> fov = FieldOfView(board)
+            >>> cells = [BPoint(2, 1), BPoint(2, 3), BPoint(4, 2), BPoint(0, 4)]
+            >>> fov.visible_cells(BPoint(2, 0), cells, 4), list(fov._fields)
+            ([(2, 1), (4, 2), (0, 4)], [])
+            >>> fov.visible_cells(BPoint(2, 0), cells * 4, 4) == [x for x in cells * 4 if x != cells[1]]
+            True
+            >>> list(fov._fields)
+            [(2, 0, 4)]
+        """
+        self._refresh()
+        field = self._fields.get(_point(origin) + (radius, ))
+        if field is None and len(cells) > radius * self.MANY_CELLS:
+            field = self.visible(origin, radius)
+        if field is None:
+            grid = self.grid
+            return [x for x in cells if line_of_sight(grid, origin, x, radius)]
+        return [x for x in cells if x in field]
+
+    def visible_many(self, origins, radius):
+        """Returns all positions visible from every given origin, like the
+        position of every actor.
+
+        Opacity grid is checked only once for all origins.
+
+        Args:
+            origins (list) : positions to look from.
+            radius (int) : maximum distance.
+
+        Returns:
+            list[GridSet] : visible positions for every origin, in the same\
+                    order.
+        """
+        if origins:
+            self._refresh()
+        fields, grid = self._fields, self.grid
+        result = []
+        for origin in origins:
+            key = _point(origin) + (radius, )
+            field = fields.get(key)
+            if field is None:
+                field = fields[key] = shadowcast(grid, origin, radius)
+            result.append(field)
+        return result
+
+    def is_visible(self, origin, target, radius=None):
+        """Checks if there is a line of sight between two positions.
+
+        Args:
+            origin (Point) : position to look from.
+            target (Point) : position to check.
+            radius (int) : maximum distance. Default is the distance to\
+                    the target.
+
+        Returns:
+            bool : True if target is visible from the origin.
+        """
+        if radius is None:
+            radius = abs(target.x - origin.x) + abs(target.y - origin.y)
+        return target in self.visible(origin, radius)
@@ -20,6 +20,11 @@ class BLayer(Itero):
 
     BLayer contains a number of cells, that number is provided as the
     width or maxlen of the layer.
+
+    Cells are indexed by their X-coordinate in a slot array with one entry
+    per column, and by their ID, so point and ID lookups do not have to
+    traverse the layer. Cells notify the layer when they move, so the slot
+    array follows them.
     """
 
     def __init__(self, type_, maxlen):
@@ -32,6 +37,9 @@ class BLayer(Itero):
         super(BLayer, self).__init__(BCell, maxlen)
         self.type = type_
         self.cellrow = None
+        self.row = None
+        self._slots = [None] * (maxlen if maxlen else 0)
+        self._ids = {}
 
     @property
     def width(self):
@@ -61,9 +69,152 @@ class BLayer(Itero):
         """
         if self.cellrow is None:
             self.cellrow = theCell.row
+            if self.row is not None and self.row._cellrow is None:
+                self.row.cellrow = self.cellrow
         else:
             assert self.cellrow == theCell.row
         super(BLayer, self).append(theCell)
+        self._index_cell(theCell)
+
+    def __setitem__(self, key, value):
+        """Updates the cell at the given index, keeping the slot index.
+
+        >>> layer = BLayer(LType.OBJECT, 5)
+        >>> layer.append(BCell(0, 0, None))
+        >>> layer[0] = BCell(3, 0, 'new')
+        >>> layer.get_cell_at(BCell(3, 0, None))
+        (3, 0) : new
+        >>> layer.get_cell_at(BCell(0, 0, None))
+        """
+        old_cell = self[key]
+        super(BLayer, self).__setitem__(key, value)
+        self._unindex_cell(old_cell)
+        self._index_cell(value)
+
+    def __delitem__(self, key):
+        """Deletes the cell at the given index, keeping the slot index.
+
+        >>> layer = BLayer(LType.OBJECT, 5)
+        >>> layer.append(BCell(1, 0, None))
+        >>> del layer[0]
+        >>> layer.get_cell_at(BCell(1, 0, None))
+        """
+        cell = self[key]
+        super(BLayer, self).__delitem__(key)
+        self._unindex_cell(cell)
+
+    def extend(self, theList):
+        """Extends the layer with the given cells, keeping the slot index.
+
+        >>> layer = BLayer(LType.OBJECT, 5)
+        >>> layer.extend([BCell(1, 0, None), BCell(2, 0, None)])
+        >>> layer.get_cell_at(BCell(2, 0, None))
+        (2, 0) : None
+        """
+        start = len(self)
+        super(BLayer, self).extend(theList)
+        for cell in self.stream[start:]:
+            self._index_cell(cell)
+
+    def pop(self):
+        """Retrieves and removes the last cell, keeping the slot index.
+
+        >>> layer = BLayer(LType.OBJECT, 5)
+        >>> layer.append(BCell(1, 0, None))
+        >>> layer.pop()
+        (1, 0) : None
+        >>> layer.get_cell_at(BCell(1, 0, None))
+        """
+        cell = super(BLayer, self).pop()
+        self._unindex_cell(cell)
+        return cell
+
+    def _index_cell(self, cell):
+        """Stores the given cell in the slot for its X-coordinate and in the
+        ID index, and notifies the row the layer belongs to.
+
+        When there is already a cell in that slot, the first one added is
+        kept, as a linear search would have returned that one.
+
+        Args:
+            cell (BCell) : cell to index.
+        """
+        x = cell.x
+        if 0 <= x < len(self._slots) and self._slots[x] is None:
+            self._slots[x] = cell
+        self._ids[cell.id] = cell
+        cell.layer = self
+        if self.row is not None:
+            self.row._cell_added(self, cell)
+
+    def _unindex_cell(self, cell):
+        """Clears the slot and the ID index for the given cell, and notifies
+        the row the layer belongs to.
+
+        If any other cell in the layer is placed at the same X-coordinate,
+        it takes over the slot.
+
+        Args:
+            cell (BCell) : cell to remove from the index.
+        """
+        self._release_slot(cell, cell.x)
+        self._ids.pop(cell.id, None)
+        if cell.layer is self:
+            cell.layer = None
+        if self.row is not None:
+            self.row._cell_removed(self, cell)
+
+    def _release_slot(self, cell, x):
+        """Clears the slot for the given X-coordinate if it holds the given
+        cell. If any other cell in the layer is placed at the same
+        X-coordinate, it takes over the slot.
+        """
+        if 0 <= x < len(self._slots) and self._slots[x] is cell:
+            self._slots[x] = None
+            for other in self.stream:
+                if other is not cell and other.x == x:
+                    self._slots[x] = other
+                    break
+
+    def _cell_moved(self, cell, old_x):
+        """Moves the given cell to the slot for its new X-coordinate, and
+        notifies the row the layer belongs to.
+
+        It is called by the cell that moved.
+
+        Args:
+            cell (BCell) : cell moved.
+            old_x (int) : X-coordinate before the movement.
+        """
+        self._release_slot(cell, old_x)
+        x = cell.x
+        if 0 <= x < len(self._slots) and self._slots[x] is None:
+            self._slots[x] = cell
+        if self.row is not None:
+            self.row._cell_moved(self, cell)
+
+    def reset(self, cellrow=None):
+        """Removes all cells from the layer at once, without notifying the
+        row the layer belongs to, so the layer can be reused.
+
+        Args:
+            cellrow (int) : new cell row for the layer.
+
+        Example:
+            >>> layer = BLayer(LType.OBJECT, 5)
+            >>> cell = BCell(1, 0, None)
+            >>> layer.append(cell)
+            >>> layer.reset(3)
+            >>> len(layer), layer.cellrow, cell.layer, layer.get_cell_at(cell)
+            (0, 3, None, None)
+        """
+        for cell in self.stream:
+            if cell.layer is self:
+                cell.layer = None
+        del self.stream[:]
+        self._slots = [None] * len(self._slots)
+        self._ids.clear()
+        self.cellrow = cellrow
 
     def get_cell_by_id(self, id):
         """Returns a cell by the given ID.
@@ -83,11 +234,11 @@ class BLayer(Itero):
             >>> layer.append(c2)
             >>> layer.get_cell_by_id(c1.id) == c1
             True
+            >>> layer.remove(c1)
+            True
+            >>> layer.get_cell_by_id(c1.id)
         """
-        for cell in self:
-            if cell.id == id:
-                return cell
-        return None
+        return self._ids.get(id)
 
     def get_cell_at(self, point):
         """Gets a cell at the position for the given point.
@@ -111,9 +262,15 @@ class BLayer(Itero):
             True
             >>> layer.get_cell_at(BPoint(1, 1)) == c1
             False
+            >>> from rpgrun.board.bpoint import Location
+            >>> _ = c2.move_to(Location.RIGHT, 2)
+            >>> layer.get_cell_at(BPoint(3, 0)) == c2
+            True
         """
-        for cell in self:
-            if cell.get_point() == point:
+        x = point.x
+        if 0 <= x < len(self._slots):
+            cell = self._slots[x]
+            if cell is not None and cell.y == point.y:
                 return cell
         return None
 
@@ -1,7 +1,13 @@
-from collections import deque
+import threading
+from collections import Counter, deque
+from types import MappingProxyType
 from rpgrun.common.itero import Itero
+from rpgrun.board.blayer import LType
 from rpgrun.board.brender import BRender
 from rpgrun.board.brow import BRow
+from rpgrun.board.bsnapshot import BoardSnapshot
+from rpgrun.board.bspatial import SpatialHash
+from rpgrun.board.collision import CollisionMap
 
 
 class Board(Itero):
@@ -13,6 +19,25 @@ class Board(Itero):
 
     Every row contains a number of cells, that number is provided as the
     Width of the board.
+
+    Rows are indexed by their cellrow, and every layer in a row indexes its
+    cells by X-coordinate, so looking up cells at a given point does not
+    require to traverse the board. Cells placed in the board are indexed by
+    their ID too, and cells in the OBJECT layer are indexed by position in
+    a spatial hash, so they can be looked up by area. Positions blocked by
+    any cell with collision are counted as cells are added and removed, so
+    the collision map is built without traversing the board.
+
+    Board changes are protected by a reentrant lock, and every change
+    increases the board version. Changes are recorded in the board journal,
+    when there is one. Any other thread, like a renderer or the
+    AI, should read the board through a snapshot, which is a read-only copy
+    of the board at a given version. Multi-step changes, or changes made
+    directly in a row placed in the board, should hold the board lock.
+
+    New rows can be taken from a row provider, which builds them lazily
+    and ahead of time, when the board scrolls. Rows scrolled out of the
+    board can be kept in a row pool, so they are reused for new rows.
     """
 
     def __init__(self, height, width):
@@ -24,6 +49,19 @@ class Board(Itero):
         """
         super(Board, self).__init__(BRow, height)
         self._Itero__stream = deque()
+        self._rows = {}
+        self._cells = {}
+        self.objects = SpatialHash()
+        self._blockers = {}
+        self._blocked = Counter()
+        self._cmap = None
+        self._screen = []
+        self._version = 0
+        self._snapshot = None
+        self.journal = None
+        self.provider = None
+        self.pool = None
+        self.lock = threading.RLock()
         self.width = width
         for i in range(self.maxlen):
             self.appendleft(BRow(self.width))
@@ -38,6 +76,30 @@ class Board(Itero):
         """
         return self.maxlen
 
+    @property
+    def cells(self):
+        """Gets a read-only view, by cell ID, of all cells placed in the board.
+
+        Returns:
+            MappingProxyType : mapping with cell IDs and cells.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> board = Board(2, 5)
+            >>> board[0].cellrow = 0
+            >>> cell = BCell(0, 0, None)
+            >>> board.add_cell_to_layer(cell, LType.SURFACE)
+            True
+            >>> board.cells[cell.id] == cell
+            True
+            >>> board.remove_cell(cell)
+            True
+            >>> cell.id in board.cells
+            False
+        """
+        return MappingProxyType(self._cells)
+
     @property
     def top_cell_row(self):
         """Gets the cellrow value for the top row in the board.
@@ -98,10 +160,18 @@ class Board(Itero):
         """
         return self[self.maxlen - 1].cellrow
 
-    def scroll(self, new_row):
+    def scroll(self, new_row=None):
         """Scrolls the board, removing the row at the bottom (right) and
         adding a new row at the top (left).
 
+        When no row is given, the new row is taken from the board row
+        provider. Row removed is added to the board row pool and handed back
+        to the row provider.
+
+        Args:
+            new_row (BRow) : new row. Default is the next row from the\
+                    row provider.
+
         >>> board = Board(3, 5)
         >>> row1 = BRow(5)
         >>> row2 = BRow(5)
@@ -123,10 +193,24 @@ class Board(Itero):
         True
         >>> board[2] == row2
         True
+        >>> from rpgrun.board.bprovider import RowProvider
+        >>> board.provider = RowProvider(iter([row1]))
+        >>> board.scroll()
+        >>> board[0] == row1
+        True
         """
+        if new_row is None:
+            new_row = self.provider.next_row()
         assert isinstance(new_row, BRow)
-        self._Itero__stream.pop()
-        self._Itero__stream.appendleft(new_row)
+        with self.lock:
+            old_row = self._Itero__stream.pop()
+            self._detach_row(old_row)
+            self._Itero__stream.appendleft(new_row)
+            self._attach_row(new_row)
+            if self.pool is not None:
+                self.pool.put(old_row)
+        if self.provider is not None:
+            self.provider.recycle(old_row)
 
     def appendleft(self, new_row):
         """Appends a new row to the left (top).
@@ -141,7 +225,253 @@ class Board(Itero):
         >>> board[1] == row1
         True
         """
-        self._Itero__stream.appendleft(new_row)
+        with self.lock:
+            self._Itero__stream.appendleft(new_row)
+            self._attach_row(new_row)
+
+    def __setitem__(self, key, new_row):
+        """Replaces the row at the given index.
+
+        >>> board = Board(2, 5)
+        >>> row = BRow(5)
+        >>> row.cellrow = 7
+        >>> board[1] = row
+        >>> board.get_row_from_cell_row(7) == row
+        True
+        """
+        with self.lock:
+            self._detach_row(self[key])
+            super(Board, self).__setitem__(key, new_row)
+            self._attach_row(new_row)
+
+    def _attach_row(self, row):
+        """Links the given row to the board and indexes it by cellrow.
+
+        Args:
+            row (BRow) : row being placed in the board.
+        """
+        self._version += 1
+        row.board = self
+        if row.cellrow is not None:
+            self._index_row(row)
+        for layer in row.stream:
+            self._cells.update(layer._ids)
+            for cell in layer:
+                self._block(cell)
+            if layer.type is LType.OBJECT:
+                for cell in layer:
+                    self.objects.add(cell)
+            if self.journal is not None:
+                for cell in layer:
+                    self.journal.cell_added(cell)
+
+    def _detach_row(self, row):
+        """Unlinks the given row from the board and its cellrow index.
+
+        Args:
+            row (BRow) : row being removed from the board.
+        """
+        self._version += 1
+        row.board = None
+        if row._cellrow is not None and self._rows.get(row._cellrow) is row:
+            del self._rows[row._cellrow]
+            if self.journal is not None:
+                self.journal.row_dropped(row._cellrow)
+        for layer in row.stream:
+            for cell_id in layer._ids:
+                self._cells.pop(cell_id, None)
+                self._unblock(cell_id)
+            if layer.type is LType.OBJECT:
+                for cell in layer:
+                    self.objects.remove(cell)
+
+    def _index_row(self, row):
+        """Indexes the given row by its cellrow.
+
+        It is called by the row when its cellrow is set.
+
+        Args:
+            row (BRow) : row to index.
+        """
+        self._version += 1
+        self._rows[row.cellrow] = row
+
+    def _cell_added(self, row, cell):
+        """Indexes by ID a cell added to any row in the board.
+
+        It is called by the row where the cell was added.
+
+        Args:
+            row (BRow) : row where the cell was added.
+            cell (BCell) : cell added.
+        """
+        self._version += 1
+        self._cells[cell.id] = cell
+        self._block(cell)
+        if cell.layer.type is LType.OBJECT:
+            self.objects.add(cell)
+        if self.journal is not None:
+            self.journal.cell_added(cell)
+
+    def _cell_changed(self, row, cell):
+        """Updates blocked positions for a cell placed in any row in the board
+        that changed its walkable or solid flags.
+
+        It is called by the row where the cell is placed.
+
+        Args:
+            row (BRow) : row where the cell is placed.
+            cell (BCell) : cell changed.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> board = Board(1, 3)
+            >>> board[0].cellrow = 0
+            >>> cell = BCell(1, 0, 'door')
+            >>> board.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> version = board.version
+            >>> cell.walkable = False
+            >>> board.version > version, len(board.collision_map())
+            (True, 1)
+        """
+        self._version += 1
+        self._unblock(cell.id)
+        self._block(cell)
+
+    def _cell_moved(self, row, cell):
+        """Updates blocked positions, the spatial hash and the journal for a
+        cell placed in any row in the board that has moved.
+
+        It is called by the row where the cell is placed.
+
+        Args:
+            row (BRow) : row where the cell is placed.
+            cell (BCell) : cell moved.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bpoint import BPoint
+            >>> board = Board(1, 3)
+            >>> board[0].cellrow = 0
+            >>> cell = BCell(0, 0, 'rock')
+            >>> cell.walkable = False
+            >>> board.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> cell.x = 2
+            >>> board.get_cells_at(BPoint(2, 0)), board.objects.query_rect(2, 0, 2, 0)
+            ([(2, 0) : rock], [(2, 0) : rock])
+            >>> cmap = board.collision_map()
+            >>> (0, 0) in cmap, (2, 0) in cmap
+            (False, True)
+        """
+        self._version += 1
+        self._unblock(cell.id)
+        self._block(cell)
+        if self.objects.remove(cell):
+            self.objects.add(cell)
+        if self.journal is not None:
+            self.journal.cell_moved(cell)
+
+    def _cell_removed(self, row, cell):
+        """Removes from the ID index a cell removed from any row in the board.
+
+        It is called by the row where the cell was removed.
+
+        Args:
+            row (BRow) : row where the cell was removed.
+            cell (BCell) : cell removed.
+        """
+        self._version += 1
+        self._cells.pop(cell.id, None)
+        self._unblock(cell.id)
+        self.objects.remove(cell)
+        if self.journal is not None:
+            self.journal.cell_removed(cell)
+
+    def _block(self, cell):
+        """Counts the position for the given cell as blocked, if the cell
+        has a collision.
+
+        Position is kept by cell ID, so it is released even if the cell
+        changed when it is removed.
+
+        Args:
+            cell (BCell) : cell placed in the board.
+        """
+        if cell.collision and cell.id not in self._blockers:
+            position = (cell.x, cell.y)
+            self._blockers[cell.id] = position
+            self._blocked[position] += 1
+
+    def _unblock(self, cell_id):
+        """Releases the position blocked by the cell with the given ID.
+
+        Args:
+            cell_id (int) : ID for the cell removed from the board.
+        """
+        position = self._blockers.pop(cell_id, None)
+        if position is not None:
+            self._blocked[position] -= 1
+            if not self._blocked[position]:
+                del self._blocked[position]
+
+    @property
+    def version(self):
+        """Gets _version attribute value.
+
+        Version changes every time a row is added to or removed from the
+        board, any cell is added to or removed from any row in the board, or
+        any cell in the board changes its walkable or solid flags.
+
+        Returns:
+            int : board version.
+        """
+        return self._version
+
+    def snapshot(self):
+        """Returns a read-only copy of all rows, layers and cell positions
+        in the board.
+
+        Snapshot is taken holding the board lock, so it is consistent even
+        when the board is changed from another thread. The same snapshot is
+        returned until the board version changes, and rows that did not
+        change are shared between snapshots.
+
+        Returns:
+            BoardSnapshot : board snapshot.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bpoint import Location
+            >>> board = Board(2, 5)
+            >>> board[0].cellrow = 1
+            >>> board[1].cellrow = 0
+            >>> cell = BCell(0, 0, 'me')
+            >>> board.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> snap = board.snapshot()
+            >>> board.snapshot() is snap
+            True
+            >>> board.move_cell(cell, Location.RIGHT, 2)
+            True
+            >>> other = board.snapshot()
+            >>> other.version > snap.version, other.rows[0] is snap.rows[0]
+            (True, True)
+            >>> [(x.name, x.x, x.y) for x in snap.cells()], [(x.name, x.x, x.y) for x in other.cells()]
+            ([('me', 0, 0)], [('me', 2, 0)])
+            >>> other.get_cells_at((2, 0))[0].id == cell.id, snap.get_cells_at((2, 0))
+            (True, [])
+        """
+        with self.lock:
+            snap = self._snapshot
+            if snap is None or snap.version != self._version:
+                snap = BoardSnapshot(self._version, self.width, [x.snapshot() for x in self._Itero__stream])
+                self._snapshot = snap
+            return snap
 
     def append(self, new_row):
         """Appends a new row to the right. Not Allowed.
@@ -158,16 +488,22 @@ class Board(Itero):
     def get_row_from_cell_row(self, cellrow):
         """Gets the row for the given cellrow.
 
+        >>> from rpgrun.board.bcell import BCell
         >>> board = Board(2, 5)
         >>> board[0].cellrow = 1
         >>> board.get_row_from_cell_row(1).cellrow
         1
         >>> board.get_row_from_cell_row(3)
+        >>> board[1][0].append(BCell(0, 3, None))
+        >>> board.get_row_from_cell_row(3) == board[1]
+        True
         """
-        for row in self:
-            if row.cellrow == cellrow:
-                return row
-        return None
+        try:
+            row = self._rows.get(cellrow)
+        except TypeError:
+            # Unhashable values never match a cellrow.
+            return None
+        return row
 
     def get_index_from_cell_row(self, cellrow):
         """Gets the row index for the given cellrow.
@@ -178,10 +514,10 @@ class Board(Itero):
         0
         >>> board.get_row_from_cell_row(3)
         """
-        for index, row in enumerate(self):
-            if row.cellrow == cellrow:
-                return index
-        return None
+        row = self.get_row_from_cell_row(cellrow)
+        if row is None:
+            return None
+        return self._Itero__stream.index(row)
 
     def get_row_from_cell(self, cell):
         """Gets the row for the given Cell..
@@ -224,10 +560,15 @@ class Board(Itero):
             True
             >>> row.get_cells_at(BPoint(0, 1)) == []
             True
+            >>> board.get_cells_at(BPoint(1, 0)) == [c2, ]
+            True
+            >>> board.get_cells_at(BPoint(1, 9))
+            []
         """
         row = self.get_row_from_cell_row(point.y)
-        cells = row.get_cells_at(point, layers)
-        return cells
+        if row is None:
+            return []
+        return row.get_cells_at(point, layers)
 
     def get_index_from_cell(self, cell):
         """Gets the row index for the given Cell.
@@ -274,6 +615,68 @@ class Board(Itero):
                 cells.extend(cellsFromRow)
         return cells
 
+    def collision_map(self, layers=None):
+        """Builds a collision map with all board positions where any cell has
+        a collision.
+
+        Collision map covers the whole board width and all cell rows
+        currently in the board, and it can be shared between multiple
+        movement checks while the board does not change.
+
+        For all layers, the map is built from the blocked positions kept by
+        the board, and it is reused until the board version changes, so it
+        has to be handled as read-only. For any other layers, the map is
+        built traversing all cells in those layers every time.
+
+        Args:
+            layers (list) : list of layers to look for cells. Default is all\
+                    layers.
+
+        Returns:
+            CollisionMap : collision map for the board.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.point import Point
+            >>> board = Board(3, 5)
+            >>> for i, row in enumerate(reversed(board)):
+            ...     row.cellrow = i
+            >>> cell = BCell(3, 1, None)
+            >>> cell.walkable = False
+            >>> board.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> cmap = board.collision_map()
+            >>> cmap
+            CollisionMap(5x3 at (0, 0)): 1
+            >>> Point(0, 1).x_move_with_collision(cmap, 4, None, True)
+            (2, 1)
+            >>> len(board.collision_map([LType.SURFACE, ]))
+            0
+            >>> board.collision_map() is cmap
+            True
+            >>> board.remove_cell(cell)
+            True
+            >>> board.collision_map()
+            CollisionMap(5x3 at (0, 0)): 0
+        """
+        with self.lock:
+            if layers is None and self._cmap is not None and self._cmap[0] == self._version:
+                return self._cmap[1]
+            cellrows = [row.cellrow for row in self if row.cellrow is not None]
+            bottom = min(cellrows) if cellrows else 0
+            height = max(cellrows) - bottom + 1 if cellrows else 0
+            cmap = CollisionMap(self.width, height, 0, bottom)
+            if layers is None:
+                for position in self._blocked:
+                    cmap.add(position)
+                self._cmap = (self._version, cmap)
+            else:
+                for cell in self.get_cells_from_layer(layers):
+                    if cell.collision:
+                        cmap.add(cell)
+            return cmap
+
     def get_cell_by_id(self, id):
         """Returns a cell by the given ID.
 
@@ -298,12 +701,11 @@ class Board(Itero):
             >>> board.appendleft(row)
             >>> row.get_cell_by_id(c1.id) == c1
             True
+            >>> board.get_cell_by_id(c2.id) == c2
+            True
+            >>> board.get_cell_by_id(0)
         """
-        for _row in self:
-            _cell = _row.get_cell_by_id(id)
-            if _cell is not None:
-                return _cell
-        return None
+        return self._cells.get(id)
 
     def add_cell_to_layer(self, cell, layer):
         """Adds a new cell to the given layer.
@@ -317,8 +719,9 @@ class Board(Itero):
         >>> board[0][LType.SURFACE.value]
         [LType.SURFACE]  <0>   cell# 1
         """
-        row = self.get_row_from_cell_row(cell.row)
-        return row.add_cell_to_layer(cell, layer)
+        with self.lock:
+            row = self.get_row_from_cell_row(cell.row)
+            return row.add_cell_to_layer(cell, layer)
 
     def remove_cell(self, cell):
         """Removes a cell from the board.
@@ -335,9 +738,65 @@ class Board(Itero):
         >>> board[0][LType.SURFACE.value]
         [LType.SURFACE]  <0>   cell# 0
         """
-        cell_layer = cell.Layer
-        row = self.get_row_from_cell_row(cell.row)
-        return row.remove_cell_from_layer(cell, cell_layer)
+        with self.lock:
+            cell_layer = cell.Layer
+            row = self.get_row_from_cell_row(cell.row)
+            return row.remove_cell_from_layer(cell, cell_layer)
+
+    def move_cell(self, cell, direction, move_val):
+        """Moves a cell placed in the board, keeping the board indexes.
+
+        Cells placed in the board should always be moved with this method,
+        because it removes the cell from its position before moving it and
+        places it back again at the new position.
+
+        Args:
+            cell (BCell) : cell to move.
+            direction (Location) : direction the cell will be moved.
+            move_val (int) : number of cells the cell will be moved.
+
+        Returns:
+            bool : True if the cell was moved.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bpoint import BPoint, Location
+            >>> board = Board(2, 5)
+            >>> board[0].cellrow = 1
+            >>> board[1].cellrow = 0
+            >>> cell = BCell(0, 0, 'me')
+            >>> board.add_cell_to_layer(cell, LType.OBJECT)
+            True
+            >>> board.move_cell(cell, Location.RIGHT, 2)
+            True
+            >>> board.get_cells_at(BPoint(2, 0)) == [cell, ]
+            True
+            >>> board.move_cell(cell, Location.FRONT, 1)
+            True
+            >>> board.get_cells_at(BPoint(2, 1)) == [cell, ]
+            True
+            >>> board.get_cells_at(BPoint(2, 0))
+            []
+            >>> board.objects.query_rect(0, 0, 4, 0), board.objects.query_radius(BPoint(2, 0), 1) == [cell, ]
+            ([], True)
+        """
+        with self.lock:
+            cell_layer = cell.Layer
+            old_row = self.get_row_from_cell_row(cell.row)
+            assert old_row is not None
+            journal, self.journal = self.journal, None
+            try:
+                old_row.remove_cell_from_layer(cell, cell_layer)
+                cell.move_to(direction, move_val)
+                new_row = self.get_row_from_cell_row(cell.row)
+                assert new_row is not None
+                result = new_row.add_cell_to_layer(cell, cell_layer)
+            finally:
+                self.journal = journal
+            if journal is not None:
+                journal.cell_moved(cell)
+            return result
 
     def render(self, **kwargs):
         """Render the board.
@@ -358,15 +817,59 @@ class Board(Itero):
         """
         render = kwargs.get('render', BRender.DEFAULT)
         if render is BRender.TEXT:
-            st = ''
-            for row in self:
-                st += '{0} {1}\n'.format(row.cellrow, row.render(**kwargs))
-            return st
+            return ''.join(['{0} {1}\n'.format(row.cellrow, row.render(**kwargs)) for row in self])
         elif render is BRender.GRAPH:
             return [x.render(**kwargs) for x in self]
         else:
             raise NotImplementedError
 
+    def render_diff(self, **kwargs):
+        """Renders in text format only board lines that changed since the
+        last call.
+
+        Every changed line is returned as an ANSI escape sequence that moves
+        the cursor to the line in the terminal and redraws it. Rows that did
+        not change keep their cached text render, so they are compared
+        without being rendered again.
+
+        Keyword Args:
+            width (int) : Width for text rendering for cell width.
+            top (int) : Terminal line for the top board row. Default is 1.
+            full (bool) : True to redraw all lines. Default is False.
+
+        Returns:
+            str : ANSI escape sequences to update the terminal.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bsprite import TextSprite
+            >>> board = Board(2, 1)
+            >>> board[0].add_cell_to_layer(BCell(0, 1, 'b', sprite=TextSprite(sprite='b')), LType.SURFACE)
+            True
+            >>> board[1].add_cell_to_layer(BCell(0, 0, 'a', sprite=TextSprite(sprite='a')), LType.SURFACE)
+            True
+            >>> board.render_diff(width=1)
+            '\\x1b[1;1H1 b\\x1b[K\\x1b[2;1H0 a\\x1b[K'
+            >>> board.render_diff(width=1)
+            ''
+            >>> board[1][LType.SURFACE.value][0].sprite = TextSprite(sprite='c')
+            >>> board.render_diff(width=1)
+            '\\x1b[2;1H0 c\\x1b[K'
+        """
+        top = kwargs.pop('top', 1)
+        if kwargs.pop('full', False):
+            self._screen = []
+        kwargs['render'] = BRender.TEXT
+        screen = [(row.cellrow, row.render(**kwargs)) for row in self]
+        st = []
+        for index, line in enumerate(screen):
+            if index >= len(self._screen) or\
+                    self._screen[index][0] != line[0] or self._screen[index][1] is not line[1]:
+                st.append('\x1b[{0};1H{1} {2}\x1b[K'.format(top + index, line[0], line[1]))
+        self._screen = screen
+        return ''.join(st)
+
     def __repr__(self):
         """String representation for Board instance.
 
@@ -1,5 +1,5 @@
 from rpgrun.board.bcell import BCell
-from rpgrun.game.attr import Attributes
+from rpgrun.game.attr import Attributes, install_accessor
 
 
 @staticmethod
@@ -19,31 +19,68 @@ class BObject(BCell):
 
     def __init__(self, theX, theY, theName, **kwargs):
         """BObject class initialization method.
+
+        Keyword Args:
+            attrs (Attributes) : attributes for the object. Default is an\
+                    empty Attributes instance.
         """
         super(BObject, self).__init__(theX, theY, theName, **kwargs)
-        self.attrs = Attributes()
+        attrs = kwargs.get('attrs', None)
+        self.attrs = attrs if attrs is not None else Attributes()
         self.walkable = False
 
     def __getattr__(self, attr):
         """Overwrite __getattr__ method allowing to access values inside attrs
         as regular instance attributes.
 
+        An accessor is installed in the class the first time an attribute is
+        read, so next reads do not call this method.
+
         >>> from rpgrun.game.attr import Attr
         >>> obj = BObject(0, 0, 'new')
         >>> obj.add_attr(Attr('HP'))
         HP: 0/0
         >>> obj.HP
         0
+        >>> type(BObject.__dict__['HP'])
+        <class 'property'>
+        >>> other = BObject(0, 0, 'other')
+        >>> other.HP
+        <class 'AttributeError'>
+        >>> other.HP = 3
+        >>> other.HP
+        3
+        >>> try:
+        ...     obj.HP = 3
+        ... except AttributeError:
+        ...     print('AttributeError')
+        AttributeError
+
+        Special attributes are never looked up in attrs, so copy and pickle
+        protocols work as for any other instance.
+
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(obj)).attrs
+        HP: 0/0
         """
-        if 'attrs' in self.__dict__ and attr in self.__dict__['attrs']:
-            return self.attrs[attr].now
+        if attr.startswith('__'):
+            raise AttributeError(attr)
+        # Values set for any name with an accessor installed, in instances
+        # without that attribute, are kept in the instance dictionary.
+        if attr in self.__dict__:
+            return self.__dict__[attr]
+        attrs = self.__dict__.get('attrs')
+        if attrs is not None and attr in attrs:
+            install_accessor(self.__class__, attr, attrs)
+            return attrs[attr].now
         return AttributeError
 
     def __setattr__(self, attr, value):
         """Overwrite __setattr__ method so values from attrs can not be
         modified as instance attributes.
         """
-        if 'attrs' in self.__dict__ and attr in self.__dict__['attrs']:
+        attrs = self.__dict__.get('attrs')
+        if attrs is not None and attr in attrs:
             raise AttributeError
         else:
             super(BObject, self).__setattr__(attr, value)
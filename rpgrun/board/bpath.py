@@ -0,0 +1,704 @@
+import heapq
+from array import array
+from collections import deque
+from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import BPoint, Location
+
+UNREACHABLE = -1
+"""Distance for positions that can not be reached."""
+
+_MOVES = ((0, 1, Location.FRONT),
+          (0, -1, Location.BACK),
+          (-1, 0, Location.LEFT),
+          (1, 0, Location.RIGHT))
+
+
+_FREE = bytes.maketrans(b'\x00\x01', b'10')
+
+
+def _point(position):
+    """Returns the given position as a (x, y) tuple.
+    """
+    return position if type(position) is tuple else (position.x, position.y)
+
+
+class PathGrid(object):
+    """PathGrid class keeps a walkability grid for all rows in the board,
+    where every position with any cell with collision is blocked.
+
+    Moves are always one position to the front, back, left or right, as
+    cells are moved in the board.
+
+    Grid is refreshed lazily, when the board version changes, and only rows
+    that changed since the last refresh are built again, so scrolling the
+    board builds just the new row.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> board = Board(2, 3)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 1 - index
+        >>> wall = BCell(1, 0, 'wall')
+        >>> wall.walkable = False
+        >>> board.add_cell_to_layer(wall, LType.SURFACE)
+        True
+        >>> grid = PathGrid(board)
+        >>> grid.is_walkable(0, 0), grid.is_walkable(1, 0), grid.is_walkable(1, 2)
+        (True, False, False)
+        >>> revision = grid.revision
+        >>> _ = board.remove_cell(wall)
+        >>> grid.is_walkable(1, 0), grid.revision == revision + 1
+        (True, True)
+    """
+
+    def __init__(self, board, layers=None):
+        """PathGrid class initialization method.
+
+        Args:
+            board (Board) : board for the grid.
+            layers (list) : layers where cells can block positions. Default\
+                    is SURFACE and OBJECT layers.
+        """
+        self.board = board
+        self.layers = list(layers) if layers else [LType.SURFACE, LType.OBJECT]
+        self.width = board.width
+        self.height = 0
+        self.bottom = 0
+        self.revision = 0
+        self._blocked = bytearray()
+        self._bordered = None
+        self._rows = {}
+        self._version = None
+
+    def refresh(self, force=False):
+        """Updates the grid with all changes in the board.
+
+        Args:
+            force (bool) : True to build all rows again.
+
+        Returns:
+            bool : True if any position changed, False else.
+        """
+        board = self.board
+        with board.lock:
+            if board.version == self._version and not force:
+                return False
+            self._version = board.version
+            rows = dict([(x.cellrow, x) for x in board if x.cellrow is not None])
+            bottom = min(rows) if rows else 0
+            height = max(rows) - bottom + 1 if rows else 0
+            cache = {}
+            parts = []
+            for cellrow in range(bottom, bottom + height):
+                row = rows.get(cellrow)
+                if row is None:
+                    parts.append(b'\x01' * self.width)
+                    continue
+                entry = self._rows.get(cellrow)
+                if force or entry is None or entry[0] is not row or entry[1] != row.version:
+                    entry = (row, row.version, self._build_row(row))
+                cache[cellrow] = entry
+                parts.append(entry[2])
+        self._rows = cache
+        blocked = bytearray(b''.join(parts))
+        if bottom == self.bottom and height == self.height and blocked == self._blocked:
+            return False
+        self.bottom, self.height, self._blocked = bottom, height, blocked
+        self._bordered = None
+        self.revision += 1
+        return True
+
+    def _build_row(self, row):
+        """Returns blocked positions for the given row.
+        """
+        blocked = bytearray(self.width)
+        for cell in row.get_cells_from_layer(self.layers):
+            if self.blocks(cell) and 0 <= cell.x < self.width:
+                blocked[cell.x] = 1
+        return bytes(blocked)
+
+    def blocks(self, cell):
+        """Checks if the given cell blocks its position.
+
+        Args:
+            cell (BCell) : cell to check.
+
+        Returns:
+            bool : True if cell has collision.
+        """
+        return cell.collision
+
+    def bordered(self):
+        """Returns blocked positions with a blocked border around the grid.
+
+        Returns:
+            bytearray : blocked positions, with width + 2 positions per row.
+        """
+        self.refresh()
+        if self._bordered is None:
+            width = self.width
+            wall = b'\x01' * (width + 2)
+            parts = [wall]
+            for start in range(0, len(self._blocked), width):
+                parts.extend([b'\x01', self._blocked[start:start + width], b'\x01'])
+            parts.append(wall)
+            self._bordered = bytearray(b''.join(parts))
+        return self._bordered
+
+    def index(self, x, y):
+        """Returns the grid index for the given position.
+
+        Returns:
+            int : grid index, None if the position is out of the grid.
+        """
+        if 0 <= x < self.width and 0 <= y - self.bottom < self.height:
+            return (y - self.bottom) * self.width + x
+        return None
+
+    def position(self, index):
+        """Returns the position for the given grid index.
+
+        Returns:
+            tuple : (x, y) position.
+        """
+        y, x = divmod(index, self.width)
+        return (x, y + self.bottom)
+
+    def is_walkable(self, x, y):
+        """Checks if the given position can be walked.
+
+        Args:
+            x (int) : X-coordinate.
+            y (int) : Y-coordinate.
+
+        Returns:
+            bool : True if position is in the grid and it is not blocked.
+        """
+        self.refresh()
+        index = self.index(x, y)
+        return index is not None and not self._blocked[index]
+
+    def neighbors(self, index):
+        """Returns all walkable positions next to the given grid index.
+
+        Args:
+            index (int) : grid index.
+
+        Returns:
+            list : list of grid indexes.
+        """
+        width, blocked = self.width, self._blocked
+        x = index % width
+        result = []
+        for other, valid in ((index + width, index + width < len(blocked)),
+                             (index - width, index >= width),
+                             (index - 1, x > 0),
+                             (index + 1, x < width - 1)):
+            if valid and not blocked[other]:
+                result.append(other)
+        return result
+
+    def __repr__(self):
+        """String representation for the PathGrid instance.
+        """
+        return 'PathGrid({0}x{1} at {2}): {3} blocked'.format(self.width, self.height, self.bottom,
+                                                              self._blocked.count(1))
+
+
+class GridSet(object):
+    """GridSet class is a compact set of board positions, stored as a bitset
+    with one bit for every position in a grid.
+
+    Example:
+        >>> positions = GridSet(0b100010, 3, 5)
+        >>> len(positions), BPoint(1, 5) in positions, BPoint(2, 6) in positions, BPoint(0, 5) in positions
+        (2, True, True, False)
+        >>> list(positions)
+        [(1, 5), (2, 6)]
+    """
+
+    __slots__ = ('bits', 'width', 'bottom')
+
+    def __init__(self, bits, width, bottom):
+        """GridSet class initialization method.
+
+        Args:
+            bits (int) : bitset, with bit (y - bottom) * width + x set for\
+                    every position in the set.
+            width (int) : grid width.
+            bottom (int) : cell row for the first grid row.
+        """
+        self.bits = bits
+        self.width = width
+        self.bottom = bottom
+
+    def __contains__(self, point):
+        """Checks if the given position is in the set.
+
+        Args:
+            point (Point) : position to check.
+        """
+        if not 0 <= point.x < self.width or point.y < self.bottom:
+            return False
+        return bool(self.bits >> ((point.y - self.bottom) * self.width + point.x) & 1)
+
+    def __iter__(self):
+        """Returns all positions in the set, row by row from the bottom.
+        """
+        bits, index = self.bits, 0
+        while bits:
+            skip = (bits & -bits).bit_length() - 1
+            index += skip
+            y, x = divmod(index, self.width)
+            yield BPoint(x, y + self.bottom)
+            bits >>= skip + 1
+            index += 1
+
+    def __len__(self):
+        """Returns the number of positions in the set.
+        """
+        return bin(self.bits).count('1')
+
+    def __repr__(self):
+        """String representation for the GridSet instance.
+        """
+        return 'GridSet({0} positions)'.format(len(self))
+
+
+def free_rows(grid):
+    """Returns all grid rows as bitsets, with bit x set for every position
+    that is not blocked, from the bottom row.
+
+    Args:
+        grid (PathGrid) : grid to convert.
+
+    Returns:
+        list[int] : one bitset for every grid row.
+
+    Example:
+        >>> grid = PathGrid.__new__(PathGrid)
+        >>> grid.width, grid._blocked = 3, bytearray([0, 1, 0, 1, 1, 0])
+        >>> [bin(x) for x in free_rows(grid)]
+        ['0b101', '0b100']
+    """
+    width, blocked = grid.width, bytes(grid._blocked)
+    if not width:
+        return []
+    return [int(blocked[x:x + width].translate(_FREE)[::-1], 2) for x in range(0, len(blocked), width)]
+
+
+def _trace(grid, parents, index):
+    """Returns the path to the given grid index, following parents, with
+    all positions but the first one.
+    """
+    path = []
+    while parents[index] is not None:
+        path.append(index)
+        index = parents[index]
+    return [BPoint(*grid.position(x)) for x in reversed(path)]
+
+
+def astar(grid, start, goal):
+    """Looks for the shortest path between two positions with A*.
+
+    Start position can be blocked, like the position of the cell that is
+    moving.
+
+    Args:
+        grid (PathGrid) : walkability grid.
+        start (Point) : initial position.
+        goal (Point) : final position.
+
+    Returns:
+        list[BPoint] : all positions in the path, without the start\
+                position. None if the goal can not be reached.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> board = Board(3, 3)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 2 - index
+        >>> for x in range(2):
+        ...     wall = BCell(x, 1, 'wall')
+        ...     wall.walkable = False
+        ...     _ = board.add_cell_to_layer(wall, LType.SURFACE)
+        >>> astar(PathGrid(board), BPoint(0, 0), BPoint(0, 2))
+        [(1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+        >>> astar(PathGrid(board), BPoint(0, 0), BPoint(0, 1))
+    """
+    grid.refresh()
+    start_index, goal_index = grid.index(*_point(start)), grid.index(*_point(goal))
+    if start_index is None or goal_index is None or grid._blocked[goal_index]:
+        return None
+    width = grid.width
+    gx, gy = goal_index % width, goal_index // width
+    parents = {start_index: None}
+    costs = {start_index: 0}
+    heap = [(0, 0, 0, start_index)]
+    while heap:
+        _, _, cost, index = heapq.heappop(heap)
+        if index == goal_index:
+            return _trace(grid, parents, index)
+        if cost > costs[index]:
+            continue
+        cost += 1
+        for other in grid.neighbors(index):
+            if cost < costs.get(other, cost + 1):
+                costs[other] = cost
+                parents[other] = index
+                h = abs(other % width - gx) + abs(other // width - gy)
+                heapq.heappush(heap, (cost + h, h, cost, other))
+    return None
+
+
+class _Jumper(object):
+    """Jump helpers for jump point search in a 4-connected grid.
+
+    Paths are canonical when they move horizontally first, and they turn
+    from a vertical move into a horizontal one only when an obstacle just
+    behind that side ends, so most positions are skipped in a jump.
+
+    Positions are indexes in the grid with a blocked border, so jumps never
+    check grid bounds.
+    """
+
+    def __init__(self, grid, goal):
+        self.stride = grid.width + 2
+        self.blocked = grid.bordered()
+        self.goal = goal
+
+    def vertical(self, index, step):
+        blocked, goal = self.blocked, self.goal
+        while True:
+            index += step
+            if blocked[index]:
+                return None
+            if index == goal or (not blocked[index - 1] and blocked[index - 1 - step]) or\
+                    (not blocked[index + 1] and blocked[index + 1 - step]):
+                return index
+
+    def horizontal(self, index, step):
+        blocked, goal, stride, vertical = self.blocked, self.goal, self.stride, self.vertical
+        while True:
+            index += step
+            if blocked[index]:
+                return None
+            if index == goal or vertical(index, stride) is not None or vertical(index, -stride) is not None:
+                return index
+
+    def successors(self, index, parent):
+        stride, blocked = self.stride, self.blocked
+        if parent is None:
+            jumps = [self.horizontal(index, -1), self.horizontal(index, 1),
+                     self.vertical(index, -stride), self.vertical(index, stride)]
+        elif abs(index - parent) < stride:
+            step = 1 if index > parent else -1
+            jumps = [self.horizontal(index, step), self.vertical(index, -stride), self.vertical(index, stride)]
+        else:
+            step = stride if index > parent else -stride
+            jumps = [self.vertical(index, step)]
+            for side in (-1, 1):
+                if not blocked[index + side] and blocked[index + side - step]:
+                    jumps.append(self.horizontal(index, side))
+        return [x for x in jumps if x is not None]
+
+
+def jps(grid, start, goal):
+    """Looks for the shortest path between two positions with jump point
+    search.
+
+    It finds paths as short as the ones found by A*, but it only keeps jump
+    points in the open list, so it is faster in open areas.
+
+    Args:
+        grid (PathGrid) : walkability grid.
+        start (Point) : initial position.
+        goal (Point) : final position.
+
+    Returns:
+        list[BPoint] : all positions in the path, without the start\
+                position. None if the goal can not be reached.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> board = Board(3, 3)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 2 - index
+        >>> for x in range(2):
+        ...     wall = BCell(x, 1, 'wall')
+        ...     wall.walkable = False
+        ...     _ = board.add_cell_to_layer(wall, LType.SURFACE)
+        >>> jps(PathGrid(board), BPoint(0, 0), BPoint(0, 2))
+        [(1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+    """
+    grid.refresh()
+    start_index, goal_index = grid.index(*_point(start)), grid.index(*_point(goal))
+    if start_index is None or goal_index is None or grid._blocked[goal_index]:
+        return None
+    stride, bottom = grid.width + 2, grid.bottom
+    sx, sy = _point(start)
+    gx, gy = _point(goal)
+    node = (sy - bottom + 1) * stride + sx + 1
+    goal = (gy - bottom + 1) * stride + gx + 1
+    jumper = _Jumper(grid, goal)
+    parents = {node: None}
+    costs = {node: 0}
+    heap = [(0, 0, 0, node)]
+    while heap:
+        _, _, cost, node = heapq.heappop(heap)
+        if node == goal:
+            break
+        if cost > costs[node]:
+            continue
+        for other in jumper.successors(node, parents[node]):
+            y, x = divmod(other, stride)
+            other_cost = cost + abs(other - node) // (stride if abs(other - node) >= stride else 1)
+            if other_cost < costs.get(other, other_cost + 1):
+                costs[other] = other_cost
+                parents[other] = node
+                h = abs(x - 1 - gx) + abs(y - 1 + bottom - gy)
+                heapq.heappush(heap, (other_cost + h, h, other_cost, other))
+    else:
+        return None
+    path = []
+    while parents[node] is not None:
+        parent = parents[node]
+        step = (stride if abs(node - parent) >= stride else 1) * (1 if node > parent else -1)
+        while node != parent:
+            y, x = divmod(node, stride)
+            path.append(BPoint(x - 1, y - 1 + bottom))
+            node -= step
+    path.reverse()
+    return path
+
+
+class FlowField(object):
+    """FlowField class keeps the distance from every position in the grid to
+    the closest target, computed with a Dijkstra search from all targets at
+    once. Every move costs the same, so it is a breadth-first search.
+
+    Any number of cells can follow the flow field to their closest target,
+    looking up the next step for their position.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> board = Board(3, 4)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 2 - index
+        >>> field = FlowField(PathGrid(board), [BPoint(0, 2), BPoint(3, 0)])
+        >>> field.distance(BPoint(2, 1)), field.distance(BPoint(0, 0))
+        (2, 2)
+        >>> field.next_step(BPoint(2, 1)), field.path(BPoint(0, 0))
+        ((2, 0), [(0, 1), (0, 2)])
+    """
+
+    def __init__(self, grid, targets):
+        """FlowField class initialization method.
+
+        Args:
+            grid (PathGrid) : walkability grid.
+            targets (list) : list of target positions. Targets can be blocked,\
+                    like positions for cells that are targeted.
+        """
+        grid.refresh()
+        self.grid = grid
+        self.revision = grid.revision
+        self.distances = array('i', [UNREACHABLE]) * len(grid._blocked)
+        distances = self.distances
+        queue = deque()
+        for target in targets:
+            index = grid.index(*_point(target))
+            if index is not None and distances[index] == UNREACHABLE:
+                distances[index] = 0
+                queue.append(index)
+        neighbors = grid.neighbors
+        while queue:
+            index = queue.popleft()
+            distance = distances[index] + 1
+            for other in neighbors(index):
+                if distances[other] == UNREACHABLE:
+                    distances[other] = distance
+                    queue.append(other)
+
+    def distance(self, position):
+        """Returns the distance from the given position to the closest
+        target.
+
+        Position can be blocked, like the position of the cell that is
+        moving.
+
+        Args:
+            position (Point) : position to check.
+
+        Returns:
+            int : distance. UNREACHABLE if no target can be reached.
+        """
+        grid = self.grid
+        index = grid.index(*_point(position))
+        if index is None:
+            return UNREACHABLE
+        distance = self.distances[index]
+        if distance == UNREACHABLE and grid._blocked[index]:
+            x, y = _point(position)
+            near = [self.distances[other] for other in [grid.index(x + dx, y + dy) for dx, dy, _ in _MOVES]
+                    if other is not None and self.distances[other] != UNREACHABLE]
+            if near:
+                distance = min(near) + 1
+        return distance
+
+    def next_step(self, position):
+        """Returns the next position to move to the closest target.
+
+        Args:
+            position (Point) : current position.
+
+        Returns:
+            BPoint : next position. None if no target can be reached or the\
+                    position is a target.
+        """
+        x, y = _point(position)
+        grid, distances = self.grid, self.distances
+        best, best_distance = None, self.distance((x, y))
+        if best_distance <= 0:
+            return None
+        for dx, dy, _ in _MOVES:
+            index = grid.index(x + dx, y + dy)
+            if index is not None and 0 <= distances[index] < best_distance:
+                best, best_distance = (x + dx, y + dy), distances[index]
+        return BPoint(*best) if best is not None else None
+
+    def path(self, position):
+        """Returns the path from the given position to the closest target.
+
+        Args:
+            position (Point) : initial position.
+
+        Returns:
+            list[BPoint] : all positions in the path, without the initial\
+                    position. None if no target can be reached.
+        """
+        if self.distance(position) == UNREACHABLE:
+            return None
+        path = []
+        step = self.next_step(position)
+        while step is not None:
+            path.append(step)
+            step = self.next_step(step)
+        return path
+
+
+class PathFinder(object):
+    """PathFinder class looks for paths in the board, keeping a walkability
+    grid and all flow fields computed, until the grid changes.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> board = Board(3, 3)
+        >>> for index, row in enumerate(board):
+        ...     row.cellrow = 2 - index
+        >>> finder = PathFinder(board)
+        >>> finder.path(BPoint(0, 0), BPoint(2, 1))
+        [(1, 0), (2, 0), (2, 1)]
+        >>> finder.flow_field([BPoint(2, 2)]) is finder.flow_field([BPoint(2, 2)])
+        True
+        >>> rock = BCell(1, 0, 'rock')
+        >>> rock.walkable = False
+        >>> _ = board.add_cell_to_layer(rock, LType.OBJECT)
+        >>> finder.path(BPoint(0, 0), BPoint(2, 1), jump=True)
+        [(0, 1), (1, 1), (2, 1)]
+        >>> finder.moves(BPoint(0, 0), BPoint(2, 1))
+        [(<Location.FRONT: (1, 0)>, 1), (<Location.RIGHT: (4, 0)>, 2)]
+    """
+
+    def __init__(self, board, layers=None):
+        """PathFinder class initialization method.
+
+        Args:
+            board (Board) : board where paths are looked for.
+            layers (list) : layers where cells can block positions. Default\
+                    is SURFACE and OBJECT layers.
+        """
+        self.grid = PathGrid(board, layers)
+        self._fields = {}
+
+    def path(self, start, goal, jump=False):
+        """Returns the shortest path between two positions.
+
+        Args:
+            start (Point) : initial position.
+            goal (Point) : final position.
+            jump (bool) : True to use jump point search, False to use A*.
+
+        Returns:
+            list[BPoint] : all positions in the path, without the start\
+                    position. None if the goal can not be reached.
+        """
+        return (jps if jump else astar)(self.grid, start, goal)
+
+    def flow_field(self, targets):
+        """Returns the flow field to the given targets.
+
+        Flow fields are kept until the grid changes, so all cells moving to
+        the same targets share it.
+
+        Args:
+            targets (list) : list of target positions.
+
+        Returns:
+            FlowField : flow field to the targets.
+        """
+        if self.grid.refresh():
+            self._fields.clear()
+        key = frozenset([_point(x) for x in targets])
+        field = self._fields.get(key)
+        if field is None:
+            field = self._fields[key] = FlowField(self.grid, key)
+        return field
+
+    def moves(self, start, goal, jump=False):
+        """Returns the shortest path between two positions as a list of
+        moves.
+
+        Args:
+            start (Point) : initial position.
+            goal (Point) : final position.
+            jump (bool) : True to use jump point search, False to use A*.
+
+        Returns:
+            list : list of (Location, int) moves. None if the goal can not\
+                    be reached.
+        """
+        path = self.path(start, goal, jump)
+        return None if path is None else path_to_moves(start, path)
+
+
+def path_to_moves(start, path):
+    """Returns the given path as a list of moves, where every move is a
+    direction and a number of positions, as cells are moved in the board.
+
+    Args:
+        start (Point) : initial position.
+        path (list) : all positions in the path, without the start position.
+
+    Returns:
+        list : list of (Location, int) moves.
+
+    Example:
+        >>> path_to_moves(BPoint(0, 0), [BPoint(1, 0), BPoint(2, 0), BPoint(2, -1)])
+        [(<Location.RIGHT: (4, 0)>, 2), (<Location.BACK: (2, 0)>, 1)]
+    """
+    locations = dict([((dx, dy), location) for dx, dy, location in _MOVES])
+    moves = []
+    x, y = _point(start)
+    for position in path:
+        location = locations[(position.x - x, position.y - y)]
+        if moves and moves[-1][0] is location:
+            moves[-1][1] += 1
+        else:
+            moves.append([location, 1])
+        x, y = position.x, position.y
+    return [tuple(x) for x in moves]
@@ -137,18 +137,12 @@ class BPoint(Point):
     functinality for a point on a board.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y):
         """BPoint class initialization method.
         """
         super(BPoint, self).__init__(x, y)
-        self._moveCb = {Location.FRONT: self.move_to_front,
-                        Location.BACK: self.move_to_back,
-                        Location.LEFT: self.move_to_left,
-                        Location.RIGHT: self.move_to_right,
-                        Location.FRONT_LEFT: None,
-                        Location.FRONT_RIGHT: None,
-                        Location.BACK_LEFT: None,
-                        Location.BACK_RIGHT: None}
 
     def is_front(self, other):
         """Checks if the point is in front of the given point.
@@ -360,4 +354,15 @@ class BPoint(Point):
         if cb is None:
             return self
         else:
-            return cb(move_val)
+            return cb(self, move_val)
+
+    # Move callbacks are shared by all instances, so they are not created for
+    # every new point.
+    _moveCb = {Location.FRONT: move_to_front,
+               Location.BACK: move_to_back,
+               Location.LEFT: move_to_left,
+               Location.RIGHT: move_to_right,
+               Location.FRONT_LEFT: None,
+               Location.FRONT_RIGHT: None,
+               Location.BACK_LEFT: None,
+               Location.BACK_RIGHT: None}
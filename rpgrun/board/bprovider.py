@@ -0,0 +1,218 @@
+import queue
+import threading
+from collections import deque
+
+
+class RowProvider(object):
+    """RowProvider class produces new rows for the board from a source,
+    which is any iterator yielding BRow instances, like a generator.
+
+    Rows are built lazily, only when they are required or when they are
+    prefetched. When a background worker is used, the given number of rows
+    are built ahead in a worker thread, so the game loop does not wait for
+    them when the board scrolls.
+
+    Rows scrolled out of the board are handed back to the provider, so they
+    can be reused by the source.
+
+    Example:
+        >>> from rpgrun.board.brow import BRow
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.blayer import LType
+        >>> def rows(provider, cellrow):
+        ...     while True:
+        ...         row = BRow(2)
+        ...         for x in range(2):
+        ...             row.add_cell_to_layer(BCell(x, cellrow, 'floor'), LType.SURFACE)
+        ...         cellrow += 1
+        ...         yield row
+        >>> provider = RowProvider.from_generator(rows, 5, prefetch=2)
+        >>> [provider.next_row().cellrow for _ in range(3)]
+        [5, 6, 7]
+        >>> provider.close()
+    """
+
+    def __init__(self, source, prefetch=0, background=True):
+        """RowProvider class initialization method.
+
+        Args:
+            source (iterator) : iterator yielding new rows.
+            prefetch (int) : number of rows to build ahead. No row is built\
+                    ahead when it is zero.
+            background (bool) : True to build rows ahead in a worker\
+                    thread, False to build them when they are required.
+        """
+        self.source = iter(source)
+        self.prefetch = prefetch
+        self._queue = None
+        self._worker = None
+        self._stop = threading.Event()
+        if prefetch and background:
+            self._queue = queue.Queue(prefetch)
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    @classmethod
+    def from_generator(cls, generator, *args, **kwargs):
+        """Creates a new provider with a generator function as the source.
+
+        Generator is called with the new provider and the given arguments.
+
+        Args:
+            generator (function) : generator function yielding new rows.
+            args (list) : arguments for the generator.
+
+        Keyword Args:
+            prefetch (int) : number of rows to build ahead.
+            background (bool) : True to build rows in a worker thread.
+
+        Returns:
+            RowProvider : new provider.
+        """
+        provider = cls.__new__(cls)
+        cls.__init__(provider, _Deferred(generator, provider, args), **kwargs)
+        return provider
+
+    def _run(self):
+        """Builds rows ahead in the worker thread, until the source is
+        exhausted or the provider is closed.
+        """
+        for row in self.source:
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(row, timeout=0.1)
+                    break
+                except queue.Full:
+                    pass
+            if self._stop.is_set():
+                return
+        self._queue.put(None)
+
+    def next_row(self):
+        """Returns the next row from the source.
+
+        Returns:
+            BRow : new row. None if the source is exhausted.
+        """
+        if self._queue is None:
+            return next(self.source, None)
+        return self._queue.get()
+
+    def recycle(self, row):
+        """Hands back a row scrolled out of the board.
+
+        Rows are not kept by default, derived classes can keep them to be
+        reused.
+
+        Args:
+            row (BRow) : row scrolled out of the board.
+        """
+        pass
+
+    def close(self):
+        """Stops the background worker.
+        """
+        self._stop.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def __iter__(self):
+        """Returns rows until the source is exhausted.
+
+        >>> provider = RowProvider(iter([1, 2]), prefetch=1)
+        >>> list(provider)
+        [1, 2]
+        """
+        row = self.next_row()
+        while row is not None:
+            yield row
+            row = self.next_row()
+
+
+class RowPool(object):
+    """RowPool class keeps rows scrolled out of the board, so row sources
+    can reuse them, with their layers and the cells in the kept layers,
+    instead of building new rows.
+
+    Rows are reset when they are added to the pool, so any cell that is not
+    kept is released at once. Board adds rows to the pool holding the board
+    lock, so row sources running in a background worker have to take rows
+    from the pool holding the board lock too.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.brow import BRow
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.blayer import LType
+        >>> board = Board(2, 2)
+        >>> board.pool = RowPool(keep=[LType.SURFACE])
+        >>> for index, row in enumerate(board):
+        ...     _ = row.add_cell_to_layer(BCell(0, 1 - index, 'floor'), LType.SURFACE)
+        >>> bottom = board[1]
+        >>> board.pool.get(2)
+        >>> board.scroll(board.pool.get(2) or BRow(2))
+        >>> row = board.pool.get(3)
+        >>> row is bottom, row.cellrow, row.get_cells_from_layer(), len(board.pool)
+        (True, 3, [(0, 3) : floor], 0)
+    """
+
+    def __init__(self, maxlen=8, keep=()):
+        """RowPool class initialization method.
+
+        Args:
+            maxlen (int) : maximum number of rows kept.
+            keep (list) : layers where cells are kept for reuse.
+        """
+        self.keep = tuple(keep)
+        self._rows = deque(maxlen=maxlen)
+
+    def put(self, row):
+        """Adds a row scrolled out of the board to the pool.
+
+        Args:
+            row (BRow) : row to add.
+        """
+        row.reset(None, self.keep)
+        self._rows.append(row)
+
+    def get(self, cellrow):
+        """Takes a row from the pool, placed at the given cell row.
+
+        Args:
+            cellrow (int) : cell row for the row.
+
+        Returns:
+            BRow : reused row. None if the pool is empty.
+        """
+        try:
+            row = self._rows.pop()
+        except IndexError:
+            return None
+        row.reset(cellrow, self.keep)
+        return row
+
+    def __len__(self):
+        """Returns the number of rows in the pool.
+        """
+        return len(self._rows)
+
+
+class _Deferred(object):
+    """Iterator that calls a generator function the first time it is
+    iterated, so the generator can receive the provider it feeds.
+    """
+
+    def __init__(self, generator, provider, args):
+        self._generator = generator
+        self._provider = provider
+        self._args = args
+        self._iterator = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._iterator is None:
+            self._iterator = iter(self._generator(self._provider, *self._args))
+        return next(self._iterator)
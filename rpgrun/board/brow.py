@@ -2,6 +2,7 @@ from collections import OrderedDict
 from rpgrun.common.itero import Itero
 from rpgrun.board.blayer import BLayer, LType
 from rpgrun.board.brender import BRender
+from rpgrun.board.bsnapshot import RowSnapshot
 
 
 class BRow(Itero):
@@ -13,8 +14,18 @@ class BRow(Itero):
 
     Every layer in the row  contains a number of cells, provided
     as the maxlen if the Row.
+
+    Layers below the OBJECT layer are static layers, they are not expected
+    to change often, so they can be rendered once and reused. The static
+    version is increased every time any cell in a static layer changes.
     """
 
+    STATIC_LAYERS = (LType.HIDDEN, LType.UNDER, LType.SURFACE)
+    """Layers rendered once and reused until any of their cells changes."""
+
+    DYNAMIC_LAYERS = (LType.OBJECT, LType.OVER, LType.MASK)
+    """Layers rendered every frame."""
+
     def __init__(self, maxlen):
         """BRow class initialization method.
 
@@ -25,7 +36,14 @@ class BRow(Itero):
         super(BRow, self).__init__(BLayer, maxlen)
         for layer in LType:
             self._Itero__stream.append(BLayer(layer, maxlen))
+            self._Itero__stream[-1].row = self
         self._cellrow = None
+        self.board = None
+        self._dirty = True
+        self._render_cache = {}
+        self._static_version = 0
+        self._version = 0
+        self._snapshot = None
 
     @property
     def Width(self):
@@ -60,10 +78,16 @@ class BRow(Itero):
 
     @cellrow.setter
     def cellrow(self, theValue):
-        """Set _cellrow attribute value
+        """Set _cellrow attribute value.
+
+        The board the row belongs to is notified the first time the value is
+        set, so the row can be indexed by its cellrow.
         """
         if self._cellrow is None:
             self._cellrow = theValue
+            self._version += 1
+            if self.board is not None:
+                self.board._index_row(self)
         else:
             assert self._cellrow == theValue
 
@@ -159,13 +183,54 @@ class BRow(Itero):
         2
         >>> row.clear_layer(LType.SURFACE)
         True
-        >>> len(row[LType.SURFACE.value])
-        0
+        >>> len(row[LType.SURFACE.value]), len(row), row[LType.SURFACE.value].type
+        (0, 6, <LType.SURFACE: 2>)
         """
-        for index in range(len(self[layer.value])):
-            del self[layer.value]
+        cells = self[layer.value]
+        while len(cells):
+            cells.pop()
         return True
 
+    def reset(self, cellrow=None, keep=()):
+        """Resets the row, so it can be reused as a new row.
+
+        Cells in the given layers are kept and moved to the new cell row, if
+        it is provided, any other cell is removed at once. Row has to be removed from the
+        board before it is reset.
+
+        Args:
+            cellrow (int) : new cell row for the row.
+            keep (list) : layers where cells are kept.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> row = BRow(2)
+            >>> floor = BCell(0, 4, 'floor')
+            >>> row.add_cell_to_layer(floor, LType.SURFACE)
+            True
+            >>> row.add_cell_to_layer(BCell(1, 4, 'orc'), LType.OBJECT)
+            True
+            >>> version = row.version
+            >>> row.reset(9, keep=[LType.SURFACE])
+            >>> row.cellrow, floor.y, row.get_cells_from_layer(), row.version > version
+            (9, 9, [(0, 9) : floor], True)
+            >>> row.get_cells_at(floor)
+            [(0, 9) : floor]
+        """
+        assert self.board is None
+        for layer in self.stream:
+            if layer.type in keep:
+                layer.cellrow = cellrow if len(layer) else None
+                if cellrow is not None:
+                    for cell in layer:
+                        cell.y = cellrow
+            else:
+                layer.reset()
+        self._cellrow = cellrow
+        self._version += 1
+        self._snapshot = None
+        self.set_dirty()
+
     def get_cells_from_layer(self, layers=None):
         """Returns all cells from the given layer.
 
@@ -218,10 +283,11 @@ class BRow(Itero):
             True
         """
         cells = []
-        for layer in [x for x in self if layers is None or x.type in layers]:
-            cell = layer.get_cell_at(point)
-            if cell:
-                cells.append(cell)
+        for layer in self.stream:
+            if layers is None or layer.type in layers:
+                cell = layer.get_cell_at(point)
+                if cell:
+                    cells.append(cell)
         return cells
 
     def get_cell_by_id(self, id):
@@ -246,12 +312,160 @@ class BRow(Itero):
             >>> row.get_cell_by_id(c1.id) == c1
             True
         """
-        for layer in self:
-            cell = layer.get_cell_by_id(id)
+        for layer in self.stream:
+            cell = layer._ids.get(id)
             if cell is not None:
                 return cell
         return None
 
+    @property
+    def dirty(self):
+        """Gets _dirty attribute value.
+
+        Row is dirty when it has changed since the last time it was
+        rendered.
+
+        Returns:
+            bool : True if row has to be rendered again, False else.
+        """
+        return self._dirty
+
+    @property
+    def static_version(self):
+        """Gets _static_version attribute value.
+
+        Static version changes every time any cell in a static layer is
+        added, removed or changed, so any render for static layers has to be
+        rendered again.
+
+        Returns:
+            int : static layers version.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> row = BRow(2)
+            >>> version = row.static_version
+            >>> row.add_cell_to_layer(BCell(0, 0, 'obj'), LType.OBJECT)
+            True
+            >>> row.static_version == version
+            True
+            >>> row.add_cell_to_layer(BCell(0, 0, 'floor'), LType.SURFACE)
+            True
+            >>> row.static_version == version
+            False
+        """
+        return self._static_version
+
+    @property
+    def version(self):
+        """Gets _version attribute value.
+
+        Version changes every time the cellrow is set, any cell is added to
+        or removed from any layer in the row, or any cell in the row changes
+        its walkable or solid flags.
+
+        Returns:
+            int : row version.
+        """
+        return self._version
+
+    def snapshot(self):
+        """Returns a read-only copy of all cells in the row.
+
+        Copy is reused until the row version changes, so board snapshots
+        share all rows that did not change.
+
+        Returns:
+            RowSnapshot : row snapshot.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> row = BRow(2)
+            >>> row.add_cell_to_layer(BCell(0, 0, 'floor'), LType.SURFACE)
+            True
+            >>> snap = row.snapshot()
+            >>> row.snapshot() is snap
+            True
+            >>> row.add_cell_to_layer(BCell(1, 0, 'obj'), LType.OBJECT)
+            True
+            >>> row.snapshot() is snap, len(snap.cells()), len(row.snapshot().cells())
+            (False, 1, 2)
+        """
+        snap = self._snapshot
+        if snap is None or snap.version != self._version:
+            snap = RowSnapshot(self)
+            self._snapshot = snap
+        return snap
+
+    def set_dirty(self, layer=None):
+        """Sets the row as dirty, so the cached render is discarded.
+
+        Args:
+            layer (BLayer) : layer that changed. Static version is increased\
+                    if the layer is a static layer or no layer is provided.
+        """
+        self._dirty = True
+        self._render_cache.clear()
+        if layer is None or layer.type in self.STATIC_LAYERS:
+            self._static_version += 1
+
+    def _cell_added(self, layer, cell):
+        """Notifies the board the row belongs to that a cell was added.
+
+        It is called by the layer where the cell was added.
+
+        Args:
+            layer (BLayer) : layer where the cell was added.
+            cell (BCell) : cell added.
+        """
+        self._version += 1
+        self.set_dirty(layer)
+        if self.board is not None:
+            self.board._cell_added(self, cell)
+
+    def _cell_changed(self, layer, cell):
+        """Notifies the board the row belongs to that a cell placed in the
+        row has changed its walkable or solid flags.
+
+        It is called by the cell that changed.
+
+        Args:
+            layer (BLayer) : layer where the cell is placed.
+            cell (BCell) : cell changed.
+        """
+        self._version += 1
+        if self.board is not None:
+            self.board._cell_changed(self, cell)
+
+    def _cell_moved(self, layer, cell):
+        """Notifies the board the row belongs to that a cell placed in the
+        row has moved.
+
+        It is called by the layer where the cell is placed.
+
+        Args:
+            layer (BLayer) : layer where the cell is placed.
+            cell (BCell) : cell moved.
+        """
+        self._version += 1
+        self.set_dirty(layer)
+        if self.board is not None:
+            self.board._cell_moved(self, cell)
+
+    def _cell_removed(self, layer, cell):
+        """Notifies the board the row belongs to that a cell was removed.
+
+        It is called by the layer where the cell was removed.
+
+        Args:
+            layer (BLayer) : layer where the cell was removed.
+            cell (BCell) : cell removed.
+        """
+        self._version += 1
+        self.set_dirty(layer)
+        if self.board is not None:
+            self.board._cell_removed(self, cell)
+
     def row_to_string(self):
         """Returns string with row representation
 
@@ -275,30 +489,77 @@ class BRow(Itero):
         When rendering in graph format, we have to pass the row position with
         x and y values, so sprites are properly located, and it has to return
         a list of sprites, which should be included in a sprite group from the
-        graphical framework.
+        graphical framework. Rendered layers can be limited in graph format,
+        so static layers can be rendered apart from dynamic layers.
+
+        Text rendering is cached until the row changes, which happens when
+        any cell is added or removed, or when any cell sprite changes.
 
         Keyword Args:
             render (BRender) : Render type (graphical or text).
             width (int) : Width for text rendering for cell width.
+            layers (list) : list of layers for graph rendering. Default is\
+                    all layers.
 
         Returns:
             object : Instance to be rendered.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.bsprite import TextSprite, GraphSprite
+            >>> row = BRow(2)
+            >>> row.add_cell_to_layer(BCell(0, 0, 'a', sprite=TextSprite(sprite='a')), LType.SURFACE)
+            True
+            >>> row.add_cell_to_layer(BCell(1, 0, 'b', sprite=TextSprite(sprite='b')), LType.SURFACE)
+            True
+            >>> row.add_cell_to_layer(BCell(1, 0, 'c', sprite=TextSprite(sprite='c')), LType.OBJECT)
+            True
+            >>> row.render(width=3)
+            ' a   c '
+            >>> row.render(width=3) is row.render(width=3)
+            True
+            >>> row[LType.OBJECT.value][0].sprite.hidden = True
+            >>> row.render(width=3)
+            ' a   b '
+            >>> row[LType.OBJECT.value][0].sprite = GraphSprite(sprite='C')
+            >>> list(row.render(render=BRender.GRAPH, layers=BRow.DYNAMIC_LAYERS).values())
+            ['C']
         """
         render = kwargs.get('render', BRender.DEFAULT)
-        cells = OrderedDict()
-        for layer in [x for x in self if len(x)]:
-            for cell in layer:
-                key = '{0},{1}'.format(cell.col, cell.row)
-                cells.update({key: cell.render(render)})
         if render is BRender.TEXT:
             width = kwargs.get('width', 5)
-            cell_str = ['{0}'.format(x.center(width)) for x in cells.values()]
-            return " ".join(cell_str)
+            text = self._render_cache.get(width)
+            if text is None:
+                cell_str = [x.center(width) for x in self._render_cells(render).values()]
+                text = " ".join(cell_str)
+                self._render_cache[width] = text
+            self._dirty = False
+            return text
         elif render is BRender.GRAPH:
-            return cells
+            return self._render_cells(render, kwargs.get('layers'))
         else:
             raise NotImplementedError
 
+    def _render_cells(self, render, layers=None):
+        """Renders all cells in the row. Cells in higher layers are rendered
+        over cells in lower layers at the same position. Cells without
+        render, like hidden cells, are skipped.
+
+        Args:
+            render (BRender) : Render type (graphical or text).
+            layers (list) : list of layers to render. Default is all layers.
+
+        Returns:
+            OrderedDict : rendered cells by position.
+        """
+        cells = OrderedDict()
+        for layer in [x for x in self if len(x) and (layers is None or x.type in layers)]:
+            for cell in layer:
+                rendered = cell.render(render)
+                if rendered is not None:
+                    cells[(cell.col, cell.row)] = rendered
+        return cells
+
     def __repr__(self):
         """String representation for BRow instance.
 
@@ -1,6 +1,70 @@
 import abc
+import functools
 from rpgrun.board.bpoint import BPoint
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@functools.lru_cache(maxsize=256)
+def _footprint(klass, width, height):
+    """Returns the footprint for the given shape class and dimensions.
+
+    Footprint is computed only once for every shape class and dimensions and
+    it is shared by all shape instances.
+
+    Args:
+        klass (class) : Shape class.
+        width (int) : Shape width dimension (x-axis).
+        height (int) : Shape height dimension (y-axis).
+
+    Returns:
+        tuple : tuple with ordered offsets, relative to the shape center, and\
+                a frozenset with the same offsets.
+    """
+    offsets = tuple(klass._footprint_offsets(width, height))
+    return offsets, frozenset(offsets)
+
+
+@functools.lru_cache(maxsize=256)
+def _stencil(klass, width, height):
+    """Returns the footprint for the given shape class and dimensions as a
+    boolean array.
+
+    Args:
+        klass (class) : Shape class.
+        width (int) : Shape width dimension (x-axis).
+        height (int) : Shape height dimension (y-axis).
+
+    Returns:
+        tuple : boolean array indexed by [y, x] offsets, plus the X-axis and\
+                the Y-axis offsets for the array origin.
+    """
+    x_range, y_range = _half_ranges(width, height)
+    stencil = numpy.zeros((len(y_range), len(x_range)), dtype=bool)
+    for x, y in _footprint(klass, width, height)[0]:
+        stencil[y - y_range[0], x - x_range[0]] = True
+    stencil.setflags(write=False)
+    return stencil, x_range[0], y_range[0]
+
+
+def _half_ranges(width, height):
+    """Returns offsets, relative to the shape center, for the rectangle that
+    contains a shape.
+
+    Args:
+        width (int) : Shape width dimension (x-axis).
+        height (int) : Shape height dimension (y-axis).
+
+    Returns:
+        tuple : range with X-axis offsets and range with Y-axis offsets.
+    """
+    half_width = int(width / 2)
+    half_height = int(height / 2)
+    return (range(-half_width, half_width + 1), range(-half_height, half_height + 1))
+
 
 class Shape(abc.ABC):
     """Shape class is an abstract class that provides an interface to be
@@ -70,17 +134,122 @@ class Shape(abc.ABC):
         """
         raise NotImplementedError
 
+    @classmethod
     @abc.abstractmethod
+    def _footprint_offsets(cls, width, height):
+        """Returns all offsets, relative to the shape center, for points
+        contained in the shape.
+
+        Args:
+            width (int) : Shape width dimension (x-axis).
+            height (int) : Shape height dimension (y-axis).
+
+        Returns:
+            list : list of (x, y) tuples with offsets.
+        """
+        raise NotImplementedError
+
+    @property
+    def footprint(self):
+        """Gets all offsets, relative to the shape center, for points
+        contained in the shape.
+
+        Returns:
+            tuple : tuple with (x, y) offsets.
+        """
+        return _footprint(self.__class__, self.width, self.height)[0]
+
     def is_inside(self, other):
         """Checks if the given point is inside the shape.
+
+        Args:
+            other (Point) : point to check.
+
+        Returns:
+            bool : True if point is inside the shape, False else.
         """
-        raise NotImplementedError
+        return (other.x - self.center.x, other.y - self.center.y) in\
+            _footprint(self.__class__, self.width, self.height)[1]
 
-    @abc.abstractmethod
     def get_all_points_inside(self):
         """Returns all points contained in the shape.
+
+        Returns:
+            list[BPoint] : list with all points.
         """
-        raise NotImplementedError
+        x, y = self.center.x, self.center.y
+        return [BPoint(x + dx, y + dy) for dx, dy in self.footprint]
+
+    def is_inside_many(self, points):
+        """Checks if all given points are inside the shape.
+
+        Args:
+            points (numpy.ndarray) : (N, 2) integer array, or any sequence\
+                    of (x, y) pairs, with points to check.
+
+        Returns:
+            numpy.ndarray : boolean array with N entries, True for any point\
+                    inside the shape.
+
+        Raises:
+            NotImplementedError : when numpy is not available.
+
+        Example:
+            >>> q = Quad(BPoint(10, 10), 2, 2)
+            >>> q.is_inside_many([(9, 9), (11, 12), (10, 11), (0, 0)]).tolist()
+            [True, False, True, False]
+            >>> len(q.is_inside_many([]))
+            0
+        """
+        if numpy is None:
+            raise NotImplementedError
+        stencil, x_origin, y_origin = _stencil(self.__class__, self.width, self.height)
+        points = numpy.asarray(points, dtype=numpy.int64).reshape(-1, 2)
+        xs = points[:, 0] - (self.center.x + x_origin)
+        ys = points[:, 1] - (self.center.y + y_origin)
+        valid = (xs >= 0) & (xs < stencil.shape[1]) & (ys >= 0) & (ys < stencil.shape[0])
+        result = numpy.zeros(len(points), dtype=bool)
+        result[valid] = stencil[ys[valid], xs[valid]]
+        return result
+
+    def mask(self, width, height, origin=None):
+        """Returns a boolean mask with all points in a window that are inside
+        the shape.
+
+        Args:
+            width (int) : window width.
+            height (int) : window height.
+            origin (Point) : window bottom-left position. Default is (0, 0).
+
+        Returns:
+            numpy.ndarray : (height, width) boolean array indexed by [y, x]\
+                    relative to the window origin.
+
+        Raises:
+            NotImplementedError : when numpy is not available.
+
+        Example:
+            >>> s = Star(BPoint(1, 1), 2, 2)
+            >>> s.mask(4, 3).astype(int).tolist()
+            [[0, 1, 0, 0], [1, 1, 1, 0], [0, 1, 0, 0]]
+            >>> s.mask(2, 2, BPoint(1, 1)).astype(int).tolist()
+            [[1, 1], [1, 0]]
+        """
+        if numpy is None:
+            raise NotImplementedError
+        origin_x, origin_y = (origin.x, origin.y) if origin else (0, 0)
+        stencil, x_origin, y_origin = _stencil(self.__class__, self.width, self.height)
+        result = numpy.zeros((height, width), dtype=bool)
+        # Stencil position relative to the window, and the overlapping area
+        # between both.
+        left = self.center.x + x_origin - origin_x
+        bottom = self.center.y + y_origin - origin_y
+        x_from, x_to = max(left, 0), min(left + stencil.shape[1], width)
+        y_from, y_to = max(bottom, 0), min(bottom + stencil.shape[0], height)
+        if x_from < x_to and y_from < y_to:
+            result[y_from:y_to, x_from:x_to] = stencil[y_from - bottom:y_to - bottom,
+                                                       x_from - left:x_to - left]
+        return result
 
 
 class Quad(Shape):
@@ -140,9 +309,7 @@ class Quad(Shape):
         >>> q.is_inside(BPoint(13, 11)), q.is_inside(BPoint(10, 5))
         (False, False)
         """
-        top_left, top_right, botton_left, bottom_right = self.get_corners()
-        return (top_left.x <= other.x <= top_right.x) and\
-               (bottom_right.y <= other.y <= top_right.y)
+        return super(Quad, self).is_inside(other)
 
     def get_all_points_inside(self):
         """Returns all points contained in the shape.
@@ -151,12 +318,18 @@ class Quad(Shape):
         >>> q.get_all_points_inside()
         [(9, 9), (9, 10), (9, 11), (10, 9), (10, 10), (10, 11), (11, 9), (11, 10), (11, 11)]
         """
-        all_points = []
-        top_left, top_right, botton_left, bottom_right = self.get_corners()
-        for x in range(top_left.x, top_right.x + 1):
-            for y in range(bottom_right.y, top_right.y + 1):
-                all_points.append(BPoint(x, y))
-        return all_points
+        return super(Quad, self).get_all_points_inside()
+
+    @classmethod
+    def _footprint_offsets(cls, width, height):
+        """Returns all offsets, relative to the center, for points contained
+        in a quad.
+
+        >>> Quad._footprint_offsets(2, 1)
+        [(-1, 0), (0, 0), (1, 0)]
+        """
+        x_range, y_range = _half_ranges(width, height)
+        return [(x, y) for x in x_range for y in y_range]
 
 
 class Rectangle(Quad):
@@ -321,15 +494,7 @@ class Rhomboid(Shape):
         >>> r.is_inside(BPoint(3, 5)), r.is_inside(BPoint(3, 6)), r.is_inside(BPoint(3, 7)), r.is_inside(BPoint(3, 8))
         (True, True, False, False)
         """
-        top, bottom, left, right = self.get_corners()
-        if other in [top, bottom, left, right]:
-            return True
-        else:
-            half_width = int(self.width / 2)
-            half_height = int(self.height / 2)
-            p = other.xy_translate(-self.center.x, -self.center.y)
-            return (abs(p.x) < half_width) and (abs(p.y) < half_height) and\
-                   (abs(p.y) <= (half_width - abs(p.x)))
+        return super(Rhomboid, self).is_inside(other)
 
     def get_all_points_inside(self):
         """Returns all points contained in the shape.
@@ -338,14 +503,23 @@ class Rhomboid(Shape):
         >>> r.get_all_points_inside()
         [(8, 10), (9, 9), (9, 10), (9, 11), (10, 8), (10, 9), (10, 10), (10, 11), (10, 12), (11, 9), (11, 10), (11, 11), (12, 10)]
         """
-        all_points = []
-        top_left, top_right, botton_left, bottom_right = self.get_rects()[0]
-        for x in range(top_left.x, top_right.x + 1):
-            for y in range(bottom_right.y, top_right.y + 1):
-                bp = BPoint(x, y)
-                if self.is_inside(bp):
-                    all_points.append(bp)
-        return all_points
+        return super(Rhomboid, self).get_all_points_inside()
+
+    @classmethod
+    def _footprint_offsets(cls, width, height):
+        """Returns all offsets, relative to the center, for points contained
+        in a rhomboid.
+
+        >>> Rhomboid._footprint_offsets(2, 2)
+        [(-1, 0), (0, -1), (0, 0), (0, 1), (1, 0)]
+        """
+        x_range, y_range = _half_ranges(width, height)
+        corners = [(0, y_range[-1]), (0, y_range[0]), (x_range[0], 0), (x_range[-1], 0)]
+        half_width = int(width / 2)
+        half_height = int(height / 2)
+        return [(x, y) for x in x_range for y in y_range
+                if (x, y) in corners or
+                ((abs(x) < half_width) and (abs(y) < half_height) and (abs(y) <= (half_width - abs(x))))]
 
 
 class Star(Rhomboid):
@@ -392,9 +566,7 @@ class Star(Rhomboid):
         >>> s.is_inside(BPoint(11, 10)), s.is_inside(BPoint(12, 10)), s.is_inside(BPoint(13, 10))
         (True, True, False)
         """
-        top, bottom, left, right = self.get_corners()
-        return ((other.x == self.center.x) and (bottom.y <= other.y <= top.y)) or\
-               ((other.y == self.center.y) and (left.x <= other.x <= right.x))
+        return super(Star, self).is_inside(other)
 
     def get_all_points_inside(self):
         """Returns all points contained in the shape.
@@ -403,11 +575,16 @@ class Star(Rhomboid):
         >>> s.get_all_points_inside()
         [(9, 10), (11, 10), (10, 9), (10, 11), (10, 10)]
         """
-        top, bottom, left, right = self.get_corners()
-        all_points = []
-        for x in [val for val in range(left.x, right.x + 1) if val != self.center.x]:
-            all_points.append(BPoint(x, self.center.y))
-        for y in [val for val in range(bottom.y, top.y + 1) if val != self.center.y]:
-            all_points.append(BPoint(self.center.x, y))
-        all_points.append(BPoint(self.center.x, self.center.y))
-        return all_points
+        return super(Star, self).get_all_points_inside()
+
+    @classmethod
+    def _footprint_offsets(cls, width, height):
+        """Returns all offsets, relative to the center, for points contained
+        in a star.
+
+        >>> Star._footprint_offsets(2, 2)
+        [(-1, 0), (1, 0), (0, -1), (0, 1), (0, 0)]
+        """
+        x_range, y_range = _half_ranges(width, height)
+        return [(x, 0) for x in x_range if x != 0] +\
+            [(0, y) for y in y_range if y != 0] + [(0, 0)]
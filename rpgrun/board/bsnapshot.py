@@ -0,0 +1,174 @@
+from collections import namedtuple
+from types import MappingProxyType
+from rpgrun.board.collision import CollisionMap
+
+CellView = namedtuple('CellView', ['id', 'name', 'x', 'y', 'layer', 'collision'])
+CellView.__doc__ = '''CellView contains a read-only copy of a cell placed in the board.
+
+    id (int) : cell ID.
+    name (str) : cell name.
+    x (int) : cell X-coordinate.
+    y (int) : cell Y-coordinate.
+    layer (LType) : layer where the cell is placed.
+    collision (bool) : True if the cell has a collision.
+'''
+
+
+class RowSnapshot(object):
+    """RowSnapshot class contains a read-only copy of all cells in a row.
+
+    Row snapshots are shared between board snapshots while the row does not
+    change.
+    """
+
+    __slots__ = ('cellrow', 'version', 'layers')
+
+    def __init__(self, row):
+        """RowSnapshot class initialization method.
+
+        Args:
+            row (BRow) : row to copy.
+
+        Example:
+            >>> from rpgrun.board.brow import BRow
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.blayer import LType
+            >>> row = BRow(3)
+            >>> row.add_cell_to_layer(BCell(1, 4, 'rock'), LType.OBJECT)
+            True
+            >>> snap = RowSnapshot(row)
+            >>> snap.cellrow, [(x.name, x.x, x.y, x.layer) for x in snap.cells()]
+            (4, [('rock', 1, 4, <LType.OBJECT: 3>)])
+        """
+        self.cellrow = row.cellrow
+        self.version = row.version
+        self.layers = tuple([tuple([CellView(cell.id, cell.name, cell.x, cell.y, layer.type, cell.collision)
+                                    for cell in layer])
+                             for layer in row.stream])
+
+    def cells(self, layers=None):
+        """Returns all cells in the given layers.
+
+        Args:
+            layers (list) : list of layers. Default is all layers.
+
+        Returns:
+            list : list with CellView instances.
+        """
+        cells = []
+        for layer in self.layers:
+            cells.extend([x for x in layer if layers is None or x.layer in layers])
+        return cells
+
+    def get_cells_at(self, x, layers=None):
+        """Returns all cells at the given X-coordinate.
+
+        Args:
+            x (int) : X-coordinate.
+            layers (list) : list of layers. Default is all layers.
+
+        Returns:
+            list : list with CellView instances.
+        """
+        return [cell for cell in self.cells(layers) if cell.x == x]
+
+
+class BoardSnapshot(object):
+    """BoardSnapshot class contains a read-only copy of all rows, layers and
+    cell positions in the board at a given board version.
+
+    Snapshots are never modified, so they can be read from any thread while
+    the board keeps changing.
+    """
+
+    __slots__ = ('version', 'width', 'rows', '_rows', '_cells')
+
+    def __init__(self, version, width, rows):
+        """BoardSnapshot class initialization method.
+
+        Args:
+            version (int) : board version.
+            width (int) : board width.
+            rows (list) : list of RowSnapshot instances, from top to bottom.
+        """
+        self.version = version
+        self.width = width
+        self.rows = tuple(rows)
+        self._rows = MappingProxyType(dict([(x.cellrow, x) for x in self.rows if x.cellrow is not None]))
+        self._cells = None
+
+    def get_row_from_cell_row(self, cellrow):
+        """Returns the row snapshot for the given cellrow.
+
+        Args:
+            cellrow (int) : cell row.
+
+        Returns:
+            RowSnapshot : row snapshot. None if cell row is not in the board.
+        """
+        return self._rows.get(cellrow)
+
+    def get_cells_at(self, point, layers=None):
+        """Returns all cells at the position for the given point.
+
+        Args:
+            point (BPoint) : point or (x, y) tuple to look for cells.
+            layers (list) : list of layers. Default is all layers.
+
+        Returns:
+            list : list with CellView instances.
+        """
+        x, y = point if type(point) is tuple else (point.x, point.y)
+        row = self._rows.get(y)
+        return row.get_cells_at(x, layers) if row is not None else []
+
+    def cells(self, layers=None):
+        """Returns all cells in the given layers.
+
+        Args:
+            layers (list) : list of layers. Default is all layers.
+
+        Returns:
+            list : list with CellView instances.
+        """
+        cells = []
+        for row in self.rows:
+            cells.extend(row.cells(layers))
+        return cells
+
+    def get_cell_by_id(self, id):
+        """Returns the cell with the given ID.
+
+        Args:
+            id (int) : cell ID.
+
+        Returns:
+            CellView : cell. None if there is not any cell with that ID.
+        """
+        if self._cells is None:
+            self._cells = MappingProxyType(dict([(x.id, x) for x in self.cells()]))
+        return self._cells.get(id)
+
+    def collision_map(self, layers=None):
+        """Builds a collision map with all positions where any cell has a
+        collision.
+
+        Args:
+            layers (list) : list of layers. Default is all layers.
+
+        Returns:
+            CollisionMap : collision map for the snapshot.
+        """
+        cellrows = list(self._rows)
+        bottom = min(cellrows) if cellrows else 0
+        height = max(cellrows) - bottom + 1 if cellrows else 0
+        cmap = CollisionMap(self.width, height, 0, bottom)
+        for cell in self.cells(layers):
+            if cell.collision:
+                cmap.add((cell.x, cell.y))
+        return cmap
+
+    def __repr__(self):
+        """String representation for the BoardSnapshot instance.
+        """
+        return 'BoardSnapshot(v{0}): {1} rows'.format(self.version, len(self.rows))
@@ -0,0 +1,182 @@
+import itertools
+from rpgrun.board.bshapes import _footprint
+
+
+class SpatialHash(object):
+    """SpatialHash class indexes cells by position in square buckets, so
+    cells in a given area are found without traversing all cells.
+
+    Cells returned by any query are ordered as they are found traversing
+    the board, from the top row to the bottom row, and in every row in the
+    same order they were added.
+
+    Cell positions are read when cells are added, so cells have to be
+    removed before they are moved and added again after that.
+
+    Example:
+        >>> from rpgrun.board.bcell import BCell
+        >>> index = SpatialHash(4)
+        >>> cells = [BCell(x, y, '{0}{1}'.format(x, y)) for x in range(0, 12, 3) for y in range(0, 12, 3)]
+        >>> for cell in cells:
+        ...     index.add(cell)
+        >>> [x.name for x in index.query_rect(2, 2, 6, 4)]
+        ['33', '63']
+        >>> [x.name for x in index.query_radius(BCell(6, 6, None), 3)]
+        ['69', '36', '66', '96', '63']
+    """
+
+    def __init__(self, size=8):
+        """SpatialHash class initialization method.
+
+        Args:
+            size (int) : bucket width and height.
+        """
+        self.size = size
+        self._buckets = {}
+        self._cells = {}
+        self._order = itertools.count()
+
+    def _key(self, x, y):
+        """Returns the bucket key for the given position.
+        """
+        return (x // self.size, y // self.size)
+
+    def add(self, cell):
+        """Adds a cell to the index, at its current position.
+
+        Args:
+            cell (BCell) : cell to add.
+        """
+        if cell.id in self._cells:
+            self.remove(cell)
+        key = self._key(cell.x, cell.y)
+        self._cells[cell.id] = (key, next(self._order), cell)
+        self._buckets.setdefault(key, {})[cell.id] = cell
+
+    def remove(self, cell):
+        """Removes a cell from the index.
+
+        Args:
+            cell (BCell) : cell to remove.
+
+        Returns:
+            bool : True if cell was removed, False if it was not in the index.
+        """
+        entry = self._cells.pop(cell.id, None)
+        if entry is None:
+            return False
+        bucket = self._buckets[entry[0]]
+        del bucket[cell.id]
+        if not bucket:
+            del self._buckets[entry[0]]
+        return True
+
+    def clear(self):
+        """Removes all cells from the index.
+        """
+        self._buckets.clear()
+        self._cells.clear()
+
+    def _sorted(self, cells):
+        """Returns the given cells in board order.
+        """
+        entries = self._cells
+        return sorted(cells, key=lambda x: (-x.y, entries[x.id][1]))
+
+    def _candidates(self, x_from, y_from, x_to, y_to):
+        """Yields all cells in buckets that overlap the given rectangle.
+        """
+        (bx_from, by_from), (bx_to, by_to) = self._key(x_from, y_from), self._key(x_to, y_to)
+        buckets = self._buckets
+        if (bx_to - bx_from + 1) * (by_to - by_from + 1) > len(buckets):
+            keys = [k for k in buckets if bx_from <= k[0] <= bx_to and by_from <= k[1] <= by_to]
+        else:
+            keys = [(bx, by) for bx in range(bx_from, bx_to + 1) for by in range(by_from, by_to + 1)]
+        for key in keys:
+            bucket = buckets.get(key)
+            if bucket:
+                yield from bucket.values()
+
+    def query_rect(self, x_from, y_from, x_to, y_to):
+        """Returns all cells in the given rectangle, borders included.
+
+        Args:
+            x_from (int) : left X-coordinate.
+            y_from (int) : bottom Y-coordinate.
+            x_to (int) : right X-coordinate.
+            y_to (int) : top Y-coordinate.
+
+        Returns:
+            list : list of cells.
+        """
+        return self._sorted([c for c in self._candidates(x_from, y_from, x_to, y_to)
+                             if x_from <= c.x <= x_to and y_from <= c.y <= y_to])
+
+    def query_radius(self, center, radius):
+        """Returns all cells at the given distance or closer from the given
+        center.
+
+        Args:
+            center (Point) : center position.
+            radius (int) : maximum distance.
+
+        Returns:
+            list : list of cells.
+        """
+        x, y = center.x, center.y
+        radius2 = radius * radius
+        return self._sorted([c for c in self._candidates(x - radius, y - radius, x + radius, y + radius)
+                             if (c.x - x) ** 2 + (c.y - y) ** 2 <= radius2])
+
+    def query_shape(self, shape):
+        """Returns all cells inside the given shape.
+
+        Args:
+            shape (Shape) : shape to look for cells.
+
+        Returns:
+            list : list of cells.
+
+        Example:
+            >>> from rpgrun.board.bcell import BCell
+            >>> from rpgrun.board.bpoint import BPoint
+            >>> from rpgrun.board.bshapes import Rhomboid
+            >>> index = SpatialHash(2)
+            >>> for x in range(5):
+            ...     index.add(BCell(x, x, str(x)))
+            >>> [x.name for x in index.query_shape(Rhomboid(BPoint(2, 2), 2, 2))]
+            ['2']
+            >>> [x.name for x in index.query_shape(Rhomboid(BPoint(2, 1), 2, 2))]
+            ['2', '1']
+        """
+        offsets, inside = _footprint(shape.__class__, shape.width, shape.height)
+        if not offsets:
+            return []
+        x, y = shape.center.x, shape.center.y
+        xs = [dx for dx, _ in offsets]
+        ys = [dy for _, dy in offsets]
+        return self._sorted([c for c in self._candidates(x + min(xs), y + min(ys), x + max(xs), y + max(ys))
+                             if (c.x - x, c.y - y) in inside])
+
+    def cells(self):
+        """Returns all cells in the index.
+
+        Returns:
+            list : list of cells.
+        """
+        return self._sorted([x[2] for x in self._cells.values()])
+
+    def __contains__(self, cell):
+        """Checks if the given cell is in the index.
+        """
+        return cell.id in self._cells
+
+    def __len__(self):
+        """Returns the number of cells in the index.
+        """
+        return len(self._cells)
+
+    def __repr__(self):
+        """String representation for the SpatialHash instance.
+        """
+        return 'SpatialHash({0}): {1} cells in {2} buckets'.format(self.size, len(self._cells), len(self._buckets))
@@ -12,6 +12,7 @@ class BSprite(object):
             sprite (object) : sprite instance for rendering.
         """
         self.sprite = kwargs.get('sprite', None)
+        self.cell = None
         self._selected = False
         self._enabled = True
         self._hidden = False
@@ -43,6 +44,7 @@ class BSprite(object):
             value (bool) : New value for _selected attribute.
         """
         self._selected = value
+        self._changed()
 
     @property
     def enabled(self):
@@ -70,6 +72,7 @@ class BSprite(object):
             value (bool) : New value for _enabled attribute.
         """
         self._enabled = value
+        self._changed()
 
     @property
     def hidden(self):
@@ -97,6 +100,7 @@ class BSprite(object):
             value (bool) : New value for _hidden attribute.
         """
         self._hidden = value
+        self._changed()
 
     @property
     def in_focus(self):
@@ -124,6 +128,13 @@ class BSprite(object):
             value (bool) : New value for _in_focus attribute.
         """
         self._in_focus = value
+        self._changed()
+
+    def _changed(self):
+        """Notifies the cell using the sprite that the sprite has changed.
+        """
+        if self.cell is not None:
+            self.cell.notify_changed()
 
     def get(self, brender=BRender.DEFAULT):
         """Gets the sprite to render based on the render type.
@@ -16,6 +16,8 @@ class BSurface(BCell):
     functionality for cells in the SURFACE layer.
     """
 
+    __slots__ = ()
+
     def __init__(self, x, y, name, **kwargs):
         """BSurface class initialization method.
         """
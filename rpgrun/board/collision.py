@@ -0,0 +1,254 @@
+class CollisionMap(object):
+    """CollisionMap class represents a bitmap with all blocked positions in a
+    rectangular area.
+
+    Positions are stored twice, in row-major and in column-major order, so the
+    first blocked position along the X-axis or the Y-axis is resolved with a
+    single search in a contiguous buffer.
+
+    Positions out of the map area are never blocked.
+    """
+
+    def __init__(self, width, height, x=0, y=0):
+        """CollisionMap class initialization method.
+
+        Args:
+            width (int) : map width.
+            height (int) : map height.
+            x (int) : X-coordinate for the map origin (default = 0).
+            y (int) : Y-coordinate for the map origin (default = 0).
+
+        Example:
+            >>> cmap = CollisionMap(5, 3)
+            >>> cmap.width, cmap.height, len(cmap)
+            (5, 3, 0)
+        """
+        self.width = width
+        self.height = height
+        self.x = x
+        self.y = y
+        self._rows = bytearray(width * height)
+        self._cols = bytearray(width * height)
+        self._len = 0
+
+    @classmethod
+    def from_points(cls, points, width=None, height=None, x=0, y=0):
+        """Creates a new instance with all given points blocked.
+
+        Map area along any axis is computed from the given points when its
+        size is not provided.
+
+        Args:
+            points (list) : list of Point instances or (x, y) tuples.
+            width (int) : map width.
+            height (int) : map height.
+            x (int) : X-coordinate for the map origin (default = 0).
+            y (int) : Y-coordinate for the map origin (default = 0).
+
+        Returns:
+            CollisionMap : new instance with all points blocked.
+
+        Example:
+            >>> from rpgrun.board.point import Point
+            >>> cmap = CollisionMap.from_points([Point(2, 1), (4, 3)])
+            >>> cmap.x, cmap.y, cmap.width, cmap.height
+            (2, 1, 3, 3)
+            >>> Point(2, 1) in cmap, (4, 3) in cmap, (3, 3) in cmap
+            (True, True, False)
+            >>> cmap = CollisionMap.from_points([Point(2, 1), (4, 3)], 10)
+            >>> cmap.x, cmap.y, cmap.width, cmap.height
+            (0, 1, 10, 3)
+        """
+        points = [_to_tuple(p) for p in points]
+        if width is None:
+            x = min([p[0] for p in points]) if points else 0
+            width = max([p[0] for p in points]) - x + 1 if points else 0
+        if height is None:
+            y = min([p[1] for p in points]) if points else 0
+            height = max([p[1] for p in points]) - y + 1 if points else 0
+        instance = cls(width, height, x, y)
+        for point in points:
+            instance.add(point)
+        return instance
+
+    def _is_inside(self, x, y):
+        """Checks if the given position is in the map area.
+
+        Args:
+            x (int) : X-coordinate.
+            y (int) : Y-coordinate.
+
+        Returns:
+            bool : True if position is in the map area, False else.
+        """
+        return (self.x <= x < self.x + self.width) and (self.y <= y < self.y + self.height)
+
+    def _set(self, point, value):
+        """Sets the given value for the given position.
+
+        Args:
+            point (Point) : Point instance or (x, y) tuple.
+            value (int) : 1 to block the position, 0 to release it.
+
+        Returns:
+            bool : True if position value changed, False else.
+        """
+        x, y = _to_tuple(point)
+        if not self._is_inside(x, y):
+            return False
+        row_index = (y - self.y) * self.width + x - self.x
+        if self._rows[row_index] == value:
+            return False
+        self._rows[row_index] = value
+        self._cols[(x - self.x) * self.height + y - self.y] = value
+        self._len += 1 if value else -1
+        return True
+
+    def add(self, point):
+        """Blocks the given position.
+
+        Args:
+            point (Point) : Point instance or (x, y) tuple.
+
+        Returns:
+            bool : True if position was blocked, False if it was already\
+                    blocked or it is out of the map area.
+
+        Example:
+            >>> cmap = CollisionMap(5, 5)
+            >>> cmap.add((1, 1)), cmap.add((1, 1)), cmap.add((5, 1))
+            (True, False, False)
+            >>> len(cmap)
+            1
+        """
+        return self._set(point, 1)
+
+    def remove(self, point):
+        """Releases the given position.
+
+        Args:
+            point (Point) : Point instance or (x, y) tuple.
+
+        Returns:
+            bool : True if position was released, False if it was not blocked.
+
+        Example:
+            >>> cmap = CollisionMap(5, 5)
+            >>> cmap.add((1, 1))
+            True
+            >>> cmap.remove((1, 1)), cmap.remove((1, 1))
+            (True, False)
+            >>> (1, 1) in cmap
+            False
+        """
+        return self._set(point, 0)
+
+    def x_ray(self, x, y, steps):
+        """Looks for the first blocked position moving one step at a time in
+        the positive X-axis direction.
+
+        Args:
+            x (int) : initial X-coordinate, not included in the search.
+            y (int) : Y-coordinate.
+            steps (int) : number of steps to move.
+
+        Returns:
+            int : number of steps to the first blocked position. None if\
+                    there is not any blocked position.
+
+        Example:
+            >>> cmap = CollisionMap.from_points([(3, 0), (6, 0)], 10, 1)
+            >>> cmap.x_ray(0, 0, 10), cmap.x_ray(3, 0, 2), cmap.x_ray(3, 0, 3)
+            (3, None, 3)
+            >>> cmap.x_ray(-5, 0, 8), cmap.x_ray(0, 1, 10)
+            (8, None)
+        """
+        if not (self.y <= y < self.y + self.height):
+            return None
+        start = max(x + 1, self.x)
+        stop = min(x + steps, self.x + self.width - 1)
+        if start > stop:
+            return None
+        base = (y - self.y) * self.width - self.x
+        index = self._rows.find(1, base + start, base + stop + 1)
+        return None if index < 0 else index - base - x
+
+    def y_ray(self, x, y, steps):
+        """Looks for the first blocked position moving one step at a time in
+        the positive Y-axis direction.
+
+        Args:
+            x (int) : X-coordinate.
+            y (int) : initial Y-coordinate, not included in the search.
+            steps (int) : number of steps to move.
+
+        Returns:
+            int : number of steps to the first blocked position. None if\
+                    there is not any blocked position.
+
+        Example:
+            >>> cmap = CollisionMap.from_points([(0, 3), (0, 6)], 1, 10)
+            >>> cmap.y_ray(0, 0, 10), cmap.y_ray(0, 3, 2), cmap.y_ray(0, 3, 3)
+            (3, None, 3)
+        """
+        if not (self.x <= x < self.x + self.width):
+            return None
+        start = max(y + 1, self.y)
+        stop = min(y + steps, self.y + self.height - 1)
+        if start > stop:
+            return None
+        base = (x - self.x) * self.height - self.y
+        index = self._cols.find(1, base + start, base + stop + 1)
+        return None if index < 0 else index - base - y
+
+    def __contains__(self, point):
+        """Checks if the given position is blocked.
+
+        Args:
+            point (Point) : Point instance or (x, y) tuple.
+
+        Returns:
+            bool : True if position is blocked, False else.
+        """
+        x, y = _to_tuple(point)
+        if not self._is_inside(x, y):
+            return False
+        return self._rows[(y - self.y) * self.width + x - self.x] == 1
+
+    def __len__(self):
+        """Returns the number of blocked positions.
+
+        Returns:
+            int : number of blocked positions.
+        """
+        return self._len
+
+    def __repr__(self):
+        """String representation for the CollisionMap instance.
+
+        Returns:
+            str : string with the CollisionMap instance representation.
+
+        Example:
+            >>> CollisionMap.from_points([(1, 1)], 3, 2, 0, 0)
+            CollisionMap(3x2 at (0, 0)): 1
+        """
+        return 'CollisionMap({0}x{1} at ({2}, {3})): {4}'.format(self.width,
+                                                                self.height,
+                                                                self.x,
+                                                                self.y,
+                                                                self._len)
+
+
+def _to_tuple(point):
+    """Returns the given position as a (x, y) tuple.
+
+    Args:
+        point (Point) : Point instance or (x, y) tuple.
+
+    Returns:
+        tuple : tuple with X-coordinate and Y-coordinate.
+    """
+    if type(point) is tuple:
+        return point
+    return (point.x, point.y)
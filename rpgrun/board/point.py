@@ -1,6 +1,32 @@
 import math
 
 from rpgrun.common.range import Range
+from rpgrun.board.collision import CollisionMap
+
+
+def _collision_lookup(collisions):
+    """Returns a lookup that can be used to check collisions in constant time.
+
+    Lists and tuples are converted to a set with (x, y) tuples. Sets and
+    CollisionMap instances are returned as they are, so they can be built
+    once and shared between multiple movements.
+
+    Args:
+        collisions (list[Point]) : list or tuple of Points, set with (x, y)\
+        tuples or FrozenPoints, or CollisionMap instance.
+
+    Returns:
+        object : set or CollisionMap instance.
+
+    Raises:
+        NotImplementedError
+    """
+    if type(collisions) in (set, frozenset) or isinstance(collisions, CollisionMap):
+        return collisions
+    elif type(collisions) in (list, tuple) and collisions:
+        return {(p.x, p.y) for p in collisions}
+    else:
+        raise NotImplementedError
 
 
 class Point(object):
@@ -17,8 +43,12 @@ class Point(object):
 
     Move operations update the original point (self) with given values for
     X and Y coordinates.
+
+    Coordinates are stored in slots, so instances do not carry a dictionary.
     """
 
+    __slots__ = ('_x', '_y')
+
     def __init__(self, x, y):
         """Point class initialization method.
 
@@ -291,7 +321,7 @@ class Point(object):
             False
         """
         if isinstance(other, Point):
-            return self.is_x_eq(other) and self.is_y_eq(other)
+            return self._x == other._x and self._y == other._y
         return NotImplemented
 
     def __neq__(self, other):
@@ -544,7 +574,7 @@ class Point(object):
             (4, 6)
         """
         if isinstance(other, Point):
-            return self.klass(self.x + other.x, self.y + other.y)
+            return self.klass(self._x + other._x, self._y + other._y)
         return NotImplemented
 
     def __sub__(self, other):
@@ -564,7 +594,55 @@ class Point(object):
             (9, 9)
         """
         if isinstance(other, Point):
-            return self.klass(self.x - other.x, self.y - other.y)
+            return self.klass(self._x - other._x, self._y - other._y)
+        return NotImplemented
+
+    def __iadd__(self, other):
+        """Overload in-place addition operation between two Point instances.
+
+        The point is updated in place, no new Point instance is created.
+
+        Args:
+            other (Point) : the other point for the addition.
+
+        Returns:
+            Point : self point updated with the addition.
+
+        Example:
+            >>> p = Point(1, 1)
+            >>> q = p
+            >>> p += Point(1, 2)
+            >>> p, p is q
+            ((2, 3), True)
+        """
+        if isinstance(other, Point):
+            self._x += other._x
+            self._y += other._y
+            return self
+        return NotImplemented
+
+    def __isub__(self, other):
+        """Overload in-place substract operation between two Point instances.
+
+        The point is updated in place, no new Point instance is created.
+
+        Args:
+            other (Point) : the other point for the substraction.
+
+        Returns:
+            Point : self point updated with the substraction.
+
+        Example:
+            >>> p = Point(1, 1)
+            >>> q = p
+            >>> p -= Point(2, 0)
+            >>> p, p is q
+            ((-1, 1), True)
+        """
+        if isinstance(other, Point):
+            self._x -= other._x
+            self._y -= other._y
+            return self
         return NotImplemented
 
     def distance(self, other):
@@ -585,7 +663,7 @@ class Point(object):
             NotImplementedError
         """
         if isinstance(other, Point):
-            return math.hypot(other.x - self.x, other.y - self.y)
+            return math.hypot(other._x - self._x, other._y - self._y)
         raise NotImplementedError
 
     def distance_as_int(self, other):
@@ -723,7 +801,7 @@ class Point(object):
             >>> p.x_translate(10)
             (10, 0)
         """
-        return self + self.klass(int(x), 0)
+        return self.klass(self._x + int(x), self._y)
 
     def y_translate(self, y):
         """Returns a new translated point by the given Y-coordinate.
@@ -739,7 +817,7 @@ class Point(object):
             >>> p.y_translate(5)
             (0, 5)
         """
-        return self + self.klass(0, int(y))
+        return self.klass(self._x, self._y + int(y))
 
     def xy_translate(self, x, y):
         """Returns a new translated point by the given X-coordinate and
@@ -757,7 +835,7 @@ class Point(object):
             >>> p.xy_translate(1, 5)
             (1, 5)
         """
-        return self + self.klass(int(x), int(y))
+        return self.klass(self._x + int(x), self._y + int(y))
 
     def _move(self, attr, value):
         """Add a value to other. Used in move operations.
@@ -791,7 +869,7 @@ class Point(object):
             >>> p.x_move(2).x_move()
             (6, 1)
         """
-        self.x = self._move(self.x, x)
+        self._x += int(x)
         return self
 
     def y_move(self, y=1):
@@ -812,7 +890,7 @@ class Point(object):
             >>> p.y_move(2).y_move()
             (1, 6)
         """
-        self.y = self._move(self.y, y)
+        self._y += int(y)
         return self
 
     def xy_move(self, x=1, y=1):
@@ -833,8 +911,8 @@ class Point(object):
             >>> p.xy_move(1).xy_move(0, 2).xy_move()
             (4, 6)
         """
-        self.x_move(x)
-        self.y_move(y)
+        self._x += int(x)
+        self._y += int(y)
         return self
 
     def _move_within_range(self, attr, range_, value, upto_flag):
@@ -976,6 +1054,46 @@ class Point(object):
         else:
             raise NotImplementedError
 
+    def _first_collision(self, attr_name, collisions, steps):
+        """Looks for the first collision moving positional attribute X or Y
+        one step at a time in the positive direction.
+
+        Args:
+            attr_name (str) : String with the name of the positional\
+            attribute to move. It could be 'x' or 'y'.
+
+            collisions (object) : set with (x, y) tuples or CollisionMap\
+            instance with possible collisions.
+
+            steps (int) : number of steps to move.
+
+        Returns:
+            int : number of steps to the first collision. None if there is\
+                    not any collision.
+
+        Example:
+            >>> p = Point(1, 1)
+            >>> p._first_collision('x', {(4, 1), (6, 1)}, 10)
+            3
+            >>> p._first_collision('y', {(4, 1), (6, 1)}, 10)
+            >>> p._first_collision('x', CollisionMap.from_points([(6, 1)]), 10)
+            5
+        """
+        if isinstance(collisions, CollisionMap):
+            if attr_name == 'x':
+                return collisions.x_ray(self._x, self._y, steps)
+            return collisions.y_ray(self._x, self._y, steps)
+        x, y = self._x, self._y
+        if attr_name == 'x':
+            for step in range(1, steps + 1):
+                if (x + step, y) in collisions:
+                    return step
+        else:
+            for step in range(1, steps + 1):
+                if (x, y + step) in collisions:
+                    return step
+        return None
+
     def _move_with_collision(self, attr_name, collisions, value, range_, upto_flag):
         """Generic method that moves positional attribute X or Y to a given
         position.
@@ -990,8 +1108,9 @@ class Point(object):
             attr_name (str) : String with the name of the positional\
             attribute to update. It could be 'x' or 'y'.
 
-            collisions (List[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (List[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             value (int) : movement value.
 
@@ -1008,49 +1127,44 @@ class Point(object):
         Raises:
             NotImplementedError
         """
-        if type(collisions) in (list, tuple) and collisions:
-            # Keep the initial attribute value, just is case we have to roll
-            # over it, if it can not move to the final position.
-            backup_value = getattr(self, attr_name)
-            # Get the final position, so it is checked against the range of
-            # possible values. If the result is out of limits, check if should
-            # move up to the closest position or not. If we can not move up to
-            # the closest, return the initial position.
-            move_value = self._move(backup_value, value)
-            if range_:
-                limit = value if range_.get_min() <= move_value < range_.get_max() else None
-                if limit is None and upto_flag:
-                    if range_.get_min() > move_value:
-                        limit = backup_value - range_.get_min()
-                    elif range_.get_max() < move_value:
-                        limit = range_.get_max() - backup_value
-                elif limit is None and not upto_flag:
-                    return self
-            else:
-                limit = value
-            # Move one step at a time, until a collision is found, at that time
-            # back down one position is up to close is defined or return the
-            # original value if not.
-            for inc in range(limit):
-                setattr(self, attr_name, self._move(getattr(self, attr_name), 1))
-                for p in collisions:
-                    if self == p:
-                        if upto_flag:
-                            setattr(self, attr_name, self._move(getattr(self, attr_name), -1))
-                        else:
-                            setattr(self, attr_name, backup_value)
-                        return self
-            return self
+        collisions = _collision_lookup(collisions)
+        # Keep the initial attribute value, just is case we have to roll
+        # over it, if it can not move to the final position.
+        backup_value = getattr(self, attr_name)
+        # Get the final position, so it is checked against the range of
+        # possible values. If the result is out of limits, check if should
+        # move up to the closest position or not. If we can not move up to
+        # the closest, return the initial position.
+        move_value = self._move(backup_value, value)
+        if range_:
+            limit = value if range_.get_min() <= move_value < range_.get_max() else None
+            if limit is None and upto_flag:
+                if range_.get_min() > move_value:
+                    limit = backup_value - range_.get_min()
+                elif range_.get_max() < move_value:
+                    limit = range_.get_max() - backup_value
+            elif limit is None and not upto_flag:
+                return self
         else:
-            raise NotImplementedError
+            limit = value
+        # Look for the first collision in the movement, at that time back
+        # down one position is up to close is defined or return the
+        # original value if not.
+        step = self._first_collision(attr_name, collisions, limit)
+        if step is None:
+            setattr(self, attr_name, self._move(backup_value, max(limit, 0)))
+        elif upto_flag:
+            setattr(self, attr_name, self._move(backup_value, step - 1))
+        return self
 
     def x_move_with_collision(self, collisions, x=1, x_range=None, upto_flag=False):
         """Updates X-coordinate a given value in the given range and avoiding any
         collision with given Point instances.
 
         Args:
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             x (int) : x-coordinate movement value.
 
@@ -1081,6 +1195,14 @@ class Point(object):
             (8, 1)
             >>> p.x_move_with_collision([Point(0, 0)], 10, Range(0, 10), True)
             (10, 1)
+            >>> p = Point(1, 1)
+            >>> cmap = CollisionMap.from_points([Point(4, 1)], 20, 5, 0, 0)
+            >>> p.x_move_with_collision(cmap, 5)
+            (1, 1)
+            >>> p.x_move_with_collision(cmap, 5, None, True)
+            (3, 1)
+            >>> p.x_move_with_collision({(5, 1)}, 5, None, True)
+            (4, 1)
         """
         return self._move_with_collision('x', collisions, x, x_range, upto_flag)
 
@@ -1089,8 +1211,9 @@ class Point(object):
         collision with given Point instances.
 
         Args:
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             x (int) : Y-coordinate movement value.
 
@@ -1121,6 +1244,10 @@ class Point(object):
             (1, 8)
             >>> p.y_move_with_collision([Point(0, 0)], 10, Range(0, 10), True)
             (1, 10)
+            >>> p.y_move_with_collision(set(), 2)
+            (1, 12)
+            >>> p.y_move_with_collision(CollisionMap.from_points([Point(1, 13)]), 2, None, True)
+            (1, 12)
         """
         return self._move_with_collision('y', collisions, y, y_range, upto_flag)
 
@@ -1135,8 +1262,9 @@ class Point(object):
             attr_name (str) : String with the name of the positional\
             attribute to update. It could be 'x' or 'y'.
 
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             value (int) : movement value.
 
@@ -1149,31 +1277,23 @@ class Point(object):
         Raises:
             NotImplementedError
         """
-        trav = Point(self.x, self.y)
-        if type(collisions) in (list, tuple) and collisions:
-            move_value = trav._move(getattr(trav, attr_name), value)
-            if range_:
-                limit = value if range_.get_min() <= move_value < range_.get_max() else None
-                if limit is None:
-                    return False
-            else:
-                limit = value
-            # Move one step at a time, until a collision is found.
-            for inc in range(limit):
-                setattr(trav, attr_name, trav._move(getattr(trav, attr_name), 1))
-                for p in collisions:
-                    if trav == p:
-                        return False
-            return True
+        collisions = _collision_lookup(collisions)
+        move_value = self._move(getattr(self, attr_name), value)
+        if range_:
+            limit = value if range_.get_min() <= move_value < range_.get_max() else None
+            if limit is None:
+                return False
         else:
-            raise NotImplementedError
+            limit = value
+        return self._first_collision(attr_name, collisions, limit) is None
 
     def x_is_valid_move(self, collisions, x=1, x_range=None):
         """Check if X-coordinate movement is valid.
 
         Args:
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             x (int) : x-coordinate movement value.
 
@@ -1200,6 +1320,10 @@ class Point(object):
             False
             >>> p.x_is_valid_move([Point(0, 0)], 10, Range(0, 10))
             False
+            >>> p.x_is_valid_move({FrozenPoint(6, 1)}, 6)
+            False
+            >>> p.x_is_valid_move(CollisionMap.from_points([Point(6, 1)]), 4)
+            True
         """
         return self._is_valid_move('x', collisions, x, x_range)
 
@@ -1207,8 +1331,9 @@ class Point(object):
         """Check if Y-coordinate movement is valid.
 
         Args:
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
             y (int) : Y-coordinate movement value.
 
@@ -1245,8 +1370,9 @@ class Point(object):
         Args:
             trans_point (Point) : translation point
 
-            collisions (list[Point]) : list or tuple of Points with\
-            possible collisions. These points will block the movement.
+            collisions (list[Point]) : list or tuple of Points, set or\
+            CollisionMap with possible collisions. These points will block\
+            the movement.
 
         Returns:
             bool : True if there is any collision, False else.
@@ -1259,9 +1385,114 @@ class Point(object):
             True
             >>> p.is_collision(Point(1, 1), [Point(1, 0), Point(2, 2)])
             True
+            >>> p.is_collision(Point(1, 1), {(1, 0), (2, 2)})
+            True
+            >>> p.is_collision(Point(1, 0), CollisionMap.from_points([(2, 2)]))
+            False
         """
-        new_point = self.translate(trans_point)
+        position = (self._x + trans_point.x, self._y + trans_point.y)
+        if type(collisions) in (set, frozenset) or isinstance(collisions, CollisionMap):
+            return position in collisions
         for p in collisions:
-            if new_point == p:
+            if position == (p.x, p.y):
                 return True
         return False
+
+
+class FrozenPoint(Point):
+    """FrozenPoint class derives from Point class and it represents an
+    immutable point.
+
+    FrozenPoint instances are hashable, so they can be used as dictionary keys
+    or set entries. They are equal, and hash the same, to the tuple with their
+    X and Y coordinates.
+
+    Move operations are not allowed, and in-place arithmetic returns a new
+    FrozenPoint instance.
+
+    Example:
+        >>> fp = FrozenPoint(1, 2)
+        >>> fp in {FrozenPoint(1, 2), FrozenPoint(0, 0)}
+        True
+        >>> fp == (1, 2), (1, 2) in {fp}, fp == Point(1, 2)
+        (True, True, True)
+        >>> fp.x_translate(2)
+        (3, 2)
+        >>> q = fp
+        >>> q += Point(1, 1)
+        >>> q, fp
+        ((2, 3), (1, 2))
+        >>> try:
+        ...     fp.x_move(1)
+        ... except NotImplementedError:
+        ...     'NotImplemented'
+        'NotImplemented'
+        >>> try:
+        ...     fp.y = 10
+        ... except NotImplementedError:
+        ...     'NotImplemented'
+        'NotImplemented'
+    """
+
+    __slots__ = ()
+
+    @Point.x.setter
+    def x(self, value):
+        """Sets _x attribute value. FrozenPoint can not be updated.
+        """
+        raise NotImplementedError
+
+    @Point.y.setter
+    def y(self, value):
+        """Sets _y attribute value. FrozenPoint can not be updated.
+        """
+        raise NotImplementedError
+
+    def __hash__(self):
+        """Returns the hash for the instance, the same as the tuple with X
+        and Y coordinates.
+
+        Returns:
+            int : hash value.
+        """
+        return hash((self._x, self._y))
+
+    def __eq__(self, other):
+        """Overload method for the 'equal to' operation. FrozenPoint instances
+        are equal to Point instances and to tuples with the same coordinates.
+
+        Args:
+            other (object) : the other Point or tuple to check if is equal.
+
+        Returns:
+            bool : True if instances are equal, False else.
+        """
+        if type(other) is tuple:
+            return (self._x, self._y) == other
+        return super(FrozenPoint, self).__eq__(other)
+
+    def __iadd__(self, other):
+        """Overload in-place addition. It returns a new FrozenPoint instance.
+        """
+        return self + other
+
+    def __isub__(self, other):
+        """Overload in-place substraction. It returns a new FrozenPoint instance.
+        """
+        return self - other
+
+    def x_move(self, x=1):
+        """Updates X-coordinate. FrozenPoint can not be moved.
+        """
+        raise NotImplementedError
+
+    def y_move(self, y=1):
+        """Updates Y-coordinate. FrozenPoint can not be moved.
+        """
+        raise NotImplementedError
+
+    def xy_move(self, x=1, y=1):
+        """Updates X-coordinate and Y-coordinate. FrozenPoint can not be
+        moved.
+        """
+        raise NotImplementedError
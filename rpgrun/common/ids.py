@@ -1,6 +1,8 @@
 import itertools
+import weakref
 
 __newId = itertools.count(1)
+__registry = weakref.WeakValueDictionary()
 
 
 def new_id():
@@ -10,3 +12,61 @@ def new_id():
         int : New unique id.
     """
     return next(__newId)
+
+
+def set_range(start):
+    """Sets the first value for all new unique ids.
+
+    It is used to give a different range of ids to every process running
+    games in parallel, so ids never collide.
+
+    Args:
+        start (int) : first id to be generated.
+
+    Example:
+        >>> set_range(2 ** 40)
+        >>> new_id() == 2 ** 40, new_id() == 2 ** 40 + 1
+        (True, True)
+    """
+    global __newId
+    __newId = itertools.count(start)
+
+
+def register(entity):
+    """Generates a new unique id and registers the given entity with it.
+
+    Entities are registered with a weak reference, so they leave the
+    registry as soon as they are garbage collected.
+
+    Args:
+        entity (object) : instance to register.
+
+    Returns:
+        int : New unique id for the entity.
+
+    Example:
+        >>> class Entity(object):
+        ...     pass
+        >>> entity = Entity()
+        >>> entity_id = register(entity)
+        >>> get_by_id(entity_id) is entity
+        True
+        >>> del entity
+        >>> get_by_id(entity_id)
+    """
+    entity_id = new_id()
+    __registry[entity_id] = entity
+    return entity_id
+
+
+def get_by_id(entity_id):
+    """Returns the registered entity for the given id.
+
+    Args:
+        entity_id (int) : Integer with the entity id.
+
+    Returns:
+        object : Entity registered with the given id. None if there is no\
+                entity alive with that id.
+    """
+    return __registry.get(entity_id)
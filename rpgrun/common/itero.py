@@ -101,8 +101,12 @@ class Itero(Iterator):
     def __iter__(self):
         """Allows iterating the instance (initialize the iteration).
 
+        Every iteration uses its own iterator over the storage, so nested
+        iterations over the same instance are independent, and no new
+        storage is allocated.
+
         Returns:
-            Itero : Returns itself instance.
+            iterator : Iterator over all entries stored.
 
         Example:
             >>> it = Itero(str)
@@ -119,13 +123,17 @@ class Itero(Iterator):
             THREE
             FOUR
             FIVE
+            >>> len([(x, y) for x in it for y in it])
+            25
         """
-        self.__index = 0
-        return self
+        return iter(self.__stream)
 
     def __next__(self):
         """Allows iteratinf the instace (next instance in the iteration).
 
+        It uses a cursor stored in the instance, so it is not used by for
+        loops, which use the iterator returned by __iter__.
+
         Returns:
             object : Next entry stored to be used in a generator.
         """
@@ -257,7 +265,7 @@ class StrItero(Iterator):
         """
         assert stream_class
         self.__stream_class = stream_class
-        self.__index = 0
+        self.__cursor = None
         self.__stream = OrderedDict()
         self.__processKey = theProcessKey
 
@@ -321,8 +329,14 @@ class StrItero(Iterator):
     def __iter__(self):
         """Allows iterating the instance (initialize the iteration).
 
+        Every iteration uses its own iterator over the stored values, so
+        nested iterations over the same instance are independent, and no new
+        storage is allocated. Values can not be added or removed while they
+        are iterated, so loops that do it have to iterate over a copy, like
+        list(instance).
+
         Returns:
-            Itero : Returns itself instance.
+            iterator : Iterator over all values stored.
 
         Example:
             >>> it = StrItero(int)
@@ -335,20 +349,38 @@ class StrItero(Iterator):
             0
             1
             2
+            >>> len([(x, y) for x in it for y in it])
+            9
         """
-        self.__index = 0
-        self.__streamAsList = [_ for _ in self.__stream.values()]
-        return self
+        return iter(self.__stream.values())
 
     def __next__(self):
         """Allows iteratinf the instace (next instance in the iteration).
+
+        It uses a cursor stored in the instance, over a copy of the values
+        taken when the cursor starts, so it is not used by for loops, which
+        use the iterator returned by __iter__.
+
+        Example:
+            >>> it = StrItero(int)
+            >>> it['one'], it['two'] = 1, 2
+            >>> next(it), next(it)
+            (1, 2)
+            >>> try:
+            ...     next(it)
+            ... except StopIteration:
+            ...     'StopIteration'
+            'StopIteration'
+            >>> next(it)
+            1
         """
-        if self.__index >= len(self.__streamAsList):
-            self.__index = 0
-            raise StopIteration
-        _ = self.__streamAsList[self.__index]
-        self.__index += 1
-        return _
+        if self.__cursor is None:
+            self.__cursor = iter(list(self.__stream.values()))
+        try:
+            return next(self.__cursor)
+        except StopIteration:
+            self.__cursor = None
+            raise
 
     def __len__(self):
         """Retrieves the lenght for the instance.
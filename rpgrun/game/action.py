@@ -242,6 +242,23 @@ class Action(GObject):
         """
         return None
 
+    def requires_line_of_sight(self):
+        """Returns if action targets have to be visible from the originator.
+
+        Returns:
+            bool : False if targets can be behind any obstacle.
+        """
+        return False
+
+    def target_area(self):
+        """Returns the area where targets can be found.
+
+        Returns:
+            Shape : area with all targets, None if targets can be anywhere\
+                    in the board.
+        """
+        return None
+
     def filter_target(self, cells):
         """Filter the given list with cell and return possible
         cells to be targeted by the action.
@@ -397,6 +414,14 @@ class AoETargetAction(TargetAction):
         """
         super(AoETargetAction, self).__init__(name, type_, **kwargs)
 
+    def target_area(self):
+        """Returns the area of effect, where targets can be found.
+
+        Returns:
+            Shape : area of effect shape.
+        """
+        return self.aoe.shape
+
     def filter_target(self, cells):
         """Filter the given list with cell and return possible
         cells to be targeted by the action.
@@ -409,8 +434,22 @@ class AoETargetAction(TargetAction):
 
         Returns:
             list[BCell] : List with the originator cell.
+
+        Example:
+            >>> from rpgrun.game.actor import Actor
+            >>> from rpgrun.board.bshapes import Quad
+            >>> acto = AoETargetAction('area', AType.MAGIC, width=2, height=2, shape=Quad)
+            >>> acto.originator = Actor(5, 5, 'me')
+            >>> cells = [Actor(6, 6, 'near'), Actor(9, 9, 'far'), acto.originator]
+            >>> [x.name for x in acto.filter_target(cells)]
+            ['near']
         """
-        return [x for x in cells if self.is_valid_target(x) and self.aoe.shape.is_inside(x)]
+        cells = list(cells)
+        try:
+            inside = self.aoe.shape.is_inside_many([(x.x, x.y) for x in cells])
+        except NotImplementedError:
+            inside = [self.aoe.shape.is_inside(x) for x in cells]
+        return [x for x, flag in zip(cells, inside) if flag and self.is_valid_target(x)]
 
 
 class MoveAction(Action):
@@ -511,6 +550,9 @@ class AoEMoveAction(MoveAction):
 
 class Actions(Itero):
     """Actions class derives from :class:`itero.Itero` contains all actions for any Actor.
+
+    Actions are indexed by their ID, so ID lookups do not have to traverse
+    all actions.
     """
 
     def __init__(self, **kwargs):
@@ -520,6 +562,49 @@ class Actions(Itero):
             size (int) : maximum number of actions. Default is None.
         """
         super(Actions, self).__init__(Action, kwargs.get('size', None))
+        self._ids = {}
+
+    def append(self, value):
+        """Appends a new action, keeping the ID index.
+        """
+        super(Actions, self).append(value)
+        self._ids[value.id] = value
+
+    def extend(self, theList):
+        """Extends with the given actions, keeping the ID index.
+
+        >>> acts = Actions()
+        >>> acto = Action('new')
+        >>> acts.extend([acto])
+        >>> acts.get_by_id(acto.id) is acto
+        True
+        """
+        start = len(self)
+        super(Actions, self).extend(theList)
+        for action in self.stream[start:]:
+            self._ids[action.id] = action
+
+    def __setitem__(self, key, value):
+        """Updates the action at the given index, keeping the ID index.
+        """
+        old_action = self[key]
+        super(Actions, self).__setitem__(key, value)
+        self._ids.pop(old_action.id, None)
+        self._ids[value.id] = value
+
+    def __delitem__(self, key):
+        """Deletes the action at the given index, keeping the ID index.
+        """
+        action = self[key]
+        super(Actions, self).__delitem__(key)
+        self._ids.pop(action.id, None)
+
+    def pop(self):
+        """Retrieves and removes the last action, keeping the ID index.
+        """
+        action = super(Actions, self).pop()
+        self._ids.pop(action.id, None)
+        return action
 
     def get_by_id(self, id):
         """Returns an action by the given Id.
@@ -530,11 +615,19 @@ class Actions(Itero):
         Returns:
             Action : Action instance with the given Id. None if no action\
                     was found.
+
+        Example:
+            >>> acts = Actions()
+            >>> acto = Action('new', AType.SKILL)
+            >>> acts.append(acto)
+            >>> acts.get_by_id(acto.id) == acto
+            True
+            >>> acts.get_by_id(Action('other').id)
+            >>> acts.remove(acto)
+            True
+            >>> acts.get_by_id(acto.id)
         """
-        for _action in self:
-            if _action.id == id:
-                return _action
-        return None
+        return self._ids.get(id)
 
     def __repr__(self):
         """String representation for the Actions instance.
@@ -1,6 +1,7 @@
 from rpgrun.board.bcell import BCell
 from rpgrun.board.bobject import BObject
 from rpgrun.game.action import Actions
+from rpgrun.game.attr import Attributes, SharedAttributes
 from rpgrun.game.inventory import Inventory
 from rpgrun.game.equipment import Equipment
 
@@ -15,13 +16,98 @@ def is_actor():
 BCell.is_actor = is_actor
 
 
+class Archetype(object):
+    """Archetype class contains attributes and actions shared by many actors.
+
+    Actors created with an archetype share its attributes until any of them
+    is modified. Archetype actions are kept as action factories, and every
+    actor creates its own actions the first time they are required, because
+    actions keep their originator and targets while they are used.
+    """
+
+    def __init__(self, name, template=None, actions=None):
+        """Archetype class initialization method.
+
+        Args:
+            name (str) : archetype name.
+            template (AttrTemplate) : template for archetype attributes.
+            actions (list) : action factories for all actors, like action\
+                    classes, or any callable without arguments that returns\
+                    a new action.
+
+        Example:
+            >>> import functools
+            >>> from rpgrun.game.gtemplate import AttrTemplate
+            >>> from rpgrun.game.action import Action
+            >>> hit = functools.partial(Action, 'hit')
+            >>> orc = Archetype('ORC', AttrTemplate.from_list('ORC', [('hp', 10, 2)]), [hit])
+            >>> a1, a2 = orc.spawn(0, 0), orc.spawn(1, 0, 'BIG ORC')
+            >>> a1.attrs['hp'].dec(4)
+            >>> a1.HP, a2.HP, a2.name, orc.attrs['hp']
+            (6, 10, 'BIG ORC', hp: 10/10)
+            >>> [x.name for x in a2.all_actions]
+            ['hit']
+            >>> a1.all_actions[0] is a2.all_actions[0], a1.all_actions[0] is a1.all_actions[0]
+            (False, True)
+        """
+        self.name = name
+        self.attrs = Attributes()
+        if template is not None:
+            template.stamp(self.attrs)
+        self.actions = tuple(actions) if actions else ()
+
+    def new_actions(self):
+        """Returns new actions for all archetype action factories.
+
+        Returns:
+            list : list of new actions.
+        """
+        return [factory() for factory in self.actions]
+
+    def new_attrs(self):
+        """Returns new attributes sharing all archetype attributes.
+
+        Returns:
+            SharedAttributes : new attributes instance.
+        """
+        return SharedAttributes(self.attrs)
+
+    def spawn(self, x, y, name=None, klass=None, **kwargs):
+        """Creates a new actor with the archetype.
+
+        Args:
+            x (int) : x-coordinate position.
+            y (int) : y-coordinate position.
+            name (str) : actor name. Default is the archetype name.
+            klass (class) : actor class. Default is Actor.
+
+        Returns:
+            Actor : new actor.
+        """
+        klass = klass if klass is not None else Actor
+        kwargs['archetype'] = self
+        return klass(x, y, name if name is not None else self.name, **kwargs)
+
+
 class Actor(BObject):
     """Actor Class derives from BObject class and it provides some particular
     functions for any actor placed on the board.
+
+    Actions, inventory and equipment are created the first time they are
+    used, so actors that never use them do not allocate them. Class
+    attributes provide default values, so they are not assigned for every
+    instance.
     """
 
     LIFE = None
 
+    archetype = None
+    _archetype_actions = None
+    _actions = None
+    _inventory = None
+    _equipment = None
+    _life = None
+
     def __init__(self, x, y, name, **kwargs):
         """Actor class initialization method.
 
@@ -31,13 +117,64 @@ class Actor(BObject):
             y (int) : y-coordinate position.
 
             name (str) : String with Actor name.
+
+        Keyword Args:
+            archetype (Archetype) : archetype with shared attributes and\
+                    actions.
         """
+        archetype = kwargs.get('archetype', None)
+        if archetype is not None and 'attrs' not in kwargs:
+            kwargs['attrs'] = archetype.new_attrs()
         super(Actor, self).__init__(x, y, name, **kwargs)
+        if archetype is not None:
+            self.archetype = archetype
         self.walkable = False
-        self.actions = Actions()
-        self._life = None
-        self.inventory = Inventory(host=self)
-        self.equipment = Equipment(host=self)
+
+    @property
+    def actions(self):
+        """Gets _actions attribute value, creating it the first time.
+
+        >>> a = Actor(0, 0, 'me')
+        >>> a._actions is None, len(a.actions), a._actions is None
+        (True, 0, False)
+        """
+        if self._actions is None:
+            self._actions = Actions()
+        return self._actions
+
+    @actions.setter
+    def actions(self, value):
+        """Sets _actions attribute value.
+        """
+        self._actions = value
+
+    @property
+    def inventory(self):
+        """Gets _inventory attribute value, creating it the first time.
+        """
+        if self._inventory is None:
+            self._inventory = Inventory(host=self)
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value):
+        """Sets _inventory attribute value.
+        """
+        self._inventory = value
+
+    @property
+    def equipment(self):
+        """Gets _equipment attribute value, creating it the first time.
+        """
+        if self._equipment is None:
+            self._equipment = Equipment(host=self)
+        return self._equipment
+
+    @equipment.setter
+    def equipment(self, value):
+        """Sets _equipment attribute value.
+        """
+        self._equipment = value
 
     @property
     def all_actions(self):
@@ -46,9 +183,16 @@ class Actor(BObject):
         Returns:
             list : List with all actions actor can execute.
         """
-        actions = self.actions.stream[:]
-        for eq in self.equipment:
-            actions.extend(eq.actions)
+        actions = []
+        if self.archetype is not None:
+            if self._archetype_actions is None:
+                self._archetype_actions = self.archetype.new_actions()
+            actions.extend(self._archetype_actions)
+        if self._actions is not None:
+            actions.extend(self._actions.stream)
+        if self._equipment is not None:
+            for eq in self._equipment:
+                actions.extend(eq.actions)
         return actions
 
     def get_life(self):
@@ -77,7 +221,9 @@ class Actor(BObject):
         Returns:
             list[GEquip] : list with all equip items.
         """
-        return [x for x in self.inventory if x.is_equip()]
+        if self._inventory is None:
+            return []
+        return [x for x in self._inventory if x.is_equip()]
 
     def is_actor(self):
         """Returns if the instance is an Actor.
@@ -1,20 +1,231 @@
 import json
+import operator
+from enum import Enum
 from rpgrun.common.itero import StrItero
 
 
+class Stacking(Enum):
+    """Stacking class enumeration provides all possible policies to
+    aggregate buffs for an attribute.
+
+    SUM adds all buff values to the attribute base value.
+
+    MAX adds only the highest buff value to the attribute base value.
+
+    MUL multiplies the attribute base value by all buff values.
+    """
+
+    SUM = 1
+    MAX = 2
+    MUL = 3
+
+
+class Buffs(dict):
+    """Buffs class derives from dict class and it keeps all buffs for an
+    attribute, with the aggregated value for all of them.
+
+    Aggregated value is updated every time a buff is added or removed, so
+    it is not computed every time it is read.
+    """
+
+    def __init__(self, stacking=Stacking.SUM, on_change=None):
+        """Buffs class initialization method.
+
+        Args:
+            stacking (Stacking) : policy to aggregate buff values.
+            on_change (function) : callback called every time the\
+                    aggregated value changes.
+
+        Example:
+            >>> buffs = Buffs()
+            >>> buffs['st'] = 5
+            >>> buffs['dx'] = 3
+            >>> buffs, buffs.total
+            ({'st': 5, 'dx': 3}, 8)
+            >>> buffs['st'] = 1
+            >>> del buffs['dx']
+            >>> buffs, buffs.total
+            ({'st': 1}, 1)
+        """
+        super(Buffs, self).__init__()
+        self.stacking = stacking
+        self.on_change = on_change
+        self.total = self._empty_total()
+
+    def _empty_total(self):
+        """Returns the aggregated value when there is not any buff.
+        """
+        return 1 if self.stacking is Stacking.MUL else 0
+
+    def _recompute(self):
+        """Computes the aggregated value for all buffs.
+        """
+        if self.stacking is Stacking.MAX:
+            self.total = max(self.values()) if len(self) else 0
+        elif self.stacking is Stacking.MUL:
+            self.total = 1
+            for value in self.values():
+                self.total *= value
+        else:
+            self.total = sum(self.values())
+
+    def _added(self, value):
+        """Updates the aggregated value with a new buff value.
+        """
+        if self.stacking is Stacking.MAX:
+            self.total = value if len(self) == 1 else max(self.total, value)
+        elif self.stacking is Stacking.MUL:
+            self.total *= value
+        else:
+            self.total += value
+
+    def _removed(self, value):
+        """Updates the aggregated value when a buff value is removed.
+
+        Aggregated value is computed again only when the highest buff value
+        or a zero factor is removed.
+        """
+        if self.stacking is Stacking.MAX:
+            if value >= self.total:
+                self._recompute()
+        elif self.stacking is Stacking.MUL:
+            if value and self.total % value == 0:
+                self.total //= value
+            else:
+                self._recompute()
+        else:
+            self.total -= value
+
+    def _changed(self):
+        """Notifies the aggregated value has changed.
+        """
+        if self.on_change:
+            self.on_change()
+
+    def __setitem__(self, key, value):
+        """Adds or replaces a buff.
+
+        Example:
+            >>> buffs = Buffs(Stacking.MAX)
+            >>> buffs['st'] = 5
+            >>> buffs['dx'] = 3
+            >>> buffs.total
+            5
+            >>> buffs['st'] = 2
+            >>> buffs.total
+            3
+        """
+        if key in self:
+            old = super(Buffs, self).pop(key)
+            self._removed(old)
+        super(Buffs, self).__setitem__(key, value)
+        self._added(value)
+        self._changed()
+
+    def __delitem__(self, key):
+        """Removes a buff.
+
+        Example:
+            >>> buffs = Buffs(Stacking.MUL)
+            >>> buffs.update({'st': 2, 'dx': 3})
+            >>> buffs.total
+            6
+            >>> del buffs['st']
+            >>> buffs.total
+            3
+        """
+        value = super(Buffs, self).pop(key)
+        self._removed(value)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        """Adds or replaces all given buffs.
+        """
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        """Returns the given buff, adding it with the default value if it is
+        not present.
+        """
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        """Removes the given buff and returns its value.
+        """
+        if key not in self:
+            return super(Buffs, self).pop(key, *args)
+        value = self[key]
+        del self[key]
+        return value
+
+    def popitem(self):
+        """Removes the last buff and returns it as a (key, value) tuple.
+        """
+        key, value = super(Buffs, self).popitem()
+        self._removed(value)
+        self._changed()
+        return key, value
+
+    def __reduce__(self):
+        """Returns data to copy or pickle the instance. Callback for the
+        aggregated value is not copied.
+
+        Example:
+            >>> import copy
+            >>> buffs = Buffs(Stacking.MAX)
+            >>> buffs.update({'st': 2, 'dx': 3})
+            >>> other = copy.deepcopy(buffs)
+            >>> other, other.stacking, other.total
+            ({'st': 2, 'dx': 3}, <Stacking.MAX: 2>, 3)
+        """
+        return (self.__class__, (self.stacking, ), None, None, iter(self.items()))
+
+    def clear(self):
+        """Removes all buffs.
+        """
+        super(Buffs, self).clear()
+        self.total = self._empty_total()
+        self._changed()
+
+
 class Attr(object):
     """Attr Class contains all data related with a board object attribute.
+
+    Now value is cached, and it is updated every time the base value, any
+    buff or the current value change.
+
+    On change callback, when it is set, is called with the attribute every
+    time the current value is incremented or decremented.
     """
 
-    def __init__(self, name):
+    on_change = None
+
+    def __init__(self, name, stacking=Stacking.SUM):
         """Attr class initialization method.
+
+        Args:
+            name (str) : attribute name.
+            stacking (Stacking) : policy to aggregate buff values.
+
+        Example:
+            >>> at = Attr('st', Stacking.MAX)
+            >>> at.base = 10
+            >>> at.add_buff('sword', 5), at.add_buff('ring', 2)
+            (True, True)
+            >>> at.now
+            15
         """
         self.name = name
         self.desc = ''
-        self.base = 0
+        self._base = 0
         self.__now = 0
+        self._now = 0
         self.delta = 0
-        self.buffs = {}
+        self._buffs = Buffs(stacking, self._update_now)
+        self._update_now()
 
     @classmethod
     def create_attr(cls, attr_data):
@@ -49,6 +260,75 @@ class Attr(object):
         attr.setup_attr(attr_base, attr_delta, attr_buff)
         return attr
 
+    def __setstate__(self, state):
+        """Restores the instance state when it is copied or unpickled.
+
+        >>> import pickle
+        >>> at = Attr('old')
+        >>> at.add_buff('st', 5)
+        True
+        >>> other = pickle.loads(pickle.dumps(at))
+        >>> other.add_buff('dx', 1)
+        True
+        >>> other, at
+        (old: 6/0, old: 5/0)
+        """
+        self.__dict__.update(state)
+        self._buffs.on_change = self._update_now
+
+    def __getstate__(self):
+        """Returns the instance state to copy or pickle it, without the on
+        change callback.
+        """
+        state = dict(self.__dict__)
+        state.pop('on_change', None)
+        return state
+
+    @property
+    def base(self):
+        """Gets _base attribute value.
+        """
+        return self._base
+
+    @base.setter
+    def base(self, value):
+        """Sets _base attribute value.
+        """
+        self._base = value
+        self._update_now()
+
+    @property
+    def buffs(self):
+        """Gets _buffs attribute value.
+        """
+        return self._buffs
+
+    @buffs.setter
+    def buffs(self, value):
+        """Sets all buffs, replacing any previous buff.
+
+        >>> at = Attr('old')
+        >>> at.buffs = {'st': 1, 'dx': 2}
+        >>> at.buffs, at.now
+        ({'st': 1, 'dx': 2}, 3)
+        """
+        self._buffs.clear()
+        self._buffs.update(value)
+
+    @property
+    def stacking(self):
+        """Gets the policy used to aggregate buff values.
+        """
+        return self._buffs.stacking
+
+    def _update_now(self):
+        """Updates cached now value.
+        """
+        if self._buffs.stacking is Stacking.MUL:
+            self._now = self._base * self._buffs.total + self.__now
+        else:
+            self._now = self._base + self._buffs.total + self.__now
+
     @property
     def now(self):
         """Gets now value which is function of Base, Buffs and __now attributes.
@@ -57,8 +337,14 @@ class Attr(object):
         >>> at.base = 5
         >>> at.now
         5
+        >>> at = Attr('mul', Stacking.MUL)
+        >>> at.base = 5
+        >>> at.add_buff('rage', 2)
+        True
+        >>> at.now
+        10
         """
-        return self.base + sum(self.buffs.values()) + self.__now
+        return self._now
 
     def dec(self, value):
         """Decrements __now attribute a given value.
@@ -70,6 +356,9 @@ class Attr(object):
         9
         """
         self.__now -= value
+        self._update_now()
+        if self.on_change is not None:
+            self.on_change(self)
 
     def inc(self, value):
         """Increments __now attribute a given value.
@@ -81,6 +370,9 @@ class Attr(object):
         12
         """
         self.__now += value
+        self._update_now()
+        if self.on_change is not None:
+            self.on_change(self)
 
     def add_buff(self, name, value):
         """Adds a new value to Buffs attribute.
@@ -95,7 +387,7 @@ class Attr(object):
         >>> at.now
         8
         """
-        self.buffs.update({name: value})
+        self._buffs[name] = value
         return True
 
     def del_buff(self, name):
@@ -113,7 +405,7 @@ class Attr(object):
         >>> at.buffs
         {'dx': 3}
         """
-        del self.buffs[name]
+        del self._buffs[name]
         return True
 
     def level_up(self, level_val=1):
@@ -133,8 +425,8 @@ class Attr(object):
         >>> at.base
         18
         """
-        for _ in range(abs(level_val)):
-            self.base += self.delta * int(level_val / abs(level_val))
+        if level_val:
+            self.base += self.delta * level_val
 
     def setup_attr(self, base=None, delta=None, buffs=None):
         """Setups instance with given base, delta and buffs values.
@@ -153,10 +445,11 @@ class Attr(object):
         >>> at.setup_attr(None, 5, {'ag': 2}), at.delta, at.buffs
         (new: 13/10, 5, {'st': 1, 'ag': 2})
         """
-        self.base = base if base is not None else self.base
         self.delta = delta if delta is not None else self.delta
         if buffs is not None and isinstance(buffs, dict):
-            self.buffs.update(buffs)
+            self._buffs.update(buffs)
+        if base is not None:
+            self.base = base
         return self
 
     def setup_attr_from_json(self, json_data):
@@ -172,11 +465,41 @@ class Attr(object):
         >>> at.setup_attr_from_json(data), at.delta, at.buffs
         (new: 14/10, 5, {'one': 4})
         """
-        dicta = json.loads(json_data)
+        return self.setup_attr_from_dict(json.loads(json_data))
+
+    def setup_attr_from_dict(self, dicta):
+        """Setups instance with values from a dictionary, like the one
+        decoded from a JSON variable.
+
+        >>> at = Attr('new')
+        >>> at.setup_attr_from_dict({"base": 10, "delta": 1, "buffs": {"one": 2}})
+        new: 12/10
+        """
         return self.setup_attr(int(dicta['base']) if dicta['base'] != "None" else None,
                                int(dicta['delta']) if dicta['delta'] != "None" else None,
                                dicta['buffs'] if dicta['buffs'] != 'None' else None)
 
+    def copy(self):
+        """Returns a new attribute with the same values.
+
+        >>> at = Attr('old', Stacking.MAX)
+        >>> at.setup_attr(10, 2, {'st': 3})
+        old: 13/10
+        >>> at.dec(4)
+        >>> other = at.copy()
+        >>> other.add_buff('dx', 5)
+        True
+        >>> other, other.delta, at
+        (old: 11/10, 2, old: 9/10)
+        """
+        attr = Attr(self.name, self.stacking)
+        attr.desc = self.desc
+        attr.delta = self.delta
+        attr._buffs.update(self.buffs)
+        attr.__now = self.__now
+        attr.base = self.base
+        return attr
+
     def __repr__(self):
         """Instace string representation.
 
@@ -187,8 +510,97 @@ class Attr(object):
         return '{0}: {1}/{2}'.format(self.name, self.now, self.base)
 
 
+def attr_accessor(key, name=None):
+    """Returns a property which reads the now value for the attribute with the
+    given key in the instance attrs.
+
+    Property reads are resolved without calling any python function, so they
+    cost about the same as a plain attribute lookup. When the instance does
+    not have the attribute, AttributeError is raised, so the class
+    __getattr__ method is called.
+
+    Attribute values can not be modified as instance attributes, but
+    instances that do not have the attribute keep any value set for that
+    name in the instance dictionary, as if there were no property.
+
+    Args:
+        key (str) : attribute key.
+        name (str) : attribute name as it is used by the instance. Default\
+                is the attribute key.
+
+    Returns:
+        property : property for the attribute.
+
+    Example:
+        >>> class Host(object):
+        ...     HP = attr_accessor('HP')
+        >>> host = Host()
+        >>> host.attrs = Attributes()
+        >>> host.attrs.add_attr(Attr('hp')).base = 10
+        >>> host.HP
+        10
+        >>> try:
+        ...     host.HP = 1
+        ... except AttributeError:
+        ...     print('AttributeError')
+        AttributeError
+        >>> other = Host()
+        >>> other.attrs = Attributes()
+        >>> other.HP = 1
+        >>> other.__dict__['HP']
+        1
+    """
+    name = key if name is None else name
+
+    def set_value(instance, value):
+        attrs = instance.__dict__.get('attrs')
+        if attrs is not None and key in attrs:
+            raise AttributeError(name)
+        instance.__dict__[name] = value
+
+    def del_value(instance):
+        if instance.__dict__.pop(name, attr_accessor) is attr_accessor:
+            raise AttributeError(name)
+
+    return property(operator.attrgetter('attrs.{0}._now'.format(key)), set_value, del_value)
+
+
+def install_accessor(klass, name, attrs):
+    """Installs an accessor property in the given class for the given
+    attribute name, so next reads for that name do not have to use the class
+    __getattr__ method.
+
+    Args:
+        klass (class) : class where accessor is installed.
+        name (str) : attribute name as it is used by the instance.
+        attrs (Attributes) : instance attributes.
+
+    Returns:
+        bool : True if accessor was installed, False else.
+
+    Example:
+        >>> class Host(object):
+        ...     pass
+        >>> install_accessor(Host, 'hp', Attributes())
+        True
+        >>> install_accessor(Host, 'hp', Attributes())
+        False
+    """
+    key = attrs._buildAttrName(name)
+    if not (name.isidentifier() and key.isidentifier()) or hasattr(klass, name):
+        return False
+    setattr(klass, name, attr_accessor(key, name))
+    return True
+
+
 class Attributes(StrItero):
     """Attributes Class contains all attributes related with a board object.
+
+    Every attribute is stored as an instance attribute too, using its key,
+    so attribute accessors can read it without any function call.
+
+    When attributes belong to an actor in a StatsTable, stats is the table
+    and row is the actor row in the table.
     """
 
     def __init__(self):
@@ -213,6 +625,8 @@ class Attributes(StrItero):
         'KeyError'
         """
         super(Attributes, self).__init__(Attr, self._buildAttrName)
+        self.stats = None
+        self.row = None
 
     def _buildAttrName(self, name):
         """Builds the name used to identify an attribute.
@@ -221,7 +635,49 @@ class Attributes(StrItero):
         >>> ats._buildAttrName('new')
         'NEW'
         """
-        return '{0}'.format(name.upper())
+        return name.upper()
+
+    def __setitem__(self, key, value):
+        """Stores an attribute with the given key.
+
+        >>> ats = Attributes()
+        >>> ats['hp'] = Attr('hp')
+        >>> ats.HP
+        hp: 0/0
+        """
+        if self.stats is not None:
+            self.stats.bind(self.row, self._buildAttrName(key), value)
+        super(Attributes, self).__setitem__(key, value)
+        self.__dict__[self._buildAttrName(key)] = value
+
+    def __delitem__(self, key):
+        """Deletes the attribute with the given key.
+
+        >>> ats = Attributes()
+        >>> ats['hp'] = Attr('hp')
+        >>> del ats['hp']
+        >>> hasattr(ats, 'HP')
+        False
+        """
+        if self.stats is not None:
+            self.stats.unbind(self[key])
+        super(Attributes, self).__delitem__(key)
+        del self.__dict__[self._buildAttrName(key)]
+
+    def __contains__(self, key):
+        """Checks if there is an attribute with the given key.
+
+        >>> ats = Attributes()
+        >>> ats['hp'] = Attr('hp')
+        >>> 'hp' in ats, 'HP' in ats, 'mp' in ats
+        (True, True, False)
+        """
+        return self._buildAttrName(key) in self.__dict__
+
+    def update(self, key, value):
+        """Stores an attribute with the given key.
+        """
+        self[key] = value
 
     def add_attr(self, attr):
         """Adds a new attribute.
@@ -294,18 +750,26 @@ class Attributes(StrItero):
         >>> ats['mp'].delta
         1
         """
-        lista = json.loads(json_data)
+        self.setup_attrs_from_data(json.loads(json_data))
+
+    def setup_attrs_from_data(self, lista):
+        """Setups attributes from the given list, like the one decoded from a
+        JSON variable, with one dictionary for every attribute.
+
+        >>> ats = Attributes()
+        >>> ats.setup_attrs_from_data([{"hp": {"base": 10, "delta": 2, "buffs": "None"}}])
+        >>> ats
+        hp: 10/10
+        """
         for entry in lista:
-            k = list(entry.keys())[0]
-            v = json.dumps(list(entry.values())[0])
-            self.add_attr(Attr(k)).setup_attr_from_json(v)
+            for k, v in entry.items():
+                self.add_attr(Attr(k)).setup_attr_from_dict(v)
 
     def setup_attrs_from_file(self, filename):
         """Setups instance from teh values in the given JSON file.
         """
         with open(filename, 'r') as file:
-            data = json.load(file)
-        self.setup_attrs_from_json(json.dumps(data))
+            self.setup_attrs_from_data(json.load(file))
 
     def level_up(self, level_val=1):
         """Levels up all attributes stored a given number of times.
@@ -351,3 +815,176 @@ class Attributes(StrItero):
         mp: 0/0
         """
         return '\n'.join([str(attr) for attr in self])
+
+
+class _SharedAttr(object):
+    """_SharedAttr class is a read-only view over a shared attribute.
+
+    Attribute accessors read the now value from the shared attribute
+    without copying it. Any other use of the view copies the shared
+    attribute first, so the prototype is never modified.
+    """
+
+    __slots__ = ('_attrs', '_key', '_attr')
+
+    def __init__(self, attrs, key, attr):
+        """_SharedAttr class initialization method.
+
+        Args:
+            attrs (SharedAttributes) : attributes sharing the attribute.
+            key (str) : attribute key.
+            attr (Attr) : shared attribute.
+        """
+        object.__setattr__(self, '_attrs', attrs)
+        object.__setattr__(self, '_key', key)
+        object.__setattr__(self, '_attr', attr)
+
+    @property
+    def _now(self):
+        """Gets now value from the shared attribute.
+        """
+        return self._attr._now
+
+    def __getattr__(self, name):
+        """Copies the shared attribute and returns the given attribute from
+        the copy.
+        """
+        return getattr(self._attrs[self._key], name)
+
+    def __setattr__(self, name, value):
+        """Copies the shared attribute and sets the given attribute in the
+        copy.
+        """
+        setattr(self._attrs[self._key], name, value)
+
+    def __repr__(self):
+        """String representation for the shared attribute.
+        """
+        return repr(self._attrs[self._key])
+
+
+class SharedAttributes(Attributes):
+    """SharedAttributes class derives from Attributes class and it shares all
+    attributes from a prototype, which is never modified.
+
+    Attributes are copied from the prototype the first time they are
+    retrieved by key, by name or iterated, because they could be modified.
+    Reading attribute values through the host attribute accessors does not
+    copy them.
+    """
+
+    def __init__(self, prototype):
+        """SharedAttributes class initialization method.
+
+        Args:
+            prototype (Attributes) : attributes to share.
+
+        Example:
+            >>> proto = Attributes()
+            >>> proto.setup_attrs_from_list([('hp', 10, 2), ('str', 5, 1)])
+            >>> ats = SharedAttributes(proto)
+            >>> ats.HP, 'hp' in ats, ats.copied
+            (hp: 10/10, True, [])
+            >>> ats['hp'].dec(3)
+            >>> ats['hp'], proto['hp'], ats.copied
+            (hp: 7/10, hp: 10/10, ['HP'])
+            >>> ats.STR._now, ats.copied
+            (5, ['HP'])
+            >>> ats.STR.dec(2)
+            >>> ats.STR._now, proto['str'], ats.copied
+            (3, str: 5/5, ['HP', 'STR'])
+            >>> del ats['str']
+            >>> 'str' in ats, len(ats)
+            (False, 1)
+        """
+        super(SharedAttributes, self).__init__()
+        self._prototype = prototype
+        self._deleted = set()
+
+    @property
+    def copied(self):
+        """Gets keys for all attributes that are not shared anymore.
+
+        Returns:
+            list : list of attribute keys.
+        """
+        return [k for k, _ in super(SharedAttributes, self).items()]
+
+    def _shared(self, key):
+        """Returns the shared attribute for the given key, or None if it is
+        not shared.
+        """
+        key_ = self._buildAttrName(key)
+        if key_ in self.__dict__ or key_ in self._deleted:
+            return None
+        return self._prototype.__dict__.get(key_)
+
+    def _copy_shared(self):
+        """Copies all shared attributes.
+        """
+        for key, attr in list(self._prototype.items()):
+            if self._shared(key) is not None:
+                super(SharedAttributes, self).__setitem__(key, attr.copy())
+
+    def __getattr__(self, name):
+        """Returns a view over the shared attribute with the given key, so
+        attribute accessors read its value without copying it, and any other
+        use copies it first.
+        """
+        if name.startswith('_'):
+            raise AttributeError(name)
+        attr = self._shared(name)
+        if attr is None:
+            raise AttributeError(name)
+        return _SharedAttr(self, name, attr)
+
+    def __getitem__(self, key):
+        """Returns the attribute for the given key. Shared attributes are
+        copied first.
+        """
+        attr = self._shared(key)
+        if attr is not None:
+            attr = attr.copy()
+            super(SharedAttributes, self).__setitem__(key, attr)
+            return attr
+        return super(SharedAttributes, self).__getitem__(key)
+
+    def __setitem__(self, key, value):
+        """Stores an attribute with the given key.
+        """
+        self._deleted.discard(self._buildAttrName(key))
+        super(SharedAttributes, self).__setitem__(key, value)
+
+    def __delitem__(self, key):
+        """Deletes the attribute with the given key.
+        """
+        key_ = self._buildAttrName(key)
+        if self._shared(key) is None:
+            super(SharedAttributes, self).__delitem__(key)
+        if key_ in self._prototype.__dict__:
+            self._deleted.add(key_)
+
+    def __contains__(self, key):
+        """Checks if there is an attribute with the given key.
+        """
+        key_ = self._buildAttrName(key)
+        return key_ in self.__dict__ or (key_ in self._prototype.__dict__ and key_ not in self._deleted)
+
+    def __iter__(self):
+        """Iterates all attributes. Shared attributes are copied first.
+        """
+        self._copy_shared()
+        return super(SharedAttributes, self).__iter__()
+
+    def __len__(self):
+        """Returns the number of attributes.
+        """
+        self._copy_shared()
+        return super(SharedAttributes, self).__len__()
+
+    def items(self):
+        """Returns all key-attribute pairs. Shared attributes are copied
+        first.
+        """
+        self._copy_shared()
+        return super(SharedAttributes, self).items()
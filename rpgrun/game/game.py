@@ -1,11 +1,31 @@
 from rpgrun.board.board import Board
+from rpgrun.board.bfov import FieldOfView
 from rpgrun.board.bhandler import BoardHandler
-from rpgrun.board.bpoint import Location
-from rpgrun.board.brow import BRow
+from rpgrun.board.bpath import PathFinder
 from rpgrun.board.blayer import LType
+from rpgrun.board.bpoint import BPoint, Location
+from rpgrun.board.brow import BRow
 from rpgrun.game.action import Action
+from rpgrun.game.gjournal import Journal
+from rpgrun.game.greach import Reachability
 from rpgrun.game.gstages import Stages
-import jc2li.loggerator as loggerator
+from rpgrun.game.gstats import StatsTable
+
+
+def _get_logger(name):
+    """Returns the logger with the given name.
+
+    Logger module is imported only when a logger is required, so headless
+    games can run without it.
+
+    Args:
+        name (str) : logger name.
+
+    Returns:
+        Loggerator : logger instance.
+    """
+    import jc2li.loggerator as loggerator
+    return loggerator.getLoggerator(name)
 
 
 class Game(object):
@@ -15,6 +35,20 @@ class Game(object):
 
     def __init__(self, width, height, **kwargs):
         """Game class initialization method.
+
+        Args:
+            width (int) : board width.
+            height (int) : board height.
+
+        Keyword Args:
+            capture (object) : logger output redirection.
+            headless (bool) : True to run without any logger, used for\
+                    simulations. Default is False.
+            stats (bool) : True to keep attributes for all actors in a\
+                    StatsTable, so they can be updated in bulk. It requires\
+                    numpy. Default is False.
+            journal (bool) : True to record all board changes and actor\
+                    attribute changes in a Journal. Default is False.
         """
         self._bwidth = width
         self._bheight = height
@@ -27,12 +61,77 @@ class Game(object):
         self.move_choice = None
         self.__action_select_target = None
         self.__action_select_move = None
-        self.logger = loggerator.getLoggerator('GAME')
+        self.headless = kwargs.get('headless', False)
+        self.logger = None if self.headless else _get_logger('GAME')
         capture = kwargs.get('capture', None)
-        if capture is not None:
+        if capture is not None and self.logger is not None:
             self.logger.redirect_out_to(capture)
         self._stage_cb = {}
         self._stage = Stages.INIT
+        self.stats = StatsTable() if kwargs.get('stats', False) else None
+        self.journal = Journal() if kwargs.get('journal', False) else None
+        self.board.journal = self.journal
+        self._paths = None
+        self._reach = None
+        self._sight = None
+
+    def _debug(self, fmt, *args):
+        """Logs a debug message.
+
+        Message is formatted only when there is a logger, so headless games
+        do not pay for it.
+
+        Args:
+            fmt (str) : message format.
+            args (list) : message format arguments.
+        """
+        if self.logger is not None:
+            self.logger.debug(fmt.format(*args))
+
+    @property
+    def paths(self):
+        """Gets _paths attribute value.
+
+        Path finder is created the first time it is required.
+
+        Returns:
+            PathFinder : path finder for the board.
+
+        Example:
+            >>> game = Game(3, 3, headless=True)
+            >>> game._paths is None, game.paths is game.paths
+            (True, True)
+        """
+        if self._paths is None:
+            self._paths = PathFinder(self.board)
+        return self._paths
+
+    @property
+    def reach(self):
+        """Gets _reach attribute value.
+
+        Reachability is created the first time it is required, and it
+        shares the walkability grid with the path finder.
+
+        Returns:
+            Reachability : move sets for all move actions.
+        """
+        if self._reach is None:
+            self._reach = Reachability(self.paths.grid)
+        return self._reach
+
+    @property
+    def sight(self):
+        """Gets _sight attribute value.
+
+        Field of view is created the first time it is required.
+
+        Returns:
+            FieldOfView : field of view for the board.
+        """
+        if self._sight is None:
+            self._sight = FieldOfView(self.board)
+        return self._sight
 
     @property
     def stage(self):
@@ -82,8 +181,22 @@ class Game(object):
 
     def add_actor(self, actor, player=False):
         """Adds the given actor to the game.
+
+        Example:
+            >>> from rpgrun.game.actor import Actor
+            >>> game = Game(3, 3, headless=True, stats=True)
+            >>> actor = Actor(0, 0, 'orc')
+            >>> actor.attrs.setup_attrs_from_list([('hp', 10, 2)])
+            >>> game.add_actor(actor)
+            >>> game.stats.dec('hp', 3)
+            >>> actor.HP
+            7
         """
         self.actors.append(actor)
+        if self.stats is not None:
+            self.stats.add(actor)
+        if self.journal is not None:
+            self.journal.watch(actor)
         if player:
             self.player = actor
 
@@ -98,21 +211,27 @@ class Game(object):
     def _remove_actor(self, actor, from_board=True):
         """Removes the given actor from the game.
         """
-        if from_board:
-            self.board.remove_cell(actor)
-        self.actors.remove(actor)
+        with self.board.lock:
+            if from_board:
+                self.board.remove_cell(actor)
+            self.actors.remove(actor)
+            if self.stats is not None:
+                self.stats.remove(actor)
+            if self.journal is not None:
+                self.journal.unwatch(actor)
 
     def _update_actors(self):
         """Updates all actors in the game.
 
         It removes all actors that are not in the board.
         """
-        for actor in self.actors:
-            if self.board.bottom_cell_row <= actor.row <= self.board.top_cell_row:
-                if not actor.is_in_board():
-                    self._remove_actor(actor)
-            else:
-                self._remove_actor(actor, False)
+        with self.board.lock:
+            for actor in self.actors[:]:
+                if self.board.bottom_cell_row <= actor.row <= self.board.top_cell_row:
+                    if not actor.is_in_board():
+                        self._remove_actor(actor)
+                else:
+                    self._remove_actor(actor, False)
 
     def other_actors(self):
         """Return all actors but the player.
@@ -122,18 +241,143 @@ class Game(object):
         """
         return [x for x in self.actors if x != self.player]
 
+    def target_choices(self, action):
+        """Returns all cells that can be targeted by the given action.
+
+        When the action targets only the OBJECT layer, cells are taken from
+        the board spatial index, and only cells in the action target area are
+        checked. When the action requires line of sight, cells behind any
+        solid cell are discarded.
+
+        Args:
+            action (Action) : action to look for targets.
+
+        Returns:
+            list[BCell] : list with all cells that can be targeted.
+
+        Example:
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bshapes import Quad
+            >>> from rpgrun.game.action import AoETargetAction, AType
+            >>> from rpgrun.game.actor import Actor
+            >>> game = Game(10, 10, headless=True)
+            >>> for index, row in enumerate(game.board):
+            ...     row.cellrow = 9 - index
+            >>> actors = [Actor(2, 2, 'me'), Actor(3, 3, 'near'), Actor(5, 5, 'far')]
+            >>> for actor in actors:
+            ...     _ = game.board.add_cell_to_layer(actor, LType.OBJECT)
+            >>> action = AoETargetAction('area', AType.MAGIC, width=2, height=2, shape=Quad)
+            >>> action.originator = actors[0]
+            >>> [x.name for x in game.target_choices(action)]
+            ['near']
+            >>> action = AoETargetAction('range', AType.WEAPONIZE, width=6, height=6, shape=Quad)
+            >>> action.originator = actors[0]
+            >>> [x.name for x in game.target_choices(action)]
+            ['far', 'near']
+            >>> action.requires_line_of_sight = lambda: True
+            >>> [x.name for x in game.target_choices(action)]
+            ['near']
+        """
+        layer = action.layer_to_target()
+        if layer == [LType.OBJECT, ]:
+            area = action.target_area()
+            objects = self.board.objects
+            cells = objects.query_shape(area) if area is not None else objects.cells()
+        else:
+            cells = self.board.get_cells_from_layer(layer) if layer else None
+        if cells and action.requires_line_of_sight():
+            cells = self.sight.visible_cells(action.originator, cells, self._sight_radius(action))
+        return action.filter_target(cells)
+
+    def _sight_radius(self, action):
+        """Returns the distance to the farthest position in the action target
+        area, or the whole board when the action has no target area.
+        """
+        area = action.target_area()
+        if area is not None:
+            return max([abs(x) + abs(y) for x, y in area.footprint] or [0])
+        return self.board.width + self.board.height
+
+    def sight_of(self, action):
+        """Returns all positions visible from the originator of the given
+        action, inside the action target area.
+
+        Args:
+            action (Action) : action to look for visible positions.
+
+        Returns:
+            GridSet : all visible positions.
+        """
+        return self.sight.visible(action.originator, self._sight_radius(action))
+
+    def is_valid_player_move(self, direction, move_val):
+        """Checks if the player can be moved in the given direction and the
+        given value.
+
+        Player has to remain inside the board and it can not be moved to a
+        position with any cell with collision.
+
+        Args:
+            direction (Location) : direction the player will be moved.
+            move_val (int) : number of cells the player will be moved.
+
+        Returns:
+            bool : True if the player can be moved, False else.
+        """
+        assert isinstance(direction, Location)
+        position = BPoint(self.player.x, self.player.y)
+        position.move_to(direction, move_val)
+        if not (0 <= position.x < self.board.width):
+            return False
+        if self.board.get_row_from_cell_row(position.y) is None:
+            return False
+        for cell in self.board.get_cells_at(position):
+            if cell is not self.player and cell.collision:
+                return False
+        return True
+
     def can_move_to(self, cell):
         """Checks if movement is allowed for the given action.
 
-        TODO: We have to check for collisions with any other solid objects.
+        Action decides if the position is in its range, and the position has
+        to be inside the board and not blocked by any cell with collision.
 
         Args:
             cell (BCell) : Cell where to move.
 
         Returns:
             bool : True if can move to cell, False else.
+
+        Example:
+            >>> from rpgrun.board.blayer import LType
+            >>> from rpgrun.board.bpoint import BPoint
+            >>> from rpgrun.game.action import MoveAction, AType
+            >>> from rpgrun.game.actor import Actor
+            >>> class Jump(MoveAction):
+            ...     def is_valid_move(self, cell):
+            ...         return cell.y == 2
+            >>> game = Game(3, 3, headless=True)
+            >>> for index, row in enumerate(game.board):
+            ...     row.cellrow = 2 - index
+            >>> for actor in (Actor(1, 0, 'me'), Actor(0, 2, 'other')):
+            ...     _ = game.board.add_cell_to_layer(actor, LType.OBJECT)
+            >>> game.action = Jump('jump', AType.MOVEMENT)
+            >>> [game.can_move_to(BPoint(x, y)) for x, y in ((1, 2), (0, 2), (1, 1), (1, 5))]
+            [True, False, False, False]
+        """
+        return self.action.is_valid_move(cell) and self.paths.grid.is_walkable(cell.x, cell.y)
+
+    def move_choices(self, actions):
+        """Returns all positions where every given move action can move its
+        originator, computed at once for all actions.
+
+        Args:
+            actions (list) : list of move actions with an originator.
+
+        Returns:
+            dict : GridSet with all valid positions for every action.
         """
-        return self.action.is_valid_move(cell)
+        return self.reach.move_sets(actions)
 
     def move_player(self, direction, move_val):
         """Moves the player (PActor instace) in the given direction and the
@@ -147,31 +391,24 @@ class Game(object):
             None
         """
         assert isinstance(direction, Location)
-        old_cell_row = self.player.row
-        # This moveTo should be replaced with a move with collision and range
+        # This move should be replaced with a move with collision and range
         # check in order to validate the movement.
-        assert self.player.move_to(direction, move_val) is not None
-        if old_cell_row != self.player.row:
-            old_row = self.board.get_row_from_cell_row(old_cell_row)
-            assert old_row is not None
-            old_row.remove_cell_from_layer(self.player, LType.OBJECT)
-            new_row = self.board.get_row_from_cell_row(self.player.row)
-            assert new_row is not None
-            new_row.add_cell_to_layer(self.player, LType.OBJECT)
-
-    def scroll_board(self, new_row):
+        self.board.move_cell(self.player, direction, move_val)
+
+    def scroll_board(self, new_row=None):
         """Scroll the board, removing one row and adding a new one.
 
         Scroll always moves row to the front, it means to higher
         cell-row values.
 
         Args:
-            new_row (BRow) : new row to be added to the board.
+            new_row (BRow) : new row to be added to the board. Default is\
+                    the next row from the board row provider.
 
         Returns:
             None
         """
-        assert isinstance(new_row, BRow)
+        assert new_row is None or isinstance(new_row, BRow)
         self.board.scroll(new_row)
 
     def _run(self):
@@ -198,6 +435,8 @@ class Game(object):
         """
         while True:
             self.stage = Stages.TURN_START
+            if self.journal is not None:
+                self.journal.mark_turn()
 
             # Select Actor
             self.stage = Stages.SEL_ACTOR
@@ -208,19 +447,16 @@ class Game(object):
             # Required call: run_select_action()
             self.action = yield
             assert isinstance(self.action, Action)
-            self.logger.debug('action: {}'.format(self.action.type))
+            self._debug('action: {}', self.action.type)
 
             if self.action.requires_target():
                 # Select target
-                self.logger.debug('action requires target')
+                self._debug('action requires target')
                 self.stage = Stages.SEL_TARGET
 
                 # When action has been selected, ask for cells for target
                 # selection.
-                layer = self.action.layer_to_target()
-                cells = self.board.get_cells_from_layer(
-                    layer) if layer else None
-                self.target_choice = self.action.filter_target(cells)
+                self.target_choice = self.target_choices(self.action)
 
                 # Yield for user to select the target.
                 # Required call: run_select_target()
@@ -231,11 +467,11 @@ class Game(object):
                 target = self.action.target
 
             self.action.selected(target)
-            self.logger.debug('target: {}'.format(target))
+            self._debug('target: {}', target)
 
             if self.action.requires_movement():
                 # Select Movement
-                self.logger.debug('action requires movement')
+                self._debug('action requires movement')
                 self.stage = Stages.SEL_MOVE
 
                 self.move_choice = self.action.move_choices()
@@ -252,7 +488,7 @@ class Game(object):
             # Execute action
             self.stage = Stages.PLAY_ACTION
 
-            self.logger.debug('action kwargs: {}'.format(_actionKwargs))
+            self._debug('action kwargs: {}', _actionKwargs)
             self.action.execute(self, **_actionKwargs)
 
             if self.action.requires_movement():
@@ -263,7 +499,7 @@ class Game(object):
                 # Required call: run_scroll()
                 new_row = yield
                 self.scroll_board(new_row)
-                self.logger.debug('scroll new row: {}'.format(new_row))
+                self._debug('scroll new row: {}', new_row)
 
             # Update actors
             self.stage = Stages.UPDATE_ACTORS
@@ -280,37 +516,37 @@ class Game(object):
     def run_select_action(self, action):
         """Steps on the action selection.
         """
-        self.logger.debug('run_select_action: {}'.format(action))
+        self._debug('run_select_action: {}', action)
         self._runner.send(action)
         return action.type
 
     def run_select_target(self, target):
         """Steps on the action target selection.
         """
-        self.logger.debug('run_select_target: {}'.format(target))
+        self._debug('run_select_target: {}', target)
         self._runner.send(self.__action_select_target.send(target))
 
     def run_select_requires(self, **kwargs):
         """Steps on the requires selection.
         """
-        self.logger.debug('run_select_requires: {}'.format(kwargs))
+        self._debug('run_select_requires: {}', kwargs)
         self._runner.send(self.__action_select_move.send({}))
 
     def run_select_movement(self, location=None, position=None):
         """Steps on the action movement selection.
         """
-        self.logger.debug('run_select_movement: {0} {1}'.format(location, position))
+        self._debug('run_select_movement: {0} {1}', location, position)
         self._runner.send(self.__action_select_move.send({'location': location,
                                                           'position': position}))
 
-    def run_scroll(self, new_row):
+    def run_scroll(self, new_row=None):
         """Steps on the run cycle.
         """
-        self.logger.debug('run_scroll: {}'.format(new_row))
+        self._debug('run_scroll: {}', new_row)
         self._runner.send(new_row)
 
     def runner(self, value):
         """Steps on the run cycle.
         """
-        self.logger.debug('runner: {}'.format(value))
+        self._debug('runner: {}', value)
         self._runner.send(value)
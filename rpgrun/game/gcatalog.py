@@ -1,3 +1,4 @@
+import rpgrun.common.ids as ids
 from rpgrun.common.itero import StrItero
 
 
@@ -98,8 +99,17 @@ class Catalog(StrItero):
         Returns:
             object : Entry instance with the given ID. None if no entry\
                     was found.
+
+        Example:
+            >>> from rpgrun.game.gobject import GObject
+            >>> c = Catalog(GObject)
+            >>> g = GObject(name='me')
+            >>> c.append(g)
+            >>> c.get_by_id(g.id) == g
+            True
+            >>> c.get_by_id(GObject(name='you').id)
         """
-        for entry in self:
-            if entry.id == id:
-                return entry
-        return None
+        entry = ids.get_by_id(id)
+        if entry is None or getattr(entry, 'name', None) not in self:
+            return None
+        return entry if self[entry.name] is entry else None
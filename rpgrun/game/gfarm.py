@@ -0,0 +1,155 @@
+import multiprocessing
+import os
+import rpgrun.common.ids as ids
+from rpgrun.game.gsim import MatchResult, Outcome
+
+ID_SPAN = 2 ** 40
+"""Number of ids available for every worker process."""
+
+_simulation = None
+
+
+def _init_worker(simulation, workers=None):
+    """Initializes a worker process with the simulation to run.
+
+    Every worker takes the next worker number from the shared counter, and
+    generates ids in its own range, so ids never collide between workers or
+    with ids in the parent process, which stay below ID_SPAN. Ids keep
+    growing across matches in the same worker, so objects from a previous
+    match are never found by ids of a new match.
+
+    Args:
+        simulation (Simulation) : simulation for all matches.
+        workers (multiprocessing.Value) : shared counter with the number of\
+                workers started. Default runs in the current process,\
+                without changing the id range.
+
+    Example:
+        >>> next_id = ids.new_id()
+        >>> workers = multiprocessing.Value('q', 0)
+        >>> _init_worker(None, workers)
+        >>> ids.new_id() == ID_SPAN
+        True
+        >>> _init_worker(None, workers)
+        >>> ids.new_id() == 2 * ID_SPAN
+        True
+        >>> ids.set_range(next_id + 1)
+    """
+    global _simulation
+    _simulation = simulation
+    if workers is not None:
+        with workers.get_lock():
+            workers.value += 1
+            index = workers.value
+        ids.set_range(index * ID_SPAN)
+
+
+def _run_match(task):
+    """Runs a single match.
+
+    Args:
+        task (tuple) : task index, match seed and scenario parameters.
+
+    Returns:
+        tuple : task index and packed match results.
+
+    Example:
+        >>> class Sim(object):
+        ...     def run_match(self, seed, **kwargs):
+        ...         return MatchResult(seed, Outcome.WIN, 1, 2, 3, 4, kwargs['kills'])
+        >>> _init_worker(Sim())
+        >>> _run_match((5, 10, {'kills': 4}))
+        (5, (10, 1, 1, 2, 3, 4, 4))
+    """
+    index, seed, kwargs = task
+    return index, _pack(_simulation.run_match(seed, **kwargs))
+
+
+def _pack(result):
+    """Packs match results in a plain tuple to be sent between processes.
+
+    Args:
+        result (MatchResult) : match results.
+
+    Returns:
+        tuple : packed match results.
+    """
+    return (result.seed, result.outcome.value) + tuple(result[2:])
+
+
+def _unpack(record):
+    """Unpacks match results packed with _pack.
+
+    Args:
+        record (tuple) : packed match results.
+
+    Returns:
+        MatchResult : match results.
+
+    Example:
+        >>> result = MatchResult(1, Outcome.LOSE, 3, 9, 0, 5, 2)
+        >>> _unpack(_pack(result)) == result
+        True
+    """
+    return MatchResult(record[0], Outcome(record[1]), *record[2:])
+
+
+class MatchFarm(object):
+    """MatchFarm class runs independent simulated matches in a pool of
+    processes, using all CPU cores.
+
+    Match results are streamed back as they are completed, in any order.
+    """
+
+    def __init__(self, simulation, processes=None, chunksize=8):
+        """MatchFarm class initialization method.
+
+        Args:
+            simulation (Simulation) : simulation for all matches. It is sent\
+                    once to every worker process.
+            processes (int) : number of worker processes. Default is the\
+                    number of CPU cores. Zero runs all matches in the\
+                    current process.
+            chunksize (int) : number of matches sent to a worker at once.
+        """
+        self.simulation = simulation
+        self.processes = os.cpu_count() if processes is None else processes
+        self.chunksize = chunksize
+
+    def _tasks(self, matches):
+        """Generates tasks for the given matches.
+
+        Args:
+            matches (list) : list with seeds, or (seed, dict) tuples with\
+                    the match seed and scenario parameters.
+
+        Returns:
+            generator : (index, seed, dict) task for every match.
+        """
+        for index, match in enumerate(matches):
+            if type(match) in (list, tuple):
+                yield (index, match[0], match[1])
+            else:
+                yield (index, match, {})
+
+    def run(self, matches):
+        """Runs all given matches.
+
+        Args:
+            matches (list) : list with seeds, or (seed, dict) tuples with\
+                    the match seed and scenario parameters.
+
+        Returns:
+            generator : (index, MatchResult) for every match, where index is\
+                    the match position in the given list.
+        """
+        if not self.processes:
+            _init_worker(self.simulation)
+            for task in self._tasks(matches):
+                index, record = _run_match(task)
+                yield index, _unpack(record)
+            return
+        workers = multiprocessing.Value('q', 0)
+        with multiprocessing.Pool(self.processes, _init_worker, (self.simulation, workers)) as pool:
+            for index, record in pool.imap_unordered(_run_match, self._tasks(matches), self.chunksize):
+                yield index, _unpack(record)
@@ -0,0 +1,476 @@
+import struct
+from collections import namedtuple
+from functools import partial
+from rpgrun.board.blayer import LType
+
+MAGIC = b'RGJ2'
+"""Header for journals in binary format."""
+
+TURN = 0
+ADD = 1
+REMOVE = 2
+MOVE = 3
+DROP = 4
+ATTR = 5
+NAME = 6
+CHECKPOINT = 7
+
+NO_NAME = 0xFFFF
+"""Name index for cells without name."""
+
+_OP = struct.Struct('<B')
+_TURN = struct.Struct('<I')
+_ADD = struct.Struct('<QiiBH')
+_REMOVE = struct.Struct('<Q')
+_MOVE = struct.Struct('<Qii')
+_DROP = struct.Struct('<i')
+_ATTR = struct.Struct('<QHd')
+_NAME = struct.Struct('<HB')
+_CHECKPOINT = struct.Struct('<III')
+
+_FIXED = {TURN: _TURN, ADD: _ADD, REMOVE: _REMOVE, MOVE: _MOVE, DROP: _DROP, ATTR: _ATTR}
+
+
+def _value(value):
+    """Returns an attribute value read from the journal. Values are stored
+    as floats, so integral values are returned as integers.
+    """
+    return int(value) if value.is_integer() else value
+
+
+JournalCell = namedtuple('JournalCell', ['id', 'name', 'x', 'y', 'layer'])
+JournalCell.__doc__ = '''JournalCell contains a cell as it is recorded in a journal.
+
+    id (int) : cell ID.
+    name (str) : cell name.
+    x (int) : cell X-coordinate.
+    y (int) : cell Y-coordinate.
+    layer (LType) : layer where the cell is placed.
+'''
+
+
+class JournalState(object):
+    """JournalState class contains the board state rebuilt from a journal:
+    all cells placed in the board and the current value for the attributes
+    of every watched object.
+    """
+
+    def __init__(self, turn=0):
+        """JournalState class initialization method.
+
+        Args:
+            turn (int) : turn for the state.
+        """
+        self.turn = turn
+        self.cells = {}
+        self.attrs = {}
+
+    def copy(self):
+        """Returns a new state with the same values.
+
+        Returns:
+            JournalState : new state.
+        """
+        state = JournalState(self.turn)
+        state.cells = dict(self.cells)
+        state.attrs = dict([(k, dict(v)) for k, v in self.attrs.items()])
+        return state
+
+    def get_cells_at(self, x, y):
+        """Returns all cells at the given position.
+
+        Args:
+            x (int) : X-coordinate.
+            y (int) : Y-coordinate.
+
+        Returns:
+            list : list with JournalCell instances.
+        """
+        return [cell for cell in self.cells.values() if cell.x == x and cell.y == y]
+
+    def __eq__(self, other):
+        """Two states are equal if they contain the same cells and the same
+        attribute values.
+        """
+        if isinstance(other, JournalState):
+            return self.cells == other.cells and self.attrs == other.attrs
+        return NotImplemented
+
+    def __repr__(self):
+        """String representation for the JournalState instance.
+        """
+        return 'Turn {0}: {1} cells, {2} attrs'.format(self.turn, len(self.cells), len(self.attrs))
+
+
+class Journal(object):
+    """Journal class records every board change in an append-only binary
+    journal, so the board state for any turn can be rebuilt without running
+    the game again.
+
+    Journal records cells added to and removed from the board, cells moved,
+    rows dropped from the board when it scrolls, and current values for
+    attributes in watched objects when they are incremented or decremented.
+    A checkpoint with the full state is recorded every given number of
+    turns, so replays start from the nearest checkpoint.
+
+    IDs are recorded as 64-bit unsigned integers and attribute values as
+    doubles, so any ID and any value, like values with multiplicative buffs,
+    can be recorded.
+
+    Attributes updated in bulk through a StatsTable are not recorded.
+
+    Example:
+        >>> from rpgrun.board.board import Board
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.bpoint import Location
+        >>> from rpgrun.game.actor import Actor
+        >>> board = Board(2, 3)
+        >>> journal = Journal(checkpoint_every=2)
+        >>> board.journal = journal
+        >>> board[0].cellrow, board[1].cellrow = 1, 0
+        >>> actor = Actor(0, 0, 'orc')
+        >>> actor.attrs.setup_attrs_from_list([('hp', 10, 2)])
+        >>> journal.watch(actor)
+        >>> board.add_cell_to_layer(actor, LType.OBJECT)
+        True
+        >>> journal.mark_turn()
+        1
+        >>> board.move_cell(actor, Location.RIGHT, 2)
+        True
+        >>> actor.attrs['hp'].dec(3)
+        >>> journal.mark_turn()
+        2
+        >>> board.move_cell(actor, Location.FRONT, 1)
+        True
+        >>> state = journal.replay(1)
+        >>> [(x.name, x.x, x.y, x.layer) for x in state.get_cells_at(2, 0)], state.attrs[actor.id]
+        ([('orc', 2, 0, <LType.OBJECT: 3>)], {'hp': 7})
+        >>> journal.replay(0).get_cells_at(0, 0)[0].id == actor.id
+        True
+        >>> journal.replay() == journal.state
+        True
+        >>> Journal.from_bytes(journal.to_bytes()).replay(1) == journal.replay(1)
+        True
+    """
+
+    def __init__(self, checkpoint_every=10):
+        """Journal class initialization method.
+
+        Args:
+            checkpoint_every (int) : number of turns between checkpoints.\
+                    No checkpoint is recorded if it is zero.
+        """
+        self.checkpoint_every = checkpoint_every
+        self.turn = 0
+        self.state = JournalState()
+        self._data = bytearray(MAGIC)
+        self._names = {}
+        self._name_list = []
+        self._checkpoints = []
+
+    def __len__(self):
+        """Returns the journal size in bytes.
+        """
+        return len(self._data)
+
+    @property
+    def checkpoints(self):
+        """Gets turns with a checkpoint.
+
+        Returns:
+            list : list with turns.
+        """
+        return [x[0] for x in self._checkpoints]
+
+    def _name_index(self, name):
+        """Returns the index for the given name, recording the name the
+        first time it is used.
+        """
+        if name is None:
+            return NO_NAME
+        index = self._names.get(name)
+        if index is None:
+            index = len(self._name_list)
+            self._names[name] = index
+            self._name_list.append(name)
+            data = str(name).encode('utf-8')
+            self._data += _OP.pack(NAME) + _NAME.pack(index, len(data)) + data
+        return index
+
+    def _name(self, index):
+        """Returns the name for the given index.
+        """
+        return None if index == NO_NAME else self._name_list[index]
+
+    def _write(self, op, *args):
+        """Appends a record to the journal and applies it to the current
+        state.
+        """
+        self._data += _OP.pack(op) + _FIXED[op].pack(*args)
+        self._apply(self.state, op, args)
+
+    def _apply(self, state, op, args):
+        """Applies a record to the given state.
+        """
+        if op == ADD:
+            state.cells[args[0]] = JournalCell(args[0], self._name(args[4]), args[1], args[2], LType(args[3]))
+        elif op == REMOVE:
+            state.cells.pop(args[0], None)
+        elif op == MOVE:
+            cell = state.cells.get(args[0])
+            if cell is not None:
+                state.cells[args[0]] = cell._replace(x=args[1], y=args[2])
+        elif op == DROP:
+            for cell in [x for x in state.cells.values() if x.y == args[0]]:
+                del state.cells[cell.id]
+        elif op == ATTR:
+            state.attrs.setdefault(args[0], {})[self._name(args[1])] = args[2]
+        elif op == TURN:
+            state.turn = args[0]
+
+    def cell_added(self, cell):
+        """Records a cell added to the board.
+
+        Args:
+            cell (BCell) : cell added.
+
+        Example:
+            >>> from types import SimpleNamespace
+            >>> journal = Journal()
+            >>> cell = SimpleNamespace(id=2 ** 40, name='orc', x=1, y=2, layer=None, Layer=LType.OBJECT)
+            >>> journal.cell_added(cell)
+            >>> Journal.from_bytes(journal.to_bytes()).replay().cells
+            {1099511627776: JournalCell(id=1099511627776, name='orc', x=1, y=2, layer=<LType.OBJECT: 3>)}
+        """
+        layer = cell.layer.type if cell.layer is not None else cell.Layer
+        self._write(ADD, cell.id, cell.x, cell.y, layer.value, self._name_index(cell.name))
+
+    def cell_removed(self, cell):
+        """Records a cell removed from the board.
+
+        Args:
+            cell (BCell) : cell removed.
+        """
+        self._write(REMOVE, cell.id)
+
+    def cell_moved(self, cell):
+        """Records a cell moved in the board.
+
+        Args:
+            cell (BCell) : cell moved.
+        """
+        self._write(MOVE, cell.id, cell.x, cell.y)
+
+    def row_dropped(self, cellrow):
+        """Records a row removed from the board, with all its cells.
+
+        Args:
+            cellrow (int) : cell row for the row removed.
+        """
+        self._write(DROP, cellrow)
+
+    def attr_changed(self, id, attr):
+        """Records the current value for an attribute.
+
+        Args:
+            id (int) : ID for the object the attribute belongs to.
+            attr (Attr) : attribute changed.
+
+        Example:
+            >>> from rpgrun.game.attr import Attr, Stacking
+            >>> journal = Journal()
+            >>> rage = Attr('rage', Stacking.MUL)
+            >>> rage.base = 3
+            >>> rage.add_buff('fury', 1.5)
+            True
+            >>> journal.attr_changed(7, rage)
+            >>> rage.dec(2)
+            >>> journal.attr_changed(7, rage)
+            >>> Journal.from_bytes(journal.to_bytes()).replay().attrs
+            {7: {'rage': 2.5}}
+            >>> journal.checkpoint()
+            >>> Journal.from_bytes(journal.to_bytes()).replay(0).attrs
+            {7: {'rage': 2.5}}
+        """
+        self._write(ATTR, id, self._name_index(attr.name), attr.now)
+
+    def watch(self, obj):
+        """Records all attributes for the given object, and any change made
+        with their inc or dec methods.
+
+        Args:
+            obj (BObject) : object to watch.
+        """
+        for attr in obj.attrs:
+            attr.on_change = partial(self.attr_changed, obj.id)
+            self.attr_changed(obj.id, attr)
+
+    def unwatch(self, obj):
+        """Stops recording attribute changes for the given object.
+
+        Args:
+            obj (BObject) : object to unwatch.
+        """
+        for attr in obj.attrs:
+            attr.on_change = None
+
+    def mark_turn(self):
+        """Records the start of a new turn, and a checkpoint if it is
+        required.
+
+        Returns:
+            int : new turn.
+        """
+        self.turn += 1
+        self._write(TURN, self.turn)
+        if self.checkpoint_every and self.turn % self.checkpoint_every == 0:
+            self.checkpoint()
+        return self.turn
+
+    def checkpoint(self):
+        """Records a checkpoint with the current state.
+        """
+        state = self.state
+        attrs = [(k, self._name_index(n), v) for k, values in state.attrs.items() for n, v in values.items()]
+        cells = [(x.id, x.x, x.y, x.layer.value, self._name_index(x.name)) for x in state.cells.values()]
+        self._checkpoints.append((state.turn, len(self._data)))
+        data = [_OP.pack(CHECKPOINT), _CHECKPOINT.pack(state.turn, len(cells), len(attrs))]
+        data.extend([_ADD.pack(*x) for x in cells])
+        data.extend([_ATTR.pack(*x) for x in attrs])
+        self._data += b''.join(data)
+
+    def _records(self, offset):
+        """Decodes all records from the given offset.
+
+        Yields:
+            tuple : record operation, arguments and offset after the record.
+        """
+        data = self._data
+        size = len(data)
+        while offset < size:
+            op, = _OP.unpack_from(data, offset)
+            offset += _OP.size
+            if op == NAME:
+                index, length = _NAME.unpack_from(data, offset)
+                offset += _NAME.size
+                args = (index, bytes(data[offset:offset + length]).decode('utf-8'))
+                offset += length
+            elif op == CHECKPOINT:
+                turn, ncells, nattrs = _CHECKPOINT.unpack_from(data, offset)
+                offset += _CHECKPOINT.size
+                cells = [_ADD.unpack_from(data, offset + i * _ADD.size) for i in range(ncells)]
+                offset += ncells * _ADD.size
+                attrs = [_ATTR.unpack_from(data, offset + i * _ATTR.size) for i in range(nattrs)]
+                attrs = [(x[0], x[1], _value(x[2])) for x in attrs]
+                offset += nattrs * _ATTR.size
+                args = (turn, cells, attrs)
+            else:
+                args = _FIXED[op].unpack_from(data, offset)
+                offset += _FIXED[op].size
+                if op == ATTR:
+                    args = (args[0], args[1], _value(args[2]))
+            yield op, args, offset
+
+    def replay(self, turn=None):
+        """Rebuilds the board state at the end of the given turn, starting
+        from the nearest checkpoint.
+
+        Args:
+            turn (int) : turn to rebuild. Default is the last turn.
+
+        Returns:
+            JournalState : state at the end of the turn.
+        """
+        offset = len(MAGIC)
+        for checkpoint_turn, checkpoint_offset in self._checkpoints:
+            if turn is not None and checkpoint_turn > turn:
+                break
+            offset = checkpoint_offset
+        state = JournalState()
+        for op, args, _ in self._records(offset):
+            if op == TURN and turn is not None and args[0] > turn:
+                break
+            if op == CHECKPOINT:
+                state = JournalState(args[0])
+                for cell in args[1]:
+                    self._apply(state, ADD, cell)
+                for attr in args[2]:
+                    self._apply(state, ATTR, attr)
+            elif op != NAME:
+                self._apply(state, op, args)
+        return state
+
+    def to_bytes(self):
+        """Returns the journal in binary format.
+
+        Returns:
+            bytes : journal data.
+        """
+        return bytes(self._data)
+
+    @classmethod
+    def from_bytes(cls, data, checkpoint_every=10):
+        """Loads a journal in binary format.
+
+        Names and checkpoints are indexed, but records are not applied until
+        the journal is replayed.
+
+        Args:
+            data (bytes) : journal data.
+            checkpoint_every (int) : number of turns between checkpoints.
+
+        Returns:
+            Journal : loaded journal.
+
+        Raises:
+            ValueError : when data is not in binary format.
+        """
+        if bytes(data[:len(MAGIC)]) != MAGIC:
+            raise ValueError
+        journal = cls(checkpoint_every)
+        journal._data = bytearray(data)
+        for op, args, offset in journal._records(len(MAGIC)):
+            if op == NAME:
+                journal._names[args[1]] = args[0]
+                journal._name_list.append(args[1])
+            elif op == CHECKPOINT:
+                journal._checkpoints.append((args[0], offset - journal._checkpoint_size(args)))
+            elif op == TURN:
+                journal.turn = args[0]
+        journal.state = journal.replay()
+        return journal
+
+    @staticmethod
+    def _checkpoint_size(args):
+        """Returns the size for a checkpoint record with the given
+        arguments.
+        """
+        return _OP.size + _CHECKPOINT.size + len(args[1]) * _ADD.size + len(args[2]) * _ATTR.size
+
+    def save_file(self, filename):
+        """Saves the journal in binary format.
+
+        Args:
+            filename (str) : file to save.
+        """
+        with open(filename, 'wb') as file:
+            file.write(self._data)
+
+    @classmethod
+    def load_file(cls, filename, checkpoint_every=10):
+        """Loads a journal from a file in binary format.
+
+        Args:
+            filename (str) : file to load.
+            checkpoint_every (int) : number of turns between checkpoints.
+
+        Returns:
+            Journal : loaded journal.
+        """
+        with open(filename, 'rb') as file:
+            return cls.from_bytes(file.read(), checkpoint_every)
+
+    def __repr__(self):
+        """String representation for the Journal instance.
+        """
+        return 'Journal: turn {0}, {1} bytes, {2} checkpoints'.format(self.turn, len(self), len(self._checkpoints))
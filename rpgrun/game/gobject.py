@@ -1,5 +1,5 @@
 import rpgrun.common.ids as ids
-from rpgrun.game.attr import Attributes
+from rpgrun.game.attr import Attributes, install_accessor
 
 
 class GObject(object):
@@ -13,7 +13,7 @@ class GObject(object):
         self.name = kwargs.get('name', None)
         self._desc = kwargs.get('desc', '')
         self.attrs = Attributes()
-        self.__id = ids.new_id()
+        self.__id = ids.register(self)
 
     @property
     def id(self):
@@ -25,22 +25,37 @@ class GObject(object):
         """Overwrite __getattr__ method allowing to access values inside attrs
         as regular instance attributes.
 
+        An accessor is installed in the class the first time an attribute is
+        read, so next reads do not call this method.
+
         >>> from rpgrun.game.attr import Attr
         >>> g = GObject(name='new')
         >>> g.add_attr(Attr('HP'))
         HP: 0/0
         >>> g.HP
         0
+        >>> import pickle
+        >>> pickle.loads(pickle.dumps(g)).attrs
+        HP: 0/0
         """
-        if 'attrs' in self.__dict__ and theAttr in self.__dict__['attrs']:
-            return self.attrs[theAttr].now
+        if theAttr.startswith('__'):
+            raise AttributeError(theAttr)
+        # Values set for any name with an accessor installed, in instances
+        # without that attribute, are kept in the instance dictionary.
+        if theAttr in self.__dict__:
+            return self.__dict__[theAttr]
+        attrs = self.__dict__.get('attrs')
+        if attrs is not None and theAttr in attrs:
+            install_accessor(self.__class__, theAttr, attrs)
+            return attrs[theAttr].now
         return AttributeError
 
     def __setattr__(self, theAttr, theValue):
         """Overwrite __setattr__ method so values from attrs can not be
         modified as instance attributes.
         """
-        if 'attrs' in self.__dict__ and theAttr in self.__dict__['attrs']:
+        attrs = self.__dict__.get('attrs')
+        if attrs is not None and theAttr in attrs:
             raise AttributeError
         else:
             super(GObject, self).__setattr__(theAttr, theValue)
@@ -0,0 +1,138 @@
+import functools
+from rpgrun.board.bpath import GridSet, free_rows
+from rpgrun.board.bshapes import _footprint
+
+
+class Reachability(object):
+    """Reachability class computes all positions where move actions can move
+    their originator: positions inside the action area of effect, inside the
+    board, and not blocked by any cell with collision, like walls or other
+    actors.
+
+    Every grid row is kept as a bitset, and every area of effect as one
+    bitset for every row it covers, so a move set is computed with a few
+    integer operations per row instead of checking every position. Move
+    sets are kept until the walkability grid changes.
+
+    Example:
+        >>> from rpgrun.board.bcell import BCell
+        >>> from rpgrun.board.blayer import LType
+        >>> from rpgrun.board.bpath import PathGrid
+        >>> from rpgrun.board.bpoint import Location
+        >>> from rpgrun.board.bshapes import Rhomboid
+        >>> from rpgrun.game.action import AoEMoveAction, AType
+        >>> from rpgrun.game.actor import Actor
+        >>> from rpgrun.game.game import Game
+        >>> game = Game(4, 4, headless=True)
+        >>> for index, row in enumerate(game.board):
+        ...     row.cellrow = 3 - index
+        >>> actors = [Actor(1, 1, 'me'), Actor(1, 2, 'other')]
+        >>> for actor in actors:
+        ...     _ = game.board.add_cell_to_layer(actor, LType.OBJECT)
+        >>> action = AoEMoveAction('move', AType.MOVEMENT, width=2, height=2, shape=Rhomboid)
+        >>> action.originator = actors[0]
+        >>> reach = Reachability(PathGrid(game.board))
+        >>> moves = reach.move_set(action)
+        >>> key = lambda p: (p.y, p.x)
+        >>> sorted(moves, key=key) == sorted([x for x in action.move_choices() if reach.grid.is_walkable(x.x, x.y)], key=key)
+        True
+        >>> list(moves)
+        [(1, 0), (0, 1), (2, 1)]
+        >>> reach.move_set(action) is moves
+        True
+        >>> game.board.move_cell(actors[1], Location.RIGHT, 2)
+        True
+        >>> list(reach.move_set(action))
+        [(1, 0), (0, 1), (2, 1), (1, 2)]
+    """
+
+    def __init__(self, grid):
+        """Reachability class initialization method.
+
+        Args:
+            grid (PathGrid) : walkability grid.
+        """
+        self.grid = grid
+        self._free = None
+        self._sets = {}
+        self._revision = None
+
+    def _refresh(self):
+        """Clears all move sets when the walkability grid changed.
+        """
+        grid = self.grid
+        grid.refresh()
+        if grid.revision != self._revision:
+            self._revision = grid.revision
+            self._sets.clear()
+            self._free = free_rows(grid)
+
+    def move_set(self, action):
+        """Returns all positions where the given action can move its
+        originator.
+
+        Args:
+            action (Action) : move action with an originator.
+
+        Returns:
+            GridSet : all valid positions.
+        """
+        self._refresh()
+        return self._move_set(action)
+
+    def _move_set(self, action):
+        """Returns all valid positions for the given action, without checking
+        the walkability grid for changes.
+        """
+        grid = self.grid
+        width, bottom, free = grid.width, grid.bottom, self._free
+        if not action.has_aoe:
+            return GridSet(0, width, bottom)
+        shape = action.aoe.shape
+        x, y = shape.center.x, shape.center.y
+        key = (x, y, shape.__class__, shape.width, shape.height)
+        moves = self._sets.get(key)
+        if moves is not None:
+            return moves
+        bits = 0
+        for dy, mask, dx in _footprint_rows(*key[2:]):
+            row = y + dy - bottom
+            if 0 <= row < len(free):
+                shift = x + dx
+                mask = mask << shift if shift >= 0 else mask >> -shift
+                bits |= (mask & free[row]) << (row * width)
+        if 0 <= x < width and 0 <= y - bottom < len(free):
+            bits &= ~(1 << ((y - bottom) * width + x))
+        moves = self._sets[key] = GridSet(bits, width, bottom)
+        return moves
+
+    def move_sets(self, actions):
+        """Returns all positions where every given action can move its
+        originator.
+
+        Walkability grid is checked only once for all actions.
+
+        Args:
+            actions (list) : list of move actions with an originator.
+
+        Returns:
+            dict : move set for every action.
+        """
+        self._refresh()
+        return dict([(action, self._move_set(action)) for action in actions])
+
+
+@functools.lru_cache(maxsize=256)
+def _footprint_rows(klass, width, height):
+    """Returns the footprint for the given shape class and dimensions as a
+    tuple of (dy, bitset, dx) entries, where bit k is set when the offset
+    (dx + k, dy) is in the footprint.
+    """
+    offsets = {}
+    for dx, dy in _footprint(klass, width, height)[0]:
+        offsets.setdefault(dy, set()).add(dx)
+    rows = []
+    for dy, dxs in sorted(offsets.items()):
+        base = min(dxs)
+        rows.append((dy, sum([1 << (dx - base) for dx in dxs]), base))
+    return tuple(rows)
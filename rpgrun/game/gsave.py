@@ -0,0 +1,745 @@
+import mmap
+import struct
+import zlib
+from enum import Enum
+from rpgrun.board.bcell import BCell
+from rpgrun.board.bshapes import Quad, Rectangle, Rhomboid, Star
+from rpgrun.board.blayer import LType
+from rpgrun.board.bobject import BObject
+from rpgrun.board.bsprite import TextSprite
+from rpgrun.board.bsurface import BSurface
+from rpgrun.game.action import Action, AoEMoveAction, AoETargetAction, AType, MoveAction, TargetAction
+from rpgrun.game.actor import Actor
+from rpgrun.game.attr import Attr, SharedAttributes, Stacking
+from rpgrun.game.game import Game
+from rpgrun.game.gequip import GEquip
+from rpgrun.game.gitem import GItem
+from rpgrun.game.gstages import Stages
+from rpgrun.game.gstats import StatsTable
+from rpgrun.game.pactor import PActor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+MAGIC = b'RGSV'
+"""Header for saved games."""
+
+VERSION = 3
+"""Version for the saved game format."""
+
+NO_ROW = -2 ** 31
+"""Cell row for rows without any cell row."""
+
+NO_STR = 0xFFFFFFFF
+"""String index for missing strings."""
+
+WALKABLE = 1
+SOLID = 2
+STATIC = 4
+ACTOR = 8
+
+_HEADER = struct.Struct('<4sHBBiiIIIQQ')
+_CELL = struct.Struct('<iiii')
+_ROW = struct.Struct('<i')
+_OBJECTS = struct.Struct('<IIIiBB')
+_STR = struct.Struct('<I')
+_CELL_DATA = struct.Struct('<iiIIIIIiBH')
+_ATTR = struct.Struct('<IIBdddH')
+_BUFF = struct.Struct('<Id')
+_INDEX = struct.Struct('<I')
+_ACTOR = struct.Struct('<IHHHH')
+_ITEM = struct.Struct('<IIHH')
+_ACTION = struct.Struct('<IIBIii')
+
+_TYPES = {}
+_ARCHETYPES = {}
+
+
+class Compression(Enum):
+    """Compression class enumeration provides all compressions available
+    for the objects in a saved game.
+
+    Grid is never compressed, so it can always be memory mapped.
+    """
+    NONE = 0
+    ZLIB = 1
+    ZSTD = 2
+
+
+def _compress(data, compression):
+    """Compresses data with the given compression.
+
+    Raises:
+        NotImplementedError : when zstandard is not available.
+    """
+    if compression is Compression.ZLIB:
+        return zlib.compress(data, 1)
+    if compression is Compression.ZSTD:
+        if zstandard is None:
+            raise NotImplementedError
+        return zstandard.ZstdCompressor().compress(data)
+    return data
+
+
+def _decompress(data, compression):
+    """Decompresses data with the given compression.
+
+    Raises:
+        NotImplementedError : when zstandard is not available.
+    """
+    if compression is Compression.ZLIB:
+        return zlib.decompress(data)
+    if compression is Compression.ZSTD:
+        if zstandard is None:
+            raise NotImplementedError
+        return zstandard.ZstdDecompressor().decompress(data)
+    return data
+
+
+def _value(value):
+    """Returns an attribute value read from a saved game. Values are stored
+    as floats, so integral values are returned as integers.
+    """
+    return int(value) if value.is_integer() else value
+
+
+def _type_name(klass):
+    """Returns the name used to save cells of the given class.
+    """
+    return '{0}.{1}'.format(klass.__module__, klass.__qualname__)
+
+
+def register_type(klass, factory=None):
+    """Registers a cell, item, action or shape class, so instances of that
+    class can be saved and restored.
+
+    Restored instances are created by the factory, and then any saved
+    field is set from the saved game. Factory arguments are the ones for
+    the base class constructor:
+
+    - Cells: x, y and name. Flags, text sprite and attributes are set
+      later, and any other state, like graph sprites, has to be created by
+      the factory.
+    - Items: name keyword. Attribute buffs and actions are set later.
+    - Actions: name, type and, for actions with an area of effect, width,
+      height and shape keywords.
+    - Shapes: center, width and height.
+
+    Args:
+        klass (class) : BCell, GItem, Action or Shape class.
+        factory (object) : callable that returns a new instance. Default\
+                is the class.
+
+    Example:
+        >>> class Rock(BObject):
+        ...     __slots__ = ()
+        >>> register_type(Rock)
+        >>> game = Game(2, 1, headless=True)
+        >>> _ = game.board[0].add_cell_to_layer(BSurface(1, 0, 'floor'), LType.SURFACE)
+        >>> _ = game.board.add_cell_to_layer(Rock(1, 0, 'rock'), LType.OBJECT)
+        >>> other = loads(dumps(game), headless=True)
+        >>> from rpgrun.board.bpoint import BPoint
+        >>> [type(x).__name__ for x in other.board.get_cells_at(BPoint(1, 0))]
+        ['BSurface', 'Rock']
+    """
+    _TYPES[_type_name(klass)] = factory if factory is not None else klass
+
+
+for _klass in (BCell, BSurface, BObject, Actor, PActor, GItem, GEquip,
+               Action, TargetAction, AoETargetAction, MoveAction, AoEMoveAction,
+               Quad, Rectangle, Rhomboid, Star):
+    register_type(_klass)
+
+
+def register_archetype(archetype):
+    """Registers an archetype, so actors keep it when they are saved and
+    restored, with its shared actions. Archetypes are found by name.
+
+    Args:
+        archetype (Archetype) : archetype to register.
+    """
+    _ARCHETYPES[archetype.name] = archetype
+
+
+def _factory(name):
+    """Returns the factory for the given type name.
+
+    Raises:
+        ValueError : when the type is not registered.
+    """
+    factory = _TYPES.get(name)
+    if factory is None:
+        raise ValueError('type {0} is not registered'.format(name))
+    return factory
+
+
+def _registered(instance):
+    """Returns the type name for the given instance.
+
+    Raises:
+        ValueError : when the instance class is not registered.
+    """
+    name = _type_name(type(instance))
+    if name not in _TYPES:
+        raise ValueError('type {0} is not registered'.format(name))
+    return name
+
+
+class _Strings(object):
+    """Table with all strings in a saved game, every string is saved once.
+    """
+
+    def __init__(self):
+        self.index = {}
+
+    def __call__(self, value):
+        """Returns the string index for the given string.
+        """
+        if value is None:
+            return NO_STR
+        index = self.index.get(value)
+        if index is None:
+            index = self.index[value] = len(self.index)
+        return index
+
+    def pack(self):
+        """Returns all strings in binary format.
+        """
+        data = []
+        for value in self.index:
+            value = value.encode('utf-8')
+            data.append(_STR.pack(len(value)))
+            data.append(value)
+        return b''.join(data)
+
+
+def _attrs_of(cell):
+    """Returns all attributes for the given cell. Attributes shared with an
+    archetype are not copied.
+    """
+    attrs = cell.attrs
+    if isinstance(attrs, SharedAttributes):
+        shared = [x for k, x in attrs._prototype.items() if attrs._shared(k) is not None]
+        return shared + [x for _, x in super(SharedAttributes, attrs).items()]
+    return [x for _, x in attrs.items()]
+
+
+def _pack_action(action, strings):
+    """Returns the given action in binary format. Originator and targets
+    are not saved.
+
+    Raises:
+        ValueError : when the action or shape class is not registered.
+    """
+    shape = action.aoe.shape
+    if shape is not None:
+        shape_name, width, height = strings(_registered(shape)), shape.width, shape.height
+    else:
+        shape_name, width, height = NO_STR, -1, -1
+    return _ACTION.pack(strings(_registered(action)), strings(action.name),
+                        action.type.value, shape_name, width, height)
+
+
+def _unpack_action(data, offset, strings):
+    """Creates an action from the given binary data.
+
+    Returns:
+        tuple : new action and offset after the action data.
+
+    Raises:
+        ValueError : when the action or shape class is not registered.
+    """
+    klass, name, type_, shape, width, height = _ACTION.unpack_from(data, offset)
+    kwargs = {}
+    if shape != NO_STR:
+        kwargs = {'width': width, 'height': height, 'shape': _factory(strings[shape])}
+    action = _factory(strings[klass])(strings[name], AType(type_), **kwargs)
+    return action, offset + _ACTION.size
+
+
+def _pack_item(item, strings):
+    """Returns the given item in binary format, with its attribute buffs
+    and, for equipment items, its actions.
+
+    Raises:
+        ValueError : when the item or any action class is not registered.
+    """
+    buffs = list(item.attr_buff.items())
+    actions = list(item.actions) if item.is_equip() else []
+    data = [_ITEM.pack(strings(_registered(item)), strings(item.name), len(buffs), len(actions))]
+    data.extend([_BUFF.pack(strings(k), v) for k, v in buffs])
+    data.extend([_pack_action(x, strings) for x in actions])
+    return b''.join(data)
+
+
+def _unpack_item(data, offset, strings):
+    """Creates an item from the given binary data.
+
+    Returns:
+        tuple : new item and offset after the item data.
+
+    Raises:
+        ValueError : when the item or any action class is not registered.
+    """
+    klass, name, nbuffs, nactions = _ITEM.unpack_from(data, offset)
+    offset += _ITEM.size
+    item = _factory(strings[klass])(name=strings[name])
+    item.attr_buff = {}
+    for _ in range(nbuffs):
+        buff, value = _BUFF.unpack_from(data, offset)
+        offset += _BUFF.size
+        item.attr_buff[strings[buff]] = _value(value)
+    for _ in range(nactions):
+        action, offset = _unpack_action(data, offset, strings)
+        item.actions.append(action)
+    return item, offset
+
+
+def _pack_actor(actor, strings):
+    """Returns the archetype name, actions, inventory and equipment for the
+    given actor in binary format.
+
+    Every item is saved once, and inventory and equipment are saved as
+    indexes to those items, so items in both are restored as one instance.
+    Archetype actions are not saved, they are created again by the
+    archetype.
+
+    Raises:
+        ValueError : when the archetype, or any item or action class is not\
+                registered.
+    """
+    archetype = actor.archetype
+    if archetype is not None and _ARCHETYPES.get(archetype.name) is not archetype:
+        raise ValueError('archetype {0} is not registered'.format(archetype.name))
+    actions = list(actor._actions) if actor._actions is not None else []
+    inventory = list(actor._inventory) if actor._inventory is not None else []
+    equipment = list(actor._equipment) if actor._equipment is not None else []
+    items = {}
+    for item in inventory + equipment:
+        items.setdefault(id(item), (len(items), item))
+    data = [_ACTOR.pack(strings(archetype.name if archetype is not None else None),
+                        len(actions), len(items), len(inventory), len(equipment))]
+    data.extend([_pack_action(x, strings) for x in actions])
+    data.extend([_pack_item(x, strings) for _, x in items.values()])
+    data.extend([_INDEX.pack(items[id(x)][0]) for x in inventory + equipment])
+    return b''.join(data)
+
+
+def _unpack_actor(actor, data, offset, strings):
+    """Restores archetype, actions, inventory and equipment for the given
+    actor from the given binary data. Equipment items buff the actor again,
+    with the same buffs already restored in its attributes.
+
+    Returns:
+        int : offset after the actor data.
+
+    Raises:
+        ValueError : when the archetype, or any item or action class is not\
+                registered.
+    """
+    archetype, nactions, nitems, ninventory, nequipment = _ACTOR.unpack_from(data, offset)
+    offset += _ACTOR.size
+    if archetype != NO_STR:
+        if strings[archetype] not in _ARCHETYPES:
+            raise ValueError('archetype {0} is not registered'.format(strings[archetype]))
+        actor.archetype = _ARCHETYPES[strings[archetype]]
+    for _ in range(nactions):
+        action, offset = _unpack_action(data, offset, strings)
+        actor.actions.append(action)
+    items = []
+    for _ in range(nitems):
+        item, offset = _unpack_item(data, offset, strings)
+        items.append(item)
+    size = (ninventory + nequipment) * _INDEX.size
+    indexes = [x for x, in _INDEX.iter_unpack(data[offset:offset + size])]
+    for index in indexes[:ninventory]:
+        actor.inventory.append(items[index])
+    for index in indexes[ninventory:]:
+        actor.equipment.append(items[index])
+    return offset + size
+
+
+def _pack_cell(cell, strings):
+    """Returns the given cell in binary format.
+
+    Raises:
+        ValueError : when the cell class, or any class or archetype in an\
+                actor, is not registered.
+    """
+    name = _registered(cell)
+    sprite = cell.sprite
+    if isinstance(sprite, TextSprite):
+        text, color, width = sprite.sprite, sprite.color, sprite.width
+    else:
+        text, color, width = None, None, None
+    flags = ((WALKABLE if cell.walkable else 0) |
+             (SOLID if cell.solid else 0) |
+             (STATIC if cell.static else 0) |
+             (ACTOR if isinstance(cell, Actor) else 0))
+    attrs = _attrs_of(cell) if isinstance(cell, BObject) else []
+    data = [_CELL_DATA.pack(cell.x, cell.y, strings(name), strings(cell.name),
+                            strings(cell.desc), strings(text), strings(color),
+                            width if width is not None else -1, flags, len(attrs))]
+    for attr in attrs:
+        buffs = list(attr.buffs.items())
+        data.append(_ATTR.pack(strings(attr.name), strings(attr.desc),
+                               attr.stacking.value, attr.base, attr.delta,
+                               attr._Attr__now, len(buffs)))
+        data.extend([_BUFF.pack(strings(k), v) for k, v in buffs])
+    if flags & ACTOR:
+        data.append(_pack_actor(cell, strings))
+    return b''.join(data)
+
+
+def _unpack_cell(data, offset, strings):
+    """Creates a cell from the given binary data.
+
+    Returns:
+        tuple : new cell and offset after the cell data.
+
+    Raises:
+        ValueError : when the cell class, or any class or archetype in an\
+                actor, is not registered.
+    """
+    (x, y, klass, name, desc, text, color, width,
+     flags, nattrs) = _CELL_DATA.unpack_from(data, offset)
+    offset += _CELL_DATA.size
+    cell = _factory(strings[klass])(x, y, strings[name])
+    cell.name = strings[name]
+    cell.desc = strings[desc]
+    cell.walkable = bool(flags & WALKABLE)
+    cell.solid = bool(flags & SOLID)
+    cell.static = bool(flags & STATIC)
+    if text != NO_STR:
+        cell.sprite = TextSprite(sprite=strings[text], color=strings[color],
+                                 width=width if width >= 0 else None)
+    for _ in range(nattrs):
+        attr_name, attr_desc, stacking, base, delta, now, nbuffs = _ATTR.unpack_from(data, offset)
+        offset += _ATTR.size
+        attr = Attr(strings[attr_name], Stacking(stacking))
+        attr.desc = strings[attr_desc]
+        attr.delta = _value(delta)
+        for _ in range(nbuffs):
+            buff, value = _BUFF.unpack_from(data, offset)
+            offset += _BUFF.size
+            attr.buffs[strings[buff]] = _value(value)
+        attr._Attr__now = _value(now)
+        attr.base = _value(base)
+        cell.attrs[attr.name] = attr
+    if flags & ACTOR:
+        offset = _unpack_actor(cell, data, offset, strings)
+    return cell, offset
+
+
+def _align(offset):
+    """Returns the given offset aligned to 8 bytes.
+    """
+    return (offset + 7) & ~7
+
+
+def dumps(game, compression=Compression.NONE):
+    """Saves the given game in binary format.
+
+    Saved game contains a header, a grid with one entry for every row and
+    every cell placed in the board, and all objects in the game.
+
+    Grid entries for cells are (cellrow, layer, x, index) integers, where
+    index is the position for the cell in the object section. Objects
+    section contains a string table, and then explicit fields for every
+    cell: type, position, name, description, flags, text sprite and
+    attributes with their base, delta, current value and buffs. Actors add
+    their archetype name, their own actions, and every item in their
+    inventory and equipment, with its type, name, attribute buffs and
+    actions. Actions keep their type, name, action type and area of effect.
+    Then it contains the actors, the player, the current stage and if stats
+    are kept in a table.
+
+    Any graph sprite is not saved, and actors keep their attributes, not
+    the ones shared with their archetype.
+
+    Args:
+        game (Game) : game to save.
+        compression (Compression) : compression for the objects.
+
+    Returns:
+        bytes : saved game.
+
+    Raises:
+        ValueError : when any class or archetype is not registered.
+
+    Example:
+        >>> from rpgrun.board.bshapes import Quad
+        >>> from rpgrun.game.actor import Archetype
+        >>> from rpgrun.game.gtemplate import AttrTemplate
+        >>> class Hit(AoETargetAction):
+        ...     def execute(self, game, **kwargs):
+        ...         self.target[0].attrs['hp'].dec(self.originator.STR)
+        >>> register_type(Hit)
+        >>> template = AttrTemplate.from_list('ORC', [('hp', 10, 2), ('str', 3, 1)])
+        >>> orc = Archetype('ORC', template, [lambda: Action('roar')])
+        >>> register_archetype(orc)
+        >>> game = Game(4, 4, headless=True)
+        >>> for index, row in enumerate(game.board):
+        ...     row.cellrow = 3 - index
+        >>> hero, enemy = orc.spawn(1, 1, 'hero'), orc.spawn(2, 2, 'enemy')
+        >>> sword = GEquip(name='sword', attr_buff={'str': 2})
+        >>> sword.actions.append(Hit('slash', AType.WEAPONIZE, width=2, height=2, shape=Quad))
+        >>> hero.inventory.append(GItem(name='potion'))
+        >>> hero.inventory.append(sword)
+        >>> hero.equipment.append(sword)
+        >>> hero.actions.append(Action('wait'))
+        >>> for actor in (hero, enemy):
+        ...     _ = game.board.add_cell_to_layer(actor, LType.OBJECT)
+        ...     game.add_actor(actor, actor is hero)
+        >>> other = loads(dumps(game), headless=True)
+        >>> hero = other.player
+        >>> [x.name for x in hero.inventory], [x.name for x in hero.equipment], hero.STR
+        (['potion', 'sword'], ['sword'], 5)
+        >>> hero.inventory['sword'] is hero.equipment['sword'], hero.archetype is orc
+        (True, True)
+        >>> [x.name for x in hero.all_actions]
+        ['roar', 'wait', 'slash']
+        >>> slash = hero.get_action_by_name('slash')
+        >>> slash.originator = hero
+        >>> targets = other.target_choices(slash)
+        >>> [x.name for x in targets]
+        ['enemy']
+        >>> slash.target = targets[0]
+        >>> slash.execute(other)
+        >>> other.find_actor_by_name('enemy').HP
+        5
+    """
+    board = game.board
+    with board.lock:
+        rows = []
+        grid = []
+        cells = {}
+        for row in board:
+            rows.append(row.cellrow if row.cellrow is not None else NO_ROW)
+            for layer in row:
+                for cell in layer:
+                    grid.append((row.cellrow, layer.type.value, cell.x, len(cells)))
+                    cells[id(cell)] = (len(cells), cell)
+        for actor in game.actors + [game.player]:
+            if actor is not None and id(actor) not in cells:
+                cells[id(actor)] = (len(cells), actor)
+        strings = _Strings()
+        data = [_pack_cell(cell, strings) for _, cell in cells.values()]
+        data.extend([_INDEX.pack(cells[id(x)][0]) for x in game.actors])
+        player = cells[id(game.player)][0] if game.player is not None else -1
+        data.insert(0, strings.pack())
+        data.insert(0, _OBJECTS.pack(len(strings.index), len(cells), len(game.actors),
+                                     player, game.stage.value, game.stats is not None))
+    objects = _compress(b''.join(data), compression)
+    grid_offset = _align(_HEADER.size)
+    grid_size = len(rows) * _ROW.size + len(grid) * _CELL.size
+    objects_offset = _align(grid_offset + grid_size)
+    header = _HEADER.pack(MAGIC, VERSION, compression.value, 0,
+                          board.width, board.maxlen, len(rows), len(grid), 0,
+                          objects_offset, len(objects))
+    data = [header, bytes(grid_offset - len(header))]
+    data.extend([_ROW.pack(x) for x in rows])
+    data.extend([_CELL.pack(*x) for x in grid])
+    data.append(bytes(objects_offset - grid_offset - grid_size))
+    data.append(objects)
+    return b''.join(data)
+
+
+def save_game(game, filename, compression=Compression.NONE):
+    """Saves the given game in a file.
+
+    Args:
+        game (Game) : game to save.
+        filename (str) : file to save.
+        compression (Compression) : compression for the objects.
+    """
+    with open(filename, 'wb') as file:
+        file.write(dumps(game, compression))
+
+
+class SavedGame(object):
+    """SavedGame class reads a game saved in binary format.
+
+    Grid is a view over the saved data, so it is not copied. When the saved
+    game is opened from a file, the file is memory mapped, so the grid can
+    be read without reading the whole file. Objects are loaded only when the
+    game is restored.
+
+    Example:
+        >>> from rpgrun.board.bsurface import BSurface
+        >>> from rpgrun.board.bsprite import TextSprite
+        >>> from rpgrun.game.actor import Actor
+        >>> game = Game(3, 2, headless=True)
+        >>> for index, row in enumerate(game.board):
+        ...     for x in range(3):
+        ...         _ = row.add_cell_to_layer(BSurface(x, 1 - index, 'floor', sprite=TextSprite(sprite='.')), LType.SURFACE)
+        >>> player = Actor(1, 0, 'hero', sprite=TextSprite(sprite='@'))
+        >>> player.attrs.setup_attrs_from_list([('hp', 10, 2, {'armor': 3})])
+        >>> player.HP
+        13
+        >>> _ = game.board.add_cell_to_layer(player, LType.OBJECT)
+        >>> game.add_actor(player, True)
+        >>> player.attrs['hp'].dec(4)
+        >>> saved = SavedGame(dumps(game, Compression.ZLIB))
+        >>> saved.width, saved.height, saved.rows.tolist()
+        (3, 2, [1, 0])
+        >>> saved.grid.tolist()[-1]
+        [0, 3, 1, 6]
+        >>> other = saved.load(headless=True)
+        >>> other.player.name, other.player.HP, other.player.attrs['hp'].buffs
+        ('hero', 9, {'armor': 3})
+        >>> [x.name for x in other.board.get_cells_at(other.player)]
+        ['floor', 'hero']
+        >>> import rpgrun.common.ids as ids
+        >>> other.player.id != player.id, ids.get_by_id(player.id) is player
+        (True, True)
+        >>> other.board.get_cell_by_id(other.player.id) is other.player
+        True
+        >>> other.board.render() == game.board.render()
+        True
+    """
+
+    def __init__(self, data):
+        """SavedGame class initialization method.
+
+        Args:
+            data (bytes) : saved game. Any object supporting the buffer\
+                    protocol, like a memory map, is valid.
+
+        Raises:
+            ValueError : when data is not a saved game or it uses another\
+                    version.
+        """
+        self._data = memoryview(data)
+        (magic, version, compression, _, self.width, self.height,
+         nrows, ncells, _, self._objects_offset, self._objects_size) = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError
+        self.compression = Compression(compression)
+        offset = _align(_HEADER.size)
+        self.rows = self._data[offset:offset + nrows * _ROW.size].cast('i')
+        offset += nrows * _ROW.size
+        self.grid = self._data[offset:offset + ncells * _CELL.size].cast('B').cast('i', [ncells, 4])
+
+    @classmethod
+    def open(cls, filename):
+        """Opens a saved game from a file, using a memory map.
+
+        Args:
+            filename (str) : file to open.
+
+        Returns:
+            SavedGame : saved game.
+        """
+        with open(filename, 'rb') as file:
+            instance = cls(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        return instance
+
+    def close(self):
+        """Releases the saved data. Grid can not be used after it is closed.
+        """
+        data = self._data.obj
+        self.rows.release()
+        self.grid.release()
+        self._data.release()
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _load_objects(self):
+        """Creates all objects in the saved game.
+
+        Every cell gets a new ID, so restored cells never replace entities
+        alive in the same process.
+        """
+        start = self._objects_offset
+        data = _decompress(self._data[start:start + self._objects_size], self.compression)
+        nstrings, ncells, nactors, player, stage, stats = _OBJECTS.unpack_from(data, 0)
+        offset = _OBJECTS.size
+        strings = {NO_STR: None}
+        for index in range(nstrings):
+            size, = _STR.unpack_from(data, offset)
+            offset += _STR.size
+            strings[index] = bytes(data[offset:offset + size]).decode('utf-8')
+            offset += size
+        cells = []
+        for _ in range(ncells):
+            cell, offset = _unpack_cell(data, offset, strings)
+            cells.append(cell)
+        actors = [cells[x] for x, in _INDEX.iter_unpack(data[offset:offset + nactors * _INDEX.size])]
+        return {'cells': cells,
+                'actors': actors,
+                'player': cells[player] if player >= 0 else None,
+                'stage': stage,
+                'stats': bool(stats)}
+
+    def load(self, **kwargs):
+        """Restores the saved game.
+
+        Run cycle is not saved, so it has to be initialized again for the
+        restored game.
+
+        Keyword Args:
+            Any keyword argument for the Game class, but stats.
+
+        Returns:
+            Game : restored game.
+
+        Raises:
+            ValueError : when any cell class is not registered.
+        """
+        objects = self._load_objects()
+        kwargs['stats'] = objects['stats']
+        game = Game(self.width, self.height, **kwargs)
+        board = game.board
+        with board.lock:
+            for row, cellrow in zip(board, self.rows.tolist()):
+                if cellrow != NO_ROW:
+                    row.cellrow = cellrow
+            rows = dict([(x.cellrow, x) for x in board if x.cellrow is not None])
+            cells = objects['cells']
+            for cellrow, layer, _, index in self.grid.tolist():
+                rows[cellrow].add_cell_to_layer(cells[index], LType(layer))
+            for actor in objects['actors']:
+                game.add_actor(actor)
+        game.player = objects['player']
+        game._stage = Stages(objects['stage'])
+        return game
+
+
+def loads(data, **kwargs):
+    """Restores a game saved in binary format.
+
+    Args:
+        data (bytes) : saved game.
+
+    Keyword Args:
+        Any keyword argument for the Game class, but stats.
+
+    Returns:
+        Game : restored game.
+    """
+    return SavedGame(data).load(**kwargs)
+
+
+def load_game(filename, **kwargs):
+    """Restores a game saved in a file.
+
+    Args:
+        filename (str) : file to load.
+
+    Keyword Args:
+        Any keyword argument for the Game class, but stats.
+
+    Returns:
+        Game : restored game.
+    """
+    with SavedGame.open(filename) as saved:
+        return saved.load(**kwargs)
@@ -0,0 +1,412 @@
+import random
+from collections import namedtuple
+from enum import Enum
+from rpgrun.board.bpoint import Location
+from rpgrun.game.game import Game
+
+
+class Outcome(Enum):
+    """Outcome class enumeration provides all possible match results.
+    """
+
+    WIN = 1
+    LOSE = 2
+    DRAW = 3
+
+
+MatchResult = namedtuple('MatchResult', ['seed', 'outcome', 'turns', 'actions',
+                                         'player_life', 'enemies', 'kills'])
+MatchResult.__doc__ = '''MatchResult contains the results for a simulated match.
+
+    seed (int) : seed used for the match.
+    outcome (Outcome) : match result.
+    turns (int) : number of turns played.
+    actions (int) : number of actions played by all actors.
+    player_life (int) : player life at the end of the match.
+    enemies (int) : number of enemies at the start of the match.
+    kills (int) : number of enemies removed from the game.
+'''
+
+
+class Scenario(object):
+    """Scenario class provides the interface to populate a game for a
+    simulated match.
+    """
+
+    def __init__(self, width, height, stats=False):
+        """Scenario class initialization method.
+
+        Args:
+            width (int) : board width.
+            height (int) : board height.
+            stats (bool) : True to keep actor attributes in a StatsTable.
+        """
+        self.width = width
+        self.height = height
+        self.stats = stats
+
+    def new_game(self):
+        """Creates a new headless game.
+
+        Returns:
+            Game : new game instance.
+        """
+        return Game(self.width, self.height, headless=True, stats=self.stats)
+
+    def setup(self, game, rand, **kwargs):
+        """Populates the given game with the board, the player and all
+        enemies.
+
+        Args:
+            game (Game) : game to populate.
+            rand (random.Random) : random generator for the match.
+
+        Keyword Args:
+            Any scenario parameter for the match, like equipment or\
+                    attribute values.
+        """
+        raise NotImplementedError
+
+    def new_row(self, game, rand):
+        """Returns a new row to be added to the board when it scrolls.
+
+        Args:
+            game (Game) : game instance.
+            rand (random.Random) : random generator for the match.
+
+        Returns:
+            BRow : new row.
+        """
+        raise NotImplementedError
+
+
+class Policy(object):
+    """Policy class provides the interface used by the simulation to select
+    actions, targets and movements for an actor.
+    """
+
+    rand = None
+
+    def reset(self, rand):
+        """Resets the policy at the start of every match.
+
+        Args:
+            rand (random.Random) : random generator for the match.
+        """
+        self.rand = rand
+
+    def select_action(self, game, actor, actions):
+        """Selects an action to be played.
+
+        Args:
+            game (Game) : game instance.
+            actor (Actor) : actor playing the action.
+            actions (list[Action]) : actions that can be played.
+
+        Returns:
+            Action : action to play. None to skip the actor turn.
+        """
+        raise NotImplementedError
+
+    def select_target(self, game, actor, action, targets):
+        """Selects the target for the action.
+
+        Args:
+            game (Game) : game instance.
+            actor (Actor) : actor playing the action.
+            action (Action) : action being played.
+            targets (list[BCell]) : cells that can be targeted.
+
+        Returns:
+            BCell : selected target.
+        """
+        raise NotImplementedError
+
+    def select_movement(self, game, actor, action, moves):
+        """Selects the movement for the action.
+
+        Args:
+            game (Game) : game instance.
+            actor (Actor) : actor playing the action.
+            action (Action) : action being played.
+            moves (list[tuple]) : (Location, int) movements that are valid.
+
+        Returns:
+            tuple : selected (Location, int) movement.
+        """
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """RandomPolicy class derives from Policy class and it selects any valid
+    action, target and movement at random.
+    """
+
+    def select_action(self, game, actor, actions):
+        """Selects any action at random.
+        """
+        return self.rand.choice(actions) if actions else None
+
+    def select_target(self, game, actor, action, targets):
+        """Selects any target at random.
+        """
+        return self.rand.choice(targets)
+
+    def select_movement(self, game, actor, action, moves):
+        """Selects any movement at random.
+        """
+        return self.rand.choice(moves)
+
+
+class ScriptedPolicy(Policy):
+    """ScriptedPolicy class derives from Policy class and it plays the given
+    script in a loop.
+
+    Every script step is a tuple with the action name and the target name or
+    the (Location, int) movement. Steps that can not be played are skipped.
+
+    Example:
+        >>> policy = ScriptedPolicy([('move', (Location.FRONT, 1)), ('weapon', 'ORC')])
+        >>> len(policy.script)
+        2
+    """
+
+    def __init__(self, script):
+        """ScriptedPolicy class initialization method.
+
+        Args:
+            script (list[tuple]) : list with (action name, target) steps.
+        """
+        self.script = script
+        self._index = 0
+        self._step = None
+
+    def reset(self, rand):
+        """Resets the policy at the start of every match, playing the script
+        from the first step.
+        """
+        super(ScriptedPolicy, self).reset(rand)
+        self._index = 0
+        self._step = None
+
+    def select_action(self, game, actor, actions):
+        """Selects the first action in the script that can be played.
+        """
+        for _ in range(len(self.script)):
+            self._step = self.script[self._index]
+            self._index = (self._index + 1) % len(self.script)
+            for action in actions:
+                if action.name == self._step[0]:
+                    return action
+        return None
+
+    def select_target(self, game, actor, action, targets):
+        """Selects the target with the name in the script step, or the first
+        target available.
+        """
+        for target in targets:
+            if target.name == self._step[1]:
+                return target
+        return targets[0]
+
+    def select_movement(self, game, actor, action, moves):
+        """Selects the movement in the script step, or the first movement
+        available.
+        """
+        return self._step[1] if self._step[1] in moves else moves[0]
+
+
+class Simulation(object):
+    """Simulation class runs headless matches, driving the game run cycle
+    with the given policies.
+
+    Player is driven by the player policy. Any other actor plays after the
+    player, it can not move and it only targets the player.
+
+    Every match uses its own random generator created from the match seed,
+    so results are reproducible.
+    """
+
+    def __init__(self, scenario, policy, enemy_policy=None, **kwargs):
+        """Simulation class initialization method.
+
+        Args:
+            scenario (Scenario) : scenario used to populate every match.
+            policy (Policy) : policy for the player.
+            enemy_policy (Policy) : policy for any other actor. Default is\
+                    RandomPolicy.
+
+        Keyword Args:
+            max_turns (int) : maximum number of turns for a match.\
+                    Default is 100.
+            max_step (int) : maximum number of cells the player can move.\
+                    Default is 1.
+        """
+        self.scenario = scenario
+        self.policy = policy
+        self.enemy_policy = enemy_policy if enemy_policy else RandomPolicy()
+        self.max_turns = kwargs.get('max_turns', 100)
+        self.max_step = kwargs.get('max_step', 1)
+
+    def legal_moves(self, game):
+        """Returns all valid movements for the player.
+
+        Args:
+            game (Game) : game instance.
+
+        Returns:
+            list[tuple] : list with (Location, int) movements.
+        """
+        return [(location, step)
+                for location in Location.user_moves()
+                for step in range(1, self.max_step + 1)
+                if game.is_valid_player_move(location, step)]
+
+    def legal_actions(self, game, actor):
+        """Returns all actions the given actor can play.
+
+        Args:
+            game (Game) : game instance.
+            actor (Actor) : actor playing the action.
+
+        Returns:
+            list[Action] : list with all actions that can be played.
+        """
+        actions = []
+        for action in actor.all_actions:
+            if action.requires_movement():
+                if actor is game.player and self.legal_moves(game):
+                    actions.append(action)
+            elif action.requires_target():
+                action.originator = actor
+                if self._targets(game, actor, action):
+                    actions.append(action)
+        return actions
+
+    def _targets(self, game, actor, action):
+        """Returns all targets for the action played by the given actor.
+        """
+        targets = game.target_choices(action)
+        if actor is not game.player:
+            targets = [x for x in targets if x is game.player]
+        return targets
+
+    def _play(self, game, actor, policy, rand):
+        """Plays the turn for the given actor.
+
+        Args:
+            game (Game) : game instance.
+            actor (Actor) : actor playing.
+            policy (Policy) : policy for the actor.
+            rand (random.Random) : random generator for the match.
+
+        Returns:
+            bool : True if an action was played, False else.
+        """
+        action = policy.select_action(game, actor, self.legal_actions(game, actor))
+        if action is None:
+            return False
+        action.originator = actor
+        game.run_select_action(action)
+        if action.requires_target():
+            targets = self._targets(game, actor, action)
+            game.run_select_target(policy.select_target(game, actor, action, targets))
+        if action.requires_movement():
+            location, step = policy.select_movement(game, actor, action, self.legal_moves(game))
+            game.run_select_movement(location, step)
+            game.run_scroll(self.scenario.new_row(game, rand))
+        return True
+
+    def _outcome(self, game):
+        """Returns the match outcome, or None if the match is not over.
+        """
+        if game.player not in game.actors or not game.player.is_alive():
+            return Outcome.LOSE
+        if not game.other_actors():
+            return Outcome.WIN
+        return None
+
+    def run_match(self, seed, **kwargs):
+        """Runs a full match.
+
+        Args:
+            seed (int) : seed for the match random generator.
+
+        Keyword Args:
+            Any scenario parameter for the match.
+
+        Returns:
+            MatchResult : match results.
+        """
+        rand = random.Random(seed)
+        self.policy.reset(rand)
+        self.enemy_policy.reset(rand)
+        game = self.scenario.new_game()
+        self.scenario.setup(game, rand, **kwargs)
+        enemies = len(game.other_actors())
+        game.run_init()
+        turns = 0
+        actions = 0
+        outcome = self._outcome(game)
+        while outcome is None and turns < self.max_turns:
+            turns += 1
+            actions += self._play(game, game.player, self.policy, rand)
+            for actor in game.other_actors():
+                if self._outcome(game) is not None:
+                    break
+                if actor in game.actors:
+                    actions += self._play(game, actor, self.enemy_policy, rand)
+            outcome = self._outcome(game)
+        try:
+            player_life = game.player.get_life()
+        except (KeyError, NotImplementedError):
+            player_life = None
+        return MatchResult(seed, outcome if outcome else Outcome.DRAW, turns,
+                           actions, player_life, enemies,
+                           enemies - len(game.other_actors()))
+
+    def run(self, seeds):
+        """Runs a match for every given seed.
+
+        Args:
+            seeds (list[int]) : list of seeds, one for every match.
+
+        Returns:
+            generator : MatchResult for every match.
+        """
+        for seed in seeds:
+            yield self.run_match(seed)
+
+
+def aggregate(results):
+    """Aggregates the results for multiple matches.
+
+    Args:
+        results (list[MatchResult]) : match results.
+
+    Returns:
+        dict : dictionary with aggregated statistics.
+
+    Example:
+        >>> stats = aggregate([MatchResult(1, Outcome.WIN, 10, 12, 5, 3, 3),
+        ...                    MatchResult(2, Outcome.LOSE, 4, 9, 0, 3, 1)])
+        >>> stats['matches'], stats['win_rate'], stats['turns'], stats['kills']
+        (2, 0.5, 7.0, 2.0)
+    """
+    stats = {'matches': 0, 'wins': 0, 'losses': 0, 'draws': 0}
+    totals = {'turns': 0, 'actions': 0, 'player_life': 0, 'kills': 0}
+    for result in results:
+        stats['matches'] += 1
+        if result.outcome == Outcome.WIN:
+            stats['wins'] += 1
+        elif result.outcome == Outcome.LOSE:
+            stats['losses'] += 1
+        else:
+            stats['draws'] += 1
+        for key in totals:
+            totals[key] += getattr(result, key) or 0
+    matches = stats['matches']
+    stats['win_rate'] = stats['wins'] / matches if matches else 0.0
+    for key, total in totals.items():
+        stats[key] = total / matches if matches else 0.0
+    return stats
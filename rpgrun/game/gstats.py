@@ -0,0 +1,382 @@
+from rpgrun.game.attr import Attr, Stacking
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BASE = 0
+DELTA = 1
+BUFF = 2
+CUR = 3
+
+
+def _plain(value):
+    """Returns integral float values from the table as integers, as they are
+    kept by plain attributes.
+    """
+    return int(value) if type(value) is float and value.is_integer() else value
+
+
+class StatAttr(Attr):
+    """StatAttr class derives from Attr class and it is a view over one
+    row for an attribute column in a StatsTable.
+
+    Attr instances become StatAttr instances when the actor they belong to is
+    added to a StatsTable, and back to Attr instances when the actor is
+    removed, so any reference to them is still valid.
+    """
+
+    def _get(self, field):
+        """Gets the table value for the given field.
+        """
+        return _plain(self._table._data[self._key][field, self._row].item())
+
+    def _set(self, field, value):
+        """Sets the table value for the given field.
+        """
+        self._table._data[self._key][field, self._row] = value
+
+    base = property(lambda self: self._get(BASE),
+                    lambda self, value: self._set(BASE, value),
+                    doc='Gets and sets base value in the table.')
+
+    delta = property(lambda self: self._get(DELTA),
+                     lambda self, value: self._set(DELTA, value),
+                     doc='Gets and sets delta value in the table.')
+
+    _Attr__now = property(lambda self: self._get(CUR),
+                          lambda self, value: self._set(CUR, value),
+                          doc='Gets and sets current value in the table.')
+
+    @property
+    def _now(self):
+        """Gets now value from the table.
+        """
+        base, _, buff, cur = self._table._data[self._key][:, self._row].tolist()
+        if self._table._mul[self._key]:
+            return _plain(base * buff + cur)
+        return _plain(base + buff + cur)
+
+    def _update_now(self):
+        """Stores the aggregated buff value in the table.
+        """
+        self._set(BUFF, self._buffs.total)
+
+
+class StatsTable(object):
+    """StatsTable class keeps attributes for many actors in columns, with one
+    numpy array per attribute name and one row per actor.
+
+    Attribute instances for every actor added to the table are views over
+    the actor row, so bulk operations on the table, like levelling up or
+    damaging many actors, run as single vectorized operations, and they are
+    visible through the actor attributes.
+
+    Values are stored as floats by default, so multiplicative buffs are not
+    truncated, and integral values are read through attributes as integers.
+
+    Example:
+        >>> from rpgrun.game.actor import Actor
+        >>> table = StatsTable()
+        >>> actors = [Actor(x, 0, 'orc') for x in range(3)]
+        >>> for actor in actors:
+        ...     actor.attrs.setup_attrs_from_list([('hp', 10, 2), ('str', 3, 1)])
+        ...     table.add(actor)
+        0
+        1
+        2
+        >>> table.dec('hp', 4, actors[:2])
+        >>> [x.HP for x in actors]
+        [6, 6, 10]
+        >>> table.level_up()
+        >>> [x.attrs['hp'] for x in actors]
+        [hp: 8/12, hp: 8/12, hp: 12/12]
+        >>> from rpgrun.game.attr import Attr, Stacking
+        >>> for actor in actors:
+        ...     _ = actor.add_attr(Attr('rage', Stacking.MUL)).base = 3
+        >>> actors[0].attrs['rage'].add_buff('fury', 1.5)
+        True
+        >>> table.now('rage').tolist(), actors[0].RAGE
+        ([4.5, 3.0, 3.0], 4.5)
+    """
+
+    def __init__(self, capacity=64, dtype=None):
+        """StatsTable class initialization method.
+
+        Args:
+            capacity (int) : initial number of rows.
+            dtype (numpy.dtype) : type for all values. Default is float64.
+
+        Raises:
+            NotImplementedError : when numpy is not available.
+        """
+        if numpy is None:
+            raise NotImplementedError
+        self.capacity = max(capacity, 1)
+        self.dtype = dtype if dtype is not None else numpy.float64
+        self._data = {}
+        self._mul = {}
+        self._active = numpy.zeros(self.capacity, dtype=bool)
+        self._actors = {}
+        self._free = []
+        self._size = 0
+
+    def _grow(self):
+        """Doubles the number of rows for all columns.
+        """
+        self.capacity *= 2
+        for key, data in self._data.items():
+            new_data = numpy.zeros((4, self.capacity), dtype=self.dtype)
+            new_data[BUFF, :] = 1 if self._mul[key] else 0
+            new_data[:, :data.shape[1]] = data
+            self._data[key] = new_data
+        active = numpy.zeros(self.capacity, dtype=bool)
+        active[:len(self._active)] = self._active
+        self._active = active
+
+    def _column(self, key, stacking):
+        """Returns the column for the given attribute key, creating it if it
+        does not exist.
+
+        Raises:
+            NotImplementedError : when the column uses a different stacking.
+        """
+        mul = stacking is Stacking.MUL
+        data = self._data.get(key)
+        if data is None:
+            data = numpy.zeros((4, self.capacity), dtype=self.dtype)
+            data[BUFF, :] = 1 if mul else 0
+            self._data[key] = data
+            self._mul[key] = mul
+        elif self._mul[key] != mul:
+            raise NotImplementedError
+        return data
+
+    def _new_row(self):
+        """Allocates a new row.
+        """
+        if self._free:
+            return self._free.pop()
+        if self._size == self.capacity:
+            self._grow()
+        self._size += 1
+        return self._size - 1
+
+    def bind(self, row, key, attr):
+        """Stores the given attribute in the given row and turns the
+        attribute into a view over the table.
+
+        Args:
+            row (int) : actor row.
+            key (str) : attribute key.
+            attr (Attr) : attribute to store.
+
+        Returns:
+            StatAttr : attribute view.
+        """
+        if isinstance(attr, StatAttr):
+            attr = self.unbind(attr)
+        data = self._column(key, attr.stacking)
+        data[BASE, row] = attr.base
+        data[DELTA, row] = attr.delta
+        data[BUFF, row] = attr.buffs.total
+        data[CUR, row] = attr._Attr__now
+        attr._table = self
+        attr._key = key
+        attr._row = row
+        attr.__class__ = StatAttr
+        attr._buffs.on_change = attr._update_now
+        return attr
+
+    def unbind(self, attr):
+        """Turns the given attribute view back into a plain attribute with the
+        values stored in the table.
+
+        Args:
+            attr (StatAttr) : attribute view.
+
+        Returns:
+            Attr : plain attribute.
+        """
+        base, delta, now = attr.base, attr.delta, attr._Attr__now
+        attr.__class__ = Attr
+        attr._buffs.on_change = attr._update_now
+        del attr._table, attr._key, attr._row
+        attr._base = base
+        attr.delta = delta
+        attr._Attr__now = now
+        attr._update_now()
+        return attr
+
+    def add(self, actor):
+        """Adds the given actor to the table.
+
+        Any attribute added to the actor later is stored in the table too.
+
+        Args:
+            actor (BObject) : actor to add.
+
+        Returns:
+            int : actor row.
+        """
+        attrs = actor.attrs
+        if attrs.stats is not None:
+            return attrs.row
+        row = self._new_row()
+        self._active[row] = True
+        self._actors[row] = actor
+        for key, attr in list(attrs.items()):
+            self.bind(row, key, attr)
+        attrs.stats = self
+        attrs.row = row
+        return row
+
+    def remove(self, actor):
+        """Removes the given actor from the table, so its attributes keep
+        their values without the table.
+
+        Args:
+            actor (BObject) : actor to remove.
+
+        Returns:
+            bool : True if actor was removed, False if it was not in the table.
+
+        Example:
+            >>> from rpgrun.game.actor import Actor
+            >>> table = StatsTable()
+            >>> actor = Actor(0, 0, 'orc')
+            >>> actor.attrs.setup_attrs_from_list([('hp', 10, 2)])
+            >>> table.add(actor)
+            0
+            >>> table.dec('hp', 3)
+            >>> table.remove(actor), table.remove(actor)
+            (True, False)
+            >>> actor.attrs['hp'], type(actor.attrs['hp']).__name__, len(table)
+            (hp: 7/10, 'Attr', 0)
+        """
+        attrs = actor.attrs
+        if attrs.stats is not self:
+            return False
+        row = attrs.row
+        for attr in list(attrs):
+            self.unbind(attr)
+        for data in self._data.values():
+            data[:, row] = 0
+        for key, mul in self._mul.items():
+            self._data[key][BUFF, row] = 1 if mul else 0
+        self._active[row] = False
+        del self._actors[row]
+        self._free.append(row)
+        attrs.stats = None
+        attrs.row = None
+        return True
+
+    def rows(self, actors=None):
+        """Returns the rows for the given actors.
+
+        Args:
+            actors (list) : actors in the table. Default is all actors.
+
+        Returns:
+            numpy.ndarray : array with actor rows.
+
+        Raises:
+            KeyError : when any actor is not in the table.
+
+        Example:
+            >>> from rpgrun.game.actor import Actor
+            >>> table = StatsTable()
+            >>> try:
+            ...     table.rows([Actor(0, 0, 'orc')])
+            ... except KeyError:
+            ...     print('KeyError')
+            KeyError
+        """
+        if actors is None:
+            return numpy.flatnonzero(self._active)
+        rows = []
+        for actor in actors:
+            if actor.attrs.stats is not self:
+                raise KeyError(actor.name)
+            rows.append(actor.attrs.row)
+        return numpy.array(rows, dtype=numpy.intp)
+
+    def now(self, key, rows=None):
+        """Returns now values for the given attribute.
+
+        Args:
+            key (str) : attribute name.
+            rows (list) : rows to return. Default is all rows, in the same\
+                    order as returned by rows().
+
+        Returns:
+            numpy.ndarray : now values.
+        """
+        data = self._data[key.upper()]
+        if rows is None:
+            rows = self.rows()
+        if self._mul[key.upper()]:
+            return data[BASE, rows] * data[BUFF, rows] + data[CUR, rows]
+        return data[BASE, rows] + data[BUFF, rows] + data[CUR, rows]
+
+    def inc(self, key, values, actors=None):
+        """Increments current value for the given attribute in all given
+        actors.
+
+        Args:
+            key (str) : attribute name.
+            values (object) : value or array with one value per actor.
+            actors (list) : actors to update. Default is all actors.
+        """
+        self._data[key.upper()][CUR, self.rows(actors)] += values
+
+    def dec(self, key, values, actors=None):
+        """Decrements current value for the given attribute in all given
+        actors.
+
+        Args:
+            key (str) : attribute name.
+            values (object) : value or array with one value per actor.
+            actors (list) : actors to update. Default is all actors.
+        """
+        self._data[key.upper()][CUR, self.rows(actors)] -= values
+
+    def level_up(self, level_val=1, actors=None):
+        """Levels up all attributes for all given actors a given number of
+        times.
+
+        Args:
+            level_val (int) : number of levels.
+            actors (list) : actors to level up. Default is all actors.
+        """
+        rows = self.rows(actors)
+        for data in self._data.values():
+            data[BASE, rows] += data[DELTA, rows] * level_val
+
+    def actors(self, rows=None):
+        """Returns actors for the given rows.
+
+        Args:
+            rows (list) : actor rows. Default is all rows.
+
+        Returns:
+            list : actors in the table.
+        """
+        if rows is None:
+            rows = self.rows()
+        return [self._actors[x] for x in rows]
+
+    def __len__(self):
+        """Returns the number of actors in the table.
+        """
+        return len(self._actors)
+
+    def __repr__(self):
+        """String representation for the StatsTable instance.
+
+        Example:
+            >>> StatsTable(8)
+            StatsTable(0/8): []
+        """
+        return 'StatsTable({0}/{1}): {2}'.format(len(self), self.capacity, list(self._data))
@@ -0,0 +1,330 @@
+import csv
+import json
+import struct
+from rpgrun.game.attr import Attr
+from rpgrun.game.gcatalog import Catalog
+
+MAGIC = b'RGAT'
+"""Header for attribute templates in binary format."""
+
+_HEADER = struct.Struct('<4sH')
+_COUNT = struct.Struct('<H')
+_ENTRY = struct.Struct('<iiH')
+_VALUE = struct.Struct('<i')
+_NAME = struct.Struct('<B')
+
+
+def _pack_name(name):
+    """Packs a string as length-prefixed UTF-8 bytes.
+    """
+    data = name.encode('utf-8')
+    return _NAME.pack(len(data)) + data
+
+
+def _unpack_name(data, offset):
+    """Unpacks a length-prefixed UTF-8 string.
+
+    Returns:
+        tuple : string and offset after the string.
+    """
+    size, = _NAME.unpack_from(data, offset)
+    offset += _NAME.size
+    return data[offset:offset + size].decode('utf-8'), offset + size
+
+
+def _parse_buffs(text):
+    """Parses buffs from a CSV field with "name=value" pairs separated by
+    semicolons.
+
+    Example:
+        >>> _parse_buffs('one=2;two=3')
+        {'one': 2, 'two': 3}
+        >>> _parse_buffs('')
+    """
+    pairs = [x.split('=') for x in text.split(';') if x.strip()]
+    return dict([(k.strip(), int(v)) for k, v in pairs]) if pairs else None
+
+
+class AttrTemplate(object):
+    """AttrTemplate class contains attribute values parsed once, so they can
+    be stamped onto many objects without parsing them again.
+
+    Every entry is a (name, base, delta, buffs) tuple.
+    """
+
+    def __init__(self, name, entries):
+        """AttrTemplate class initialization method.
+
+        Args:
+            name (str) : template name.
+            entries (list) : list of (name, base, delta, buffs) tuples.
+
+        Example:
+            >>> tmpl = AttrTemplate('orc', [('hp', 10, 2, None), ('str', 5, 1, {'one': 1})])
+            >>> tmpl
+            orc: hp, str
+        """
+        self.name = name
+        self.entries = tuple([(n, b, d, dict(f) if f else None) for n, b, d, f in entries])
+
+    @classmethod
+    def from_data(cls, name, lista):
+        """Creates a template from a list with one dictionary for every
+        attribute, like the one decoded from a JSON variable.
+
+        Args:
+            name (str) : template name.
+            lista (list) : list with {name: {base, delta, buffs}} entries.
+
+        Returns:
+            AttrTemplate : new template.
+        """
+        entries = []
+        for entry in lista:
+            for k, v in entry.items():
+                entries.append((k,
+                                int(v['base']) if v['base'] != 'None' else 0,
+                                int(v['delta']) if v['delta'] != 'None' else 0,
+                                v['buffs'] if isinstance(v['buffs'], dict) else None))
+        return cls(name, entries)
+
+    @classmethod
+    def from_json(cls, name, json_data):
+        """Creates a template from a JSON variable, using the format for
+        Attributes.setup_attrs_from_json.
+
+        Example:
+            >>> data = '[{"hp": {"base": 10, "delta": 2, "buffs": "None"}}]'
+            >>> AttrTemplate.from_json('orc', data).entries
+            (('hp', 10, 2, None),)
+        """
+        return cls.from_data(name, json.loads(json_data))
+
+    @classmethod
+    def from_list(cls, name, lista):
+        """Creates a template from a list of tuples, using the format for
+        Attr.create_attr.
+
+        Example:
+            >>> AttrTemplate.from_list('boss', [("hp", 100, 10), ("mp", 10, 1, {'one': 2})]).entries
+            (('hp', 100, 10, None), ('mp', 10, 1, {'one': 2}))
+        """
+        return cls(name, [(x[0], x[1], x[2], x[3] if len(x) == 4 else None) for x in lista])
+
+    def stamp(self, attrs):
+        """Adds all attributes in the template to the given attributes.
+
+        Args:
+            attrs (Attributes) : attributes to setup.
+
+        Returns:
+            Attributes : attributes instance.
+
+        Example:
+            >>> from rpgrun.game.attr import Attributes
+            >>> tmpl = AttrTemplate('orc', [('hp', 10, 2, None), ('str', 5, 1, {'one': 1})])
+            >>> tmpl.stamp(Attributes())
+            hp: 10/10
+            str: 6/5
+        """
+        for name, base, delta, buffs in self.entries:
+            attrs.add_attr(Attr(name).setup_attr(base, delta, buffs))
+        return attrs
+
+    def to_bytes(self):
+        """Packs the template in binary format.
+
+        Returns:
+            bytes : packed template.
+        """
+        data = [_pack_name(self.name), _COUNT.pack(len(self.entries))]
+        for name, base, delta, buffs in self.entries:
+            buffs = buffs if buffs else {}
+            data.append(_pack_name(name))
+            data.append(_ENTRY.pack(base, delta, len(buffs)))
+            for k, v in buffs.items():
+                data.append(_pack_name(k))
+                data.append(_VALUE.pack(v))
+        return b''.join(data)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        """Unpacks a template packed in binary format.
+
+        Args:
+            data (bytes) : packed data.
+            offset (int) : position for the template in the packed data.
+
+        Returns:
+            tuple : template and offset after the template.
+
+        Example:
+            >>> tmpl = AttrTemplate('orc', [('hp', 10, 2, None), ('str', 5, 1, {'one': 1})])
+            >>> other, _ = AttrTemplate.from_bytes(tmpl.to_bytes())
+            >>> other.name, other.entries
+            ('orc', (('hp', 10, 2, None), ('str', 5, 1, {'one': 1})))
+        """
+        name, offset = _unpack_name(data, offset)
+        count, = _COUNT.unpack_from(data, offset)
+        offset += _COUNT.size
+        entries = []
+        for _ in range(count):
+            attr_name, offset = _unpack_name(data, offset)
+            base, delta, nbuffs = _ENTRY.unpack_from(data, offset)
+            offset += _ENTRY.size
+            buffs = {}
+            for _ in range(nbuffs):
+                buff_name, offset = _unpack_name(data, offset)
+                buffs[buff_name], = _VALUE.unpack_from(data, offset)
+                offset += _VALUE.size
+            entries.append((attr_name, base, delta, buffs if buffs else None))
+        return cls(name, entries), offset
+
+    def __repr__(self):
+        """String representation for the AttrTemplate instance.
+        """
+        return '{0}: {1}'.format(self.name, ', '.join([x[0] for x in self.entries]))
+
+
+class TemplateCatalog(Catalog):
+    """TemplateCatalog class derives from :class:`gcatalog.Catalog` and it
+    contains attribute templates by name.
+
+    Catalogs are loaded from JSON, CSV or binary files, which are parsed only
+    once.
+
+    JSON files contain a dictionary with the template name and the list of
+    attributes, using the format for Attributes.setup_attrs_from_json.
+
+    CSV files contain a row for every attribute, with template, attr, base,
+    delta and buffs columns. Buffs are "name=value" pairs separated by
+    semicolons.
+    """
+
+    def __init__(self, **kwargs):
+        """TemplateCatalog class initialization method.
+
+        Example:
+            >>> from rpgrun.game.attr import Attributes
+            >>> catalog = TemplateCatalog()
+            >>> catalog.load_json('{"orc": [{"hp": {"base": 10, "delta": 2, "buffs": "None"}}]}')
+            >>> catalog.stamp('orc', Attributes())
+            hp: 10/10
+        """
+        super(TemplateCatalog, self).__init__(AttrTemplate, **kwargs)
+
+    def load_data(self, data):
+        """Loads templates from a dictionary, like the one decoded from a JSON
+        variable.
+
+        Args:
+            data (dict) : dictionary with template names and attribute lists.
+        """
+        for name, lista in data.items():
+            self.append(AttrTemplate.from_data(name, lista))
+
+    def load_json(self, json_data):
+        """Loads templates from a JSON variable.
+
+        Args:
+            json_data (str) : JSON variable.
+        """
+        self.load_data(json.loads(json_data))
+
+    def load_csv(self, lines):
+        """Loads templates from CSV lines.
+
+        Args:
+            lines (list) : CSV lines, like an open file, with a header row.
+
+        Example:
+            >>> catalog = TemplateCatalog()
+            >>> catalog.load_csv(['template,attr,base,delta,buffs',
+            ...                   'orc,hp,10,2,',
+            ...                   'orc,str,5,1,one=1',
+            ...                   'mage,mp,10,1,'])
+            >>> catalog['orc'], catalog['mage']
+            (orc: hp, str, mage: mp)
+            >>> catalog['orc'].entries[1]
+            ('str', 5, 1, {'one': 1})
+        """
+        templates = {}
+        for row in csv.DictReader(lines):
+            entry = (row['attr'], int(row['base']), int(row['delta']), _parse_buffs(row.get('buffs') or ''))
+            templates.setdefault(row['template'], []).append(entry)
+        for name, entries in templates.items():
+            self.append(AttrTemplate(name, entries))
+
+    def to_bytes(self):
+        """Packs all templates in binary format.
+
+        Returns:
+            bytes : packed templates.
+        """
+        templates = [x for x in self]
+        data = [_HEADER.pack(MAGIC, len(templates))]
+        data.extend([x.to_bytes() for x in templates])
+        return b''.join(data)
+
+    def load_bytes(self, data):
+        """Loads templates packed in binary format.
+
+        Args:
+            data (bytes) : packed templates.
+
+        Raises:
+            ValueError : when data is not in binary format.
+
+        Example:
+            >>> catalog = TemplateCatalog()
+            >>> catalog.load_csv(['template,attr,base,delta,buffs', 'orc,hp,10,2,a=1;b=2'])
+            >>> other = TemplateCatalog()
+            >>> other.load_bytes(catalog.to_bytes())
+            >>> other['orc'].entries
+            (('hp', 10, 2, {'a': 1, 'b': 2}),)
+        """
+        magic, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError
+        offset = _HEADER.size
+        for _ in range(count):
+            template, offset = AttrTemplate.from_bytes(data, offset)
+            self.append(template)
+
+    def load_file(self, filename):
+        """Loads templates from a file. File format is selected by the file
+        extension: ".json", ".csv" or any other for binary format.
+
+        Args:
+            filename (str) : file to load.
+        """
+        if filename.endswith('.json'):
+            with open(filename, 'r') as file:
+                self.load_data(json.load(file))
+        elif filename.endswith('.csv'):
+            with open(filename, 'r', newline='') as file:
+                self.load_csv(file)
+        else:
+            with open(filename, 'rb') as file:
+                self.load_bytes(file.read())
+
+    def save_file(self, filename):
+        """Saves all templates in binary format.
+
+        Args:
+            filename (str) : file to save.
+        """
+        with open(filename, 'wb') as file:
+            file.write(self.to_bytes())
+
+    def stamp(self, name, attrs):
+        """Adds all attributes in the given template to the given attributes.
+
+        Args:
+            name (str) : template name.
+            attrs (Attributes) : attributes to setup.
+
+        Returns:
+            Attributes : attributes instance.
+        """
+        return self[name].stamp(attrs)
@@ -0,0 +1,9 @@
+#!/bin/bash
+
+source ./setup.sh
+
+export PYTHONPATH=${CURRENT_DIRECTORY}:${RPG_RUN_PATH}
+
+SIM_PLAY_APP=sim.py
+
+python ${CURRENT_DIRECTORY}/play/sim/${SIM_PLAY_APP} "$@"